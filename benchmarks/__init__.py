@@ -0,0 +1 @@
+"""Offline replay tooling and benchmarks for the Wait for Wolt polling pipeline."""
@@ -0,0 +1,283 @@
+"""Record and replay Wolt HTTP exchanges below ``WoltApi._perform_request``.
+
+A cassette is a compact JSON file holding every exchange the client performed:
+method, URL, redacted form data, status, the cache and rate-limit headers the
+client reads, the JSON body, and its timing. ``RecordingSession`` wraps a real
+``aiohttp.ClientSession``; ``ReplaySession`` stands in for one offline.
+
+Credentials are redacted while recording. Order and venue data are not: treat a
+cassette recorded from a real account as private and never commit it. Synthetic
+cassettes live in ``tests/fixtures/cassettes/``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import aiohttp
+
+CASSETTE_VERSION = 1
+CASSETTE_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "cassettes"
+REDACTED = "**REDACTED**"
+SECRET_KEYS = frozenset(
+    {
+        "access_token",
+        "accessToken",
+        "refresh_token",
+        "refreshToken",
+        "id_token",
+        "idToken",
+    }
+)
+# Only headers that change client behavior are kept.
+RECORDED_HEADERS = ("ETag", "Last-Modified", "Retry-After")
+
+
+class CassetteMissError(LookupError):
+    """Replay received a request that the cassette has no exchange left for."""
+
+
+def redact(value: Any) -> Any:
+    """Return ``value`` with every credential-looking field replaced."""
+    if isinstance(value, Mapping):
+        return {
+            key: REDACTED if key in SECRET_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+class Cassette:
+    """An ordered list of recorded exchanges."""
+
+    def __init__(self, interactions: list[dict[str, Any]] | None = None) -> None:
+        self.interactions = interactions or []
+
+    @classmethod
+    def load(cls, path: Path | str) -> Cassette:
+        """Read a cassette, resolving bare names inside the fixtures directory."""
+        path = Path(path)
+        if not path.is_absolute() and not path.exists():
+            path = CASSETTE_DIR / path
+        data = json.loads(path.read_text())
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')}")
+        return cls(data["interactions"])
+
+    def save(self, path: Path | str) -> None:
+        """Write the cassette with one exchange per line."""
+        lines = ",\n".join(
+            json.dumps(interaction, separators=(",", ":"), sort_keys=True)
+            for interaction in self.interactions
+        )
+        Path(path).write_text(
+            f'{{"version":{CASSETTE_VERSION},"interactions":[\n{lines}\n]}}\n'
+        )
+
+    @property
+    def duration(self) -> float:
+        """Return the recorded wall-clock span in seconds."""
+        if not self.interactions:
+            return 0.0
+        last = self.interactions[-1]
+        return last["t"] + last.get("elapsed", 0.0)
+
+
+class _RecordingContext:
+    """Enter the real request, buffer its body, and append the exchange."""
+
+    def __init__(
+        self,
+        recorder: RecordingSession,
+        context: Any,
+        interaction: dict[str, Any],
+    ) -> None:
+        self._recorder = recorder
+        self._context = context
+        self._interaction = interaction
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        try:
+            response = await self._context.__aenter__()
+            body = await response.read()
+        except TimeoutError, asyncio.CancelledError:
+            # WoltApi's own timeout cancels the request inside this context, so
+            # it arrives here as a cancellation and becomes TimeoutError outside.
+            self._finish(error="timeout")
+            raise
+        except aiohttp.ClientError:
+            self._finish(error="connection")
+            raise
+        self._interaction["status"] = response.status
+        headers = {
+            name: response.headers[name]
+            for name in RECORDED_HEADERS
+            if name in response.headers
+        }
+        if headers:
+            self._interaction["headers"] = headers
+        if body:
+            try:
+                self._interaction["json"] = redact(json.loads(body))
+            except ValueError:
+                self._interaction["text"] = body.decode(errors="replace")
+        self._finish()
+        return response
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        return await self._context.__aexit__(exc_type, exc, traceback)
+
+    def _finish(self, *, error: str | None = None) -> None:
+        if error is not None:
+            self._interaction["error"] = error
+        self._interaction["elapsed"] = round(
+            self._recorder.clock() - self._recorder.started - self._interaction["t"],
+            4,
+        )
+        self._recorder.cassette.interactions.append(self._interaction)
+
+
+class RecordingSession:
+    """Session wrapper that records every exchange made through it."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        self._session = session
+        self.cassette = Cassette()
+        self.clock = time.monotonic
+        self.started = self.clock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: dict[str, str] | None = None,
+    ) -> _RecordingContext:
+        interaction: dict[str, Any] = {
+            "t": round(self.clock() - self.started, 4),
+            "method": method,
+            "url": url,
+        }
+        if data is not None:
+            interaction["data"] = redact(data)
+        context = self._session.request(method, url, headers=headers, data=data)
+        return _RecordingContext(self, context, interaction)
+
+    def head(self, url: str, *, headers: dict[str, str]) -> _RecordingContext:
+        return self.request("HEAD", url, headers=headers)
+
+    def post(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: dict[str, str],
+    ) -> _RecordingContext:
+        return self.request("POST", url, headers=headers, data=data)
+
+    def save(self, path: Path | str) -> None:
+        """Write everything recorded so far."""
+        self.cassette.save(path)
+
+
+class ReplayResponse:
+    """Response surface used by ``WoltApi``, rebuilt from one exchange."""
+
+    def __init__(self, interaction: dict[str, Any]) -> None:
+        self.status: int = interaction["status"]
+        self.headers: dict[str, str] = interaction.get("headers", {})
+        if "json" in interaction:
+            self._body = json.dumps(interaction["json"]).encode()
+        else:
+            self._body = interaction.get("text", "").encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def json(self) -> Any:
+        return json.loads(self._body)
+
+
+class _ReplayContext:
+    def __init__(self, replay: ReplaySession, interaction: dict[str, Any]) -> None:
+        self._replay = replay
+        self._interaction = interaction
+
+    async def __aenter__(self) -> ReplayResponse:
+        if self._replay.realtime:
+            await asyncio.sleep(self._interaction.get("elapsed", 0.0))
+        self._replay.position = self._interaction["t"]
+        error = self._interaction.get("error")
+        if error == "timeout":
+            raise TimeoutError
+        if error is not None:
+            raise aiohttp.ClientConnectionError(error)
+        return ReplayResponse(self._interaction)
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+class ReplaySession:
+    """Serve recorded exchanges in order for each method and URL.
+
+    With ``realtime`` the recorded response latency is reproduced; otherwise
+    exchanges are served as fast as possible. ``position`` is the recorded
+    offset of the last served exchange, usable as a simulated clock.
+    """
+
+    def __init__(self, cassette: Cassette, *, realtime: bool = False) -> None:
+        self.realtime = realtime
+        self.position = 0.0
+        self._queues: defaultdict[tuple[str, str], deque[dict[str, Any]]] = defaultdict(
+            deque
+        )
+        for interaction in cassette.interactions:
+            self._queues[(interaction["method"], interaction["url"])].append(
+                interaction
+            )
+
+    def remaining(self, method: str, url: str) -> int:
+        """Return how many exchanges are left for one method and URL."""
+        return len(self._queues.get((method, url), ()))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: dict[str, str] | None = None,
+    ) -> _ReplayContext:
+        del headers, data
+        queue = self._queues.get((method, url))
+        if not queue:
+            raise CassetteMissError(f"No recorded exchange left for {method} {url}")
+        return _ReplayContext(self, queue.popleft())
+
+    def head(self, url: str, *, headers: dict[str, str]) -> _ReplayContext:
+        return self.request("HEAD", url, headers=headers)
+
+    def post(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: dict[str, str],
+    ) -> _ReplayContext:
+        return self.request("POST", url, headers=headers, data=data)
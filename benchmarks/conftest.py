@@ -0,0 +1,13 @@
+"""Shared fixtures for the offline Wait for Wolt benchmarks."""
+
+from collections.abc import Generator
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,
+) -> Generator[None]:
+    """Enable loading custom integrations in Home Assistant benchmarks."""
+    yield
@@ -0,0 +1,310 @@
+"""A local stand-in for the Wolt endpoints used by the integration.
+
+``FakeWoltServer`` serves the orders page, purchase tracking, venue dynamic and
+token refresh endpoints on one loopback port. Point ``WoltApi(base_url=...)`` at
+``server.url`` to exercise timing, token rotation and 429 handling for many
+simulated accounts. Every value it returns is synthetic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from itertools import count
+from typing import Any
+
+from aiohttp import web
+
+
+@dataclass(frozen=True, slots=True)
+class Phase:
+    """One step of a scripted order lifecycle."""
+
+    status: str
+    seconds: float
+    telemetry: str = "IN_PROGRESS"
+
+
+# pending -> preparing -> on_the_way -> delivered, using Wolt's display texts.
+DEFAULT_LIFECYCLE = (
+    Phase("Order received", 60),
+    Phase("Preparing your order", 600),
+    Phase("On the way", 600),
+    Phase("Delivered", 0, telemetry="DELIVERED"),
+)
+
+
+@dataclass(slots=True)
+class FakeOrder:
+    """A scripted purchase that advances through the lifecycle over time."""
+
+    purchase_id: str
+    started: float
+    eta: datetime
+
+    def phase(self, lifecycle: Sequence[Phase], now: float) -> Phase:
+        """Return the lifecycle phase reached ``now``."""
+        elapsed = now - self.started
+        for phase in lifecycle[:-1]:
+            if elapsed < phase.seconds:
+                return phase
+            elapsed -= phase.seconds
+        return lifecycle[-1]
+
+
+@dataclass(slots=True)
+class FakeAccount:
+    """Credentials and orders of one simulated Wolt account."""
+
+    number: int
+    access_token: str = ""
+    refresh_token: str = ""
+    orders: list[FakeOrder] = field(default_factory=list)
+
+
+def _fake_jwt(subject: str, token_id: int, expires_at: float) -> str:
+    """Return an unsigned JWT that ``token_expiry`` can decode."""
+
+    def encode(value: dict[str, Any]) -> str:
+        raw = json.dumps(value, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    claims = encode({"sub": subject, "jti": token_id, "exp": int(expires_at)})
+    return f"{header}.{claims}."
+
+
+class FakeWoltServer:
+    """Scripted Wolt endpoints with token expiry, 429 injection and latency.
+
+    Access tokens expire after ``token_lifetime`` seconds and refresh tokens are
+    single-use, like Wolt's rotating web flow. A fraction ``throttle_rate`` of
+    authenticated requests receives 429 with ``Retry-After``. Each response is
+    delayed by ``latency`` plus up to ``jitter`` seconds. With ``jwt_tokens``
+    disabled, access tokens are opaque and only a 401 reveals their expiry.
+    """
+
+    def __init__(
+        self,
+        *,
+        lifecycle: Sequence[Phase] = DEFAULT_LIFECYCLE,
+        token_lifetime: float = 1800,
+        throttle_rate: float = 0.0,
+        retry_after: float = 30,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        jwt_tokens: bool = True,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.lifecycle = tuple(lifecycle)
+        self.token_lifetime = token_lifetime
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.latency = latency
+        self.jitter = jitter
+        self.jwt_tokens = jwt_tokens
+        self.stats: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._ids = count(1)
+        self._access: dict[str, tuple[FakeAccount, float]] = {}
+        self._refresh: dict[str, FakeAccount] = {}
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+        app = web.Application()
+        app.router.add_get("/order-xp/web/v1/pages/orders", self._orders)
+        app.router.add_get("/v2/order_details/purchase_tracking", self._tracking)
+        app.router.add_get("/order-xp/web/v1/venue/slug/{slug}/dynamic/", self._venue)
+        app.router.add_post("/v1/wauth2/access_token", self._token)
+        app.router.add_route("HEAD", "/", self._root)
+        app.middlewares.append(self._middleware)
+        self._app = app
+
+    async def __aenter__(self) -> FakeWoltServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Listen on a free loopback port and set ``url``."""
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def close(self) -> None:
+        """Stop listening and close open connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def add_account(self, orders: int = 1) -> FakeAccount:
+        """Create an account whose ``orders`` purchases start now."""
+        number = next(self._ids)
+        account = FakeAccount(number)
+        self._issue_tokens(account)
+        now = self._clock()
+        eta = datetime.now(UTC) + timedelta(
+            seconds=sum(phase.seconds for phase in self.lifecycle)
+        )
+        account.orders = [
+            FakeOrder(f"sanitized-purchase-{number:05d}-{index}", now, eta)
+            for index in range(orders)
+        ]
+        return account
+
+    def _issue_tokens(self, account: FakeAccount) -> None:
+        """Rotate both tokens, invalidating the previous access token."""
+        token_id = next(self._ids)
+        self._access.pop(account.access_token, None)
+        account.access_token = (
+            _fake_jwt(
+                f"sanitized-account-{account.number:05d}",
+                token_id,
+                time.time() + self.token_lifetime,
+            )
+            if self.jwt_tokens
+            else f"sanitized-access-{account.number:05d}-{token_id}"
+        )
+        account.refresh_token = f"sanitized-refresh-{account.number:05d}-{token_id}"
+        self._access[account.access_token] = (
+            account,
+            self._clock() + self.token_lifetime,
+        )
+        self._refresh[account.refresh_token] = account
+
+    def _account(self, request: web.Request) -> FakeAccount:
+        """Return the caller's account or raise 401 for a missing/expired token."""
+        token = request.headers.get("authorization", "").removeprefix("Bearer ")
+        entry = self._access.get(token)
+        if entry is None or entry[1] <= self._clock():
+            self.stats["unauthorized"] += 1
+            raise web.HTTPUnauthorized(text='{"error":"invalid_token"}')
+        return entry[0]
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Any],
+    ) -> web.StreamResponse:
+        self.stats["requests"] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._random.uniform(0, self.jitter))
+        if (
+            request.method == "GET"
+            and "authorization" in request.headers
+            and self._random.random() < self.throttle_rate
+        ):
+            self.stats["throttled"] += 1
+            return web.json_response(
+                {"error": "rate_limited"},
+                status=429,
+                headers={"Retry-After": f"{self.retry_after:g}"},
+            )
+        return await handler(request)
+
+    def _conditional(self, request: web.Request, payload: Any) -> web.Response:
+        """Answer with 304 when the caller's ETag still matches ``payload``."""
+        body = json.dumps(payload, separators=(",", ":"))
+        etag = f'"{hashlib.sha1(body.encode()).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.stats["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            text=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def _orders(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        now = self._clock()
+        orders = []
+        for order in account.orders:
+            phase = order.phase(self.lifecycle, now)
+            orders.append(
+                {
+                    "purchase_id": order.purchase_id,
+                    "status": {
+                        "value": "In progress"
+                        if phase.telemetry == "IN_PROGRESS"
+                        else phase.status
+                    },
+                    "telemetry": {"order_status_type": phase.telemetry},
+                    "venue": {"name": "Sanitized Test Venue"},
+                }
+            )
+        return self._conditional(request, {"orders": orders})
+
+    async def _tracking(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        purchase_id = request.query.get("purchase_id")
+        order = next(
+            (item for item in account.orders if item.purchase_id == purchase_id),
+            None,
+        )
+        if order is None:
+            raise web.HTTPNotFound(text='{"error":"not_found"}')
+        phase = order.phase(self.lifecycle, self._clock())
+        return self._conditional(
+            request,
+            {
+                "order_details": [
+                    {
+                        "order_id": purchase_id,
+                        "status": phase.status,
+                        "delivery_eta": order.eta.isoformat(timespec="seconds"),
+                        "venue_name": "Sanitized Test Venue",
+                    }
+                ]
+            },
+        )
+
+    async def _venue(self, request: web.Request) -> web.Response:
+        return self._conditional(
+            request,
+            {
+                "venue": {
+                    "online": True,
+                    "delivery_open_status": {"is_open": True, "value": "Open"},
+                    "delivery_configs": [
+                        {"method": "homedelivery", "estimate": {"min": 20, "max": 30}}
+                    ],
+                }
+            },
+        )
+
+    async def _token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        account = None
+        if form.get("grant_type") == "refresh_token":
+            account = self._refresh.pop(str(form.get("refresh_token", "")), None)
+        if account is None:
+            self.stats["rejected_refreshes"] += 1
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        self.stats["refreshes"] += 1
+        self._issue_tokens(account)
+        return web.json_response(
+            {
+                "access_token": account.access_token,
+                "refresh_token": account.refresh_token,
+                "expires_in": self.token_lifetime,
+                "token_type": "Bearer",
+            }
+        )
+
+    async def _root(self, _request: web.Request) -> web.Response:
+        return web.Response()
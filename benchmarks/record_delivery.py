@@ -0,0 +1,123 @@
+"""Record a live Wolt delivery to a cassette without Home Assistant.
+
+Usage::
+
+    WOLT_ACCESS_TOKEN=... WOLT_REFRESH_TOKEN=... \\
+        uv run python -m benchmarks.record_delivery delivery.json --minutes 60
+
+Polls the same endpoints as the coordinator, waiting the interval its poll
+scheduler picks from each order's status and ETA, and stops one cycle after
+every tracked order has finished. ``--min-interval`` and ``--max-interval``
+match the integration options of the same names. Wolt rotates refresh tokens, so use
+credentials from a separate browser session rather than the ones saved in Home
+Assistant. The cassette contains private order data; never commit it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import aiohttp
+
+from benchmarks.cassette import RecordingSession
+from custom_components.wait_for_wolt.api import WoltApi, WoltApiError
+from custom_components.wait_for_wolt.classifier import classify_order
+from custom_components.wait_for_wolt.const import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+)
+from custom_components.wait_for_wolt.coordinator import (
+    WoltCoordinatorData,
+    WoltDataUpdateCoordinator,
+)
+from custom_components.wait_for_wolt.scheduler import PollScheduler
+
+
+async def record(
+    path: str,
+    minutes: float,
+    min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+) -> None:
+    """Poll Wolt like the coordinator until the deadline or delivery completes."""
+    deadline = time.monotonic() + minutes * 60
+    scheduler = PollScheduler(
+        min_interval=timedelta(seconds=min_interval),
+        max_interval=timedelta(seconds=max_interval),
+    )
+    # Like the coordinator, start at the idle interval and keep the last
+    # interval when a cycle fails.
+    interval = scheduler.max_interval
+    async with aiohttp.ClientSession() as session:
+        recorder = RecordingSession(session)
+        api = WoltApi(
+            recorder,  # type: ignore[arg-type]
+            os.environ.get("WOLT_SESSION_ID"),
+            os.environ["WOLT_ACCESS_TOKEN"],
+            os.environ["WOLT_REFRESH_TOKEN"],
+        )
+        seen_active = False
+        try:
+            while time.monotonic() < deadline:
+                active: list[str] = []
+                try:
+                    orders = {
+                        order_id: order
+                        for order in await api.fetch_orders()
+                        if (order_id := WoltDataUpdateCoordinator.order_id(order))
+                        is not None
+                    }
+                    classified = {
+                        order_id: classify_order(order)
+                        for order_id, order in orders.items()
+                    }
+                    active = sorted(
+                        order_id
+                        for order_id, classification in classified.items()
+                        if classification.active
+                    )
+                    details: dict[str, dict[str, Any]] = {}
+                    for order_id in active:
+                        details[order_id] = await api.fetch_order_details(order_id)
+                    data = WoltCoordinatorData.from_payloads(
+                        orders, frozenset(active), details, classified
+                    )
+                    interval = scheduler.next_interval(
+                        data.orders.values(), datetime.now(UTC)
+                    )
+                except WoltApiError as err:
+                    print(f"cycle failed: {type(err).__name__}")
+                print(
+                    f"recorded {len(recorder.cassette.interactions)} exchanges, "
+                    f"next poll in {interval.total_seconds():.0f}s"
+                )
+                if seen_active and not active:
+                    break
+                seen_active = seen_active or bool(active)
+                await asyncio.sleep(interval.total_seconds())
+        finally:
+            recorder.save(path)
+
+
+def main() -> None:
+    """Parse arguments and record until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="cassette file to write")
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--min-interval", type=float, default=DEFAULT_MIN_POLL_INTERVAL)
+    parser.add_argument("--max-interval", type=float, default=DEFAULT_MAX_POLL_INTERVAL)
+    args = parser.parse_args()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(
+            record(args.output, args.minutes, args.min_interval, args.max_interval)
+        )
+
+
+if __name__ == "__main__":
+    main()
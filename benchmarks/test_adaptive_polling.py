@@ -0,0 +1,113 @@
+"""Compare requests per delivery for fixed and adaptive order polling.
+
+Run with ``uv run pytest benchmarks/test_adaptive_polling.py -s``. A fake Wolt
+server scripts one delivery on a simulated clock, so an hour-long order runs in
+well under a second. Set ``WOLT_PREP_MINUTES`` to change the preparation time.
+"""
+
+import os
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_wolt import FakeWoltServer, Phase
+from custom_components.wait_for_wolt.api import WoltApi
+from custom_components.wait_for_wolt.const import (
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    DOMAIN,
+)
+from custom_components.wait_for_wolt.coordinator import (
+    ACTIVE_UPDATE_INTERVAL,
+    WoltDataUpdateCoordinator,
+)
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
+
+FIXED_SECONDS = int(ACTIVE_UPDATE_INTERVAL.total_seconds())
+POLICIES = {
+    # The previous policy: the active interval for as long as an order is open.
+    "fixed": {
+        CONF_MIN_POLL_INTERVAL: FIXED_SECONDS,
+        CONF_MAX_POLL_INTERVAL: FIXED_SECONDS,
+    },
+    "adaptive": {},
+}
+
+
+async def simulate(hass: HomeAssistant, options: dict[str, Any]) -> dict[str, Any]:
+    """Poll one scripted delivery until it finishes, on a simulated clock."""
+    prep_minutes = float(os.environ.get("WOLT_PREP_MINUTES", "40"))
+    lifecycle = (
+        Phase("Order received", 120),
+        Phase("Preparing your order", prep_minutes * 60),
+        Phase("On the way", 900),
+        Phase("Delivered", 0, telemetry="DELIVERED"),
+    )
+    elapsed = 0.0
+    started = datetime.now(UTC)
+    polls: list[tuple[float, str]] = []
+    async with (
+        FakeWoltServer(
+            lifecycle=lifecycle, token_lifetime=86400, clock=lambda: elapsed
+        ) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        account = server.add_account()
+        entry = MockConfigEntry(domain=DOMAIN, data={}, options=options)
+        entry.add_to_hass(hass)
+        api = WoltApi(
+            session,
+            None,
+            account.access_token,
+            account.refresh_token,
+            rate_limiter=WoltRateLimiter((1e9, 1e9)),
+            base_url=server.url,
+        )
+        coordinator = WoltDataUpdateCoordinator(hass, entry, api)
+        with patch(
+            "custom_components.wait_for_wolt.coordinator.dt_util.utcnow",
+            side_effect=lambda: started + timedelta(seconds=elapsed),
+        ):
+            while True:
+                coordinator.data = await coordinator._async_update_data()
+                (order,) = coordinator.data.orders.values()
+                polls.append((elapsed, order.status))
+                if not order.active:
+                    break
+                elapsed += coordinator.update_interval.total_seconds()
+
+    def noticed(status: str, at: float) -> float:
+        """Return how long after ``at`` the first poll saw ``status``."""
+        return next(time for time, seen in polls if seen == status) - at
+
+    on_the_way_at = 120 + prep_minutes * 60
+    return {
+        "requests": server.stats["requests"],
+        "polls": len(polls),
+        "on_the_way_lag": noticed("on_the_way", on_the_way_at),
+        "delivered_lag": noticed("delivered", on_the_way_at + 900),
+    }
+
+
+async def test_adaptive_polling_requests_per_delivery(hass: HomeAssistant) -> None:
+    """Report requests per delivery and how late each phase change is seen."""
+    results = {
+        name: await simulate(hass, options) for name, options in POLICIES.items()
+    }
+
+    print()
+    for name, result in results.items():
+        print(
+            f"{name:>8}: {result['requests']} requests in {result['polls']} polls, "
+            f"on the way seen after {result['on_the_way_lag']:.0f}s, "
+            f"delivery after {result['delivered_lag']:.0f}s"
+        )
+    fixed, adaptive = results["fixed"], results["adaptive"]
+    ratio = fixed["requests"] / adaptive["requests"]
+    print(f"adaptive polling sends {ratio:.1f}x fewer requests")
+    assert adaptive["requests"] < fixed["requests"]
+    assert adaptive["delivered_lag"] <= FIXED_SECONDS
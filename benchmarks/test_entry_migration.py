@@ -0,0 +1,90 @@
+"""Show that legacy unique-ID migration is paid once, not on every poll.
+
+Run with ``uv run pytest benchmarks/test_entry_migration.py -s``. Set
+``WOLT_REGISTRY_ENTITIES`` to change the number of legacy order entities.
+"""
+
+import os
+import time
+from unittest.mock import Mock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.wait_for_wolt import async_migrate_entry
+from custom_components.wait_for_wolt.api import WoltApi
+from custom_components.wait_for_wolt.const import DOMAIN
+from custom_components.wait_for_wolt.coordinator import (
+    WoltCoordinatorData,
+    WoltDataUpdateCoordinator,
+    WoltRuntimeData,
+)
+from custom_components.wait_for_wolt.sensor import async_setup_entry
+
+UPDATES = 100
+
+
+async def test_legacy_migration_cost_is_paid_once(hass: HomeAssistant) -> None:
+    """Report migration, setup, and per-update discovery time."""
+    count = int(os.environ.get("WOLT_REGISTRY_ENTITIES", "5000"))
+    entry = MockConfigEntry(domain=DOMAIN, data={}, version=1)
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    order_ids = [f"sanitized-purchase-{index:06d}" for index in range(count)]
+    for order_id in order_ids:
+        registry.async_get_or_create(
+            "sensor", DOMAIN, f"wolt_{order_id}", config_entry=entry
+        )
+
+    started = time.perf_counter()
+    assert await async_migrate_entry(hass, entry)
+    migration = time.perf_counter() - started
+    started = time.perf_counter()
+    assert await async_migrate_entry(hass, entry)
+    migrated_again = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for order_id in order_ids:
+        # The lookups the update callback used to repeat for every order.
+        for unique_id in (
+            f"wolt_{order_id}",
+            f"{entry.entry_id}_{order_id}_status",
+            f"{entry.entry_id}_{order_id}_eta",
+        ):
+            registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+    previous_update = time.perf_counter() - started
+
+    coordinator = Mock(spec=WoltDataUpdateCoordinator)
+    coordinator.data = WoltCoordinatorData.from_payloads(
+        {
+            order_id: {
+                "purchase_id": order_id,
+                "telemetry": {"order_status_type": "DELIVERED"},
+            }
+            for order_id in order_ids
+        },
+        frozenset(),
+        {},
+    )
+    entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
+    add_entities = Mock()
+    started = time.perf_counter()
+    await async_setup_entry(hass, entry, add_entities)
+    setup = time.perf_counter() - started
+    listener = coordinator.async_add_listener.call_args.args[0]
+    started = time.perf_counter()
+    for _ in range(UPDATES):
+        listener()
+    per_update = (time.perf_counter() - started) / UPDATES
+
+    assert entry.version == 2
+    assert len(add_entities.call_args.args[0]) == 2 * count
+    print(
+        f"\n{count} legacy order entities\n"
+        f"migration: {migration * 1e3:.1f} ms once, "
+        f"{migrated_again * 1e3:.3f} ms when already migrated\n"
+        f"platform setup with registry index: {setup * 1e3:.1f} ms\n"
+        f"discovery per update: {per_update * 1e6:.1f} us "
+        f"(previous per-order registry scan: {previous_update * 1e3:.1f} ms)"
+    )
@@ -0,0 +1,67 @@
+"""Show that ETA extraction stays fast on normal and hostile payloads.
+
+Run with ``uv run pytest benchmarks/test_eta_parser.py -s``. Set
+``WOLT_ETA_READS`` to change the number of extractions per payload.
+"""
+
+import os
+import time
+from typing import Any
+
+from custom_components.wait_for_wolt.classifier import (
+    MAX_ETA_DEPTH,
+    extract_order_eta,
+)
+
+CANONICAL = "2030-01-01T12:30:00Z"
+# Mean extraction time allowed for the worst payload shape, in milliseconds.
+# Single reads are also reported, but include scheduler and collector noise.
+MAX_MEAN_MS = 1
+
+
+def nested(depth: int) -> dict[str, Any]:
+    """Return ETA objects nested ``depth`` levels deep around a timestamp."""
+    value: Any = CANONICAL
+    for _ in range(depth):
+        value = {"value": value}
+    return value
+
+
+def full_tree(depth: int) -> Any:
+    """Return ETA objects using every searched key at every level, without a hit."""
+    if depth == 0:
+        return "25-35 min"
+    return {
+        key: full_tree(depth - 1) for key in ("value", "timestamp", "max", "end")
+    } | {f"noise_{index}": index for index in range(1000)}
+
+
+PAYLOADS = {
+    "canonical string": {"delivery_eta": CANONICAL},
+    "epoch milliseconds": {"delivery_eta": 1893501000000},
+    "offset string": {"eta": "2030-01-01T14:30:00.000+02:00"},
+    "duration text": {"delivery_eta": "25-35 min"},
+    "100k nested objects": {"delivery_eta": nested(100_000)},
+    "full tree at the depth limit": {
+        key: full_tree(MAX_ETA_DEPTH)
+        for key in ("delivery_eta", "estimated_delivery_time", "eta")
+    },
+    "1 MB string": {"delivery_eta": CANONICAL * 50_000},
+}
+
+
+def test_eta_extraction_worst_case_is_bounded() -> None:
+    """Report the mean and worst extraction time for each payload shape."""
+    reads = int(os.environ.get("WOLT_ETA_READS", "10000"))
+
+    print(f"\n{reads} ETA extractions per payload")
+    for name, payload in PAYLOADS.items():
+        worst = 0.0
+        started = time.perf_counter()
+        for _ in range(reads):
+            read_started = time.perf_counter()
+            extract_order_eta(payload)
+            worst = max(worst, time.perf_counter() - read_started)
+        mean = (time.perf_counter() - started) / reads
+        print(f"{name:>28}: {mean * 1e6:8.2f} us mean, {worst * 1e6:8.1f} us worst")
+        assert mean * 1e3 < MAX_MEAN_MS
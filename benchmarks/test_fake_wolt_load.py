@@ -0,0 +1,102 @@
+"""Poll a fake Wolt server with many simulated accounts at once.
+
+Run with ``uv run pytest benchmarks/test_fake_wolt_load.py -s``. Set
+``WOLT_FAKE_ACCOUNTS`` to change the number of accounts (default 200).
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_wolt import FakeWoltServer, Phase
+from custom_components.wait_for_wolt.api import WoltApi
+from custom_components.wait_for_wolt.const import DOMAIN
+from custom_components.wait_for_wolt.coordinator import WoltDataUpdateCoordinator
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
+
+# A delivery compressed into seconds, with tokens expiring mid-delivery.
+LIFECYCLE = (
+    Phase("Order received", 1),
+    Phase("Preparing your order", 2),
+    Phase("On the way", 2),
+    Phase("Delivered", 0, telemetry="DELIVERED"),
+)
+POLL_INTERVAL = 0.5
+
+
+async def test_fake_wolt_load(hass: HomeAssistant) -> None:
+    """Report cycle latency and server load for concurrent simulated accounts."""
+    accounts = int(os.environ.get("WOLT_FAKE_ACCOUNTS", "200"))
+    latencies: list[float] = []
+    failures = 0
+    async with (
+        FakeWoltServer(
+            lifecycle=LIFECYCLE,
+            token_lifetime=3,
+            jwt_tokens=False,
+            throttle_rate=0.01,
+            retry_after=1,
+            latency=0.005,
+            jitter=0.02,
+        ) as server,
+        aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=accounts)
+        ) as session,
+    ):
+        coordinators = []
+        for _ in range(accounts):
+            account = server.add_account()
+            entry = MockConfigEntry(domain=DOMAIN, data={})
+            entry.add_to_hass(hass)
+            api = WoltApi(
+                session,
+                None,
+                account.access_token,
+                account.refresh_token,
+                # Only the fake server's 429s throttle the simulated accounts.
+                rate_limiter=WoltRateLimiter((1e9, 1e9)),
+                base_url=server.url,
+            )
+            coordinators.append(WoltDataUpdateCoordinator(hass, entry, api))
+
+        async def poll(coordinator: WoltDataUpdateCoordinator) -> bool:
+            nonlocal failures
+            started = time.perf_counter()
+            try:
+                coordinator.data = await coordinator._async_update_data()
+            except UpdateFailed, ConfigEntryAuthFailed:
+                failures += 1
+                return True
+            finally:
+                latencies.append(time.perf_counter() - started)
+            return bool(coordinator.data.active_order_ids)
+
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        pending = coordinators
+        while pending:
+            tick = time.perf_counter()
+            still_active = await asyncio.gather(*(poll(c) for c in pending))
+            pending = [
+                c for c, active in zip(pending, still_active, strict=True) if active
+            ]
+            await asyncio.sleep(max(0.0, POLL_INTERVAL - (time.perf_counter() - tick)))
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"\n{accounts} accounts, {len(latencies)} cycles in {wall:.1f}s "
+        f"({server.stats['requests'] / wall:.0f} requests/s, CPU {cpu:.2f}s)\n"
+        f"cycle latency: p50 {quantiles[49] * 1e3:.1f} ms, "
+        f"p95 {quantiles[94] * 1e3:.1f} ms, max {max(latencies) * 1e3:.1f} ms\n"
+        f"failed cycles: {failures}, server: {dict(server.stats)}"
+    )
+    assert server.stats["rejected_refreshes"] == 0
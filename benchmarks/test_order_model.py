@@ -0,0 +1,115 @@
+"""Compare raw payload snapshots with parsed ``WoltOrder`` snapshots.
+
+Run with ``uv run pytest benchmarks/test_order_model.py -s``. Set
+``WOLT_HISTORY_ORDERS`` to change the size of the synthetic order history.
+"""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from custom_components.wait_for_wolt.classifier import (
+    extract_order_eta,
+    is_active_order,
+    normalize_order_status,
+)
+from custom_components.wait_for_wolt.coordinator import WoltCoordinatorData
+
+
+def synthetic_history(count: int) -> tuple[bytes, bytes]:
+    """Return order-page and details JSON shaped like Wolt's, with one in 20 active."""
+    orders = []
+    details = {}
+    for index in range(count):
+        purchase_id = f"sanitized-purchase-{index:06d}"
+        active = index % 20 == 0
+        orders.append(
+            {
+                "purchase_id": purchase_id,
+                "status": {"value": "In progress" if active else "Delivered"},
+                "telemetry": {
+                    "order_status_type": "IN_PROGRESS" if active else "DELIVERED"
+                },
+                "call_to_action": {"link": "ORDER_TRACKING", "text": "Track order"},
+                "venue": {
+                    "name": "Sanitized Test Venue",
+                    "image": {"url": "https://example.invalid/venue.png"},
+                    "address": "Sanitized address",
+                },
+                "items": [
+                    {"name": f"Sanitized item {item}", "count": 1, "price": 1000}
+                    for item in range(5)
+                ],
+                "total_price": {"amount": 5000, "currency": "TEST"},
+            }
+        )
+        if active:
+            details[purchase_id] = {
+                "status": "Preparing your order",
+                "delivery_eta": "2030-01-01T12:30:00Z",
+                "client_pre_estimate": "25-35 min",
+                "items": [{"name": "Sanitized item"}] * 5,
+            }
+    return json.dumps({"orders": orders}).encode(), json.dumps(details).encode()
+
+
+def retained_bytes(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Return what ``build`` returns and the memory it keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, retained
+
+
+def test_order_model_memory_and_cpu() -> None:
+    """Report retained snapshot memory and per-cycle entity read CPU."""
+    count = int(os.environ.get("WOLT_HISTORY_ORDERS", "5000"))
+    orders_body, details_body = synthetic_history(count)
+
+    def load_raw() -> tuple[dict[str, Any], frozenset[str], dict[str, Any]]:
+        orders = {
+            order["purchase_id"]: order for order in json.loads(orders_body)["orders"]
+        }
+        active = frozenset(
+            order_id for order_id, order in orders.items() if is_active_order(order)
+        )
+        return orders, active, json.loads(details_body)
+
+    raw, raw_bytes = retained_bytes(load_raw)
+    parsed, parsed_bytes = retained_bytes(
+        lambda: WoltCoordinatorData.from_payloads(*load_raw())
+    )
+
+    orders, active, details = raw
+    started = time.process_time()
+    for order_id in orders:
+        # What each status and ETA entity did on every state write.
+        normalize_order_status({**orders[order_id], **details.get(order_id, {})})
+        extract_order_eta({**orders[order_id], **details.get(order_id, {})})
+    raw_reads = time.process_time() - started
+
+    started = time.process_time()
+    snapshot = WoltCoordinatorData.from_payloads(orders, active, details)
+    parse = time.process_time() - started
+    started = time.process_time()
+    for order in snapshot.orders.values():
+        _ = order.status, order.eta
+    parsed_reads = time.process_time() - started
+
+    assert len(parsed.orders) == count
+    print(
+        f"\n{count} orders, {len(parsed.active_order_ids)} active\n"
+        f"retained snapshot: raw {raw_bytes / 1024:.0f} KiB, "
+        f"parsed {parsed_bytes / 1024:.0f} KiB "
+        f"({raw_bytes / parsed_bytes:.1f}x smaller)\n"
+        f"entity reads per cycle: raw {raw_reads * 1e3:.1f} ms, "
+        f"parsed {parsed_reads * 1e3:.2f} ms plus {parse * 1e3:.1f} ms to parse "
+        "once per cycle"
+    )
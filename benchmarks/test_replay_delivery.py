@@ -0,0 +1,64 @@
+"""Replay a recorded delivery through the coordinator and order sensors.
+
+Run with ``uv run pytest benchmarks/test_replay_delivery.py -s``. Set
+``WOLT_CASSETTE`` to replay a private recording instead of the synthetic one.
+"""
+
+import os
+import statistics
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.cassette import Cassette, ReplaySession
+from custom_components.wait_for_wolt.api import WoltApi, WoltApiError
+from custom_components.wait_for_wolt.const import ACTIVE_ORDERS_URL, DOMAIN
+from custom_components.wait_for_wolt.coordinator import WoltDataUpdateCoordinator
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
+from custom_components.wait_for_wolt.sensor import (
+    WoltOrderEtaSensor,
+    WoltOrderStatusSensor,
+)
+
+
+async def test_replay_delivery_cpu_per_cycle(hass: HomeAssistant) -> None:
+    """Report CPU time per polling cycle for a replayed delivery."""
+    cassette = Cassette.load(os.environ.get("WOLT_CASSETTE", "synthetic_delivery.json"))
+    replay = ReplaySession(cassette, realtime=bool(os.environ.get("WOLT_REALTIME")))
+    api = WoltApi(
+        replay,  # type: ignore[arg-type]
+        None,
+        "sanitized-access-token",
+        "sanitized-refresh-token",
+        rate_limiter=WoltRateLimiter((1e9, 1e9)),
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = WoltDataUpdateCoordinator(hass, entry, api)
+
+    cycle_cpu: list[float] = []
+    wall_started = time.perf_counter()
+    while replay.remaining("GET", ACTIVE_ORDERS_URL):
+        started = time.process_time()
+        try:
+            coordinator.data = await coordinator._async_update_data()
+        except UpdateFailed, WoltApiError:
+            cycle_cpu.append(time.process_time() - started)
+            continue
+        for order_id in coordinator.data.orders:
+            for sensor_class in (WoltOrderStatusSensor, WoltOrderEtaSensor):
+                sensor_class(coordinator, entry.entry_id, order_id).native_value  # noqa: B018
+        cycle_cpu.append(time.process_time() - started)
+    wall = time.perf_counter() - wall_started
+
+    assert cycle_cpu
+    print(
+        f"\nreplayed {len(cycle_cpu)} cycles covering {cassette.duration / 60:.1f} "
+        f"recorded minutes in {wall:.3f}s wall time\n"
+        f"CPU per cycle: mean {statistics.fmean(cycle_cpu) * 1e3:.3f} ms, "
+        f"max {max(cycle_cpu) * 1e3:.3f} ms\n"
+        f"304 responses: {api.cache_stats.not_modified_responses}, "
+        f"bytes saved: {api.cache_stats.bytes_saved}"
+    )
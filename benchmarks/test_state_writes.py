@@ -0,0 +1,80 @@
+"""Measure what order entities allocate for each state write.
+
+Run with ``uv run pytest benchmarks/test_state_writes.py -s``. Set
+``WOLT_STATE_WRITES`` to change the number of simulated state writes.
+"""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from unittest.mock import Mock
+
+from benchmarks.test_order_model import synthetic_history
+from custom_components.wait_for_wolt.classifier import classify_order
+from custom_components.wait_for_wolt.coordinator import (
+    WoltCoordinatorData,
+    WoltDataUpdateCoordinator,
+)
+from custom_components.wait_for_wolt.sensor import (
+    WoltOrderEtaSensor,
+    WoltOrderStatusSensor,
+)
+
+ORDERS = 20
+
+
+def measure(write: Callable[[], None], writes: int) -> tuple[float, int]:
+    """Return microseconds per write and the peak bytes allocated by writes."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    for _ in range(writes):
+        write()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return elapsed / writes * 1e6, peak
+
+
+def test_order_entity_state_write_allocations() -> None:
+    """Compare per-read payload merging with the precomputed order snapshot."""
+    writes = int(os.environ.get("WOLT_STATE_WRITES", "100000"))
+    orders_body, details_body = synthetic_history(ORDERS * 20)
+    orders = {
+        order["purchase_id"]: order for order in json.loads(orders_body)["orders"]
+    }
+    details = json.loads(details_body)
+    order_id = next(iter(details))
+    coordinator = Mock(spec=WoltDataUpdateCoordinator)
+    coordinator.last_update_success = True
+    coordinator.data = WoltCoordinatorData.from_payloads(
+        orders, frozenset(details), details
+    )
+    status = WoltOrderStatusSensor(coordinator, "sanitized-entry", order_id)
+    eta = WoltOrderEtaSensor(coordinator, "sanitized-entry", order_id)
+
+    def merged_write() -> None:
+        # What the status and ETA entities did before the parse-once snapshot.
+        for _ in (status, eta):
+            classify_order({**orders[order_id], **details[order_id]})
+
+    def snapshot_write() -> None:
+        # The properties Home Assistant reads for one state write of each entity.
+        for entity in (status, eta):
+            _ = entity.available
+            _ = entity.native_value
+            _ = entity.extra_state_attributes
+
+    merged_time, merged_peak = measure(merged_write, writes)
+    snapshot_time, snapshot_peak = measure(snapshot_write, writes)
+
+    assert status.native_value == "preparing"
+    print(
+        f"\n{writes} state writes of one order's status and ETA entities\n"
+        f"per-read merge: {merged_time:.2f} us, peak {merged_peak} bytes\n"
+        f"snapshot reads: {snapshot_time:.2f} us, peak {snapshot_peak} bytes"
+    )
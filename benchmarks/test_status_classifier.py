@@ -0,0 +1,80 @@
+"""Time status classification with token scans, a compiled matcher, and a memo.
+
+Run with ``uv run pytest benchmarks/test_status_classifier.py -s``. Set
+``WOLT_STATUS_READS`` to change the number of classified status strings.
+"""
+
+import os
+import re
+import time
+from collections.abc import Callable
+
+from custom_components.wait_for_wolt.classifier import classify_order_status
+
+# Display strings Wolt repeats through every delivery.
+STATUSES = (
+    "Order received",
+    "Preparing your order",
+    "Ready for pickup",
+    "Courier picked up",
+    "On the way",
+    "Courier nearby",
+    "Delivered",
+    "IN_PROGRESS",
+    "DELIVERED",
+    "new private state",
+)
+SCANNED_TOKENS = (
+    ("cancelled", ("cancel", "refunded")),
+    ("failed", ("fail", "reject", "declin")),
+    ("delivered", ("delivered", "completed", "finished")),
+    ("arriving", ("arriv", "nearby", "almost_there")),
+    ("on_the_way", ("on_the_way", "en_route", "courier_delivery", "delivery")),
+    ("picked_up", ("picked_up", "courier_pickup")),
+    ("ready_for_pickup", ("ready", "awaiting_pickup")),
+    ("preparing", ("prepar", "production", "restaurant")),
+    ("pending", ("pending", "received", "created", "in_progress", "accepted")),
+)
+
+
+def scanned(raw: str) -> str:
+    """Classify a status like the previous implementation, one scan per group."""
+    value = re.sub(r"[^a-z0-9]+", "_", raw.casefold()).strip("_")
+    for normalized, tokens in SCANNED_TOKENS:
+        if any(token in value for token in tokens):
+            return normalized
+    return "unknown"
+
+
+def per_read(classify: Callable[[str], str], statuses: list[str]) -> float:
+    """Return the mean classification time in microseconds."""
+    started = time.perf_counter()
+    for status in statuses:
+        classify(status)
+    return (time.perf_counter() - started) / len(statuses) * 1e6
+
+
+def test_status_classifier_per_read_cost() -> None:
+    """Report the cost of one classification for each implementation."""
+    reads = int(os.environ.get("WOLT_STATUS_READS", "200000"))
+    repeated = [STATUSES[index % len(STATUSES)] for index in range(reads)]
+    # Distinct strings defeat the memo and measure the matcher itself.
+    distinct = [f"{status} {index}" for index, status in enumerate(repeated)]
+
+    results = {
+        "token scans": per_read(scanned, repeated),
+        "compiled matcher": per_read(classify_order_status.__wrapped__, repeated),
+        "memoized, distinct strings": per_read(classify_order_status, distinct),
+        "memoized, Wolt's strings": per_read(classify_order_status, repeated),
+    }
+
+    assert [classify_order_status(status) for status in STATUSES] == [
+        scanned(status) for status in STATUSES
+    ]
+    print(f"\n{reads} status classifications")
+    for name, micros in results.items():
+        print(f"{name:>27}: {micros:.2f} us per read")
+    print(
+        f"memoized reads are {results['token scans'] / results[list(results)[-1]]:.0f}"
+        "x faster than token scans"
+    )
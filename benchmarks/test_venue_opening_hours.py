@@ -0,0 +1,96 @@
+"""Compare venue fetches per day for fixed and opening-hours venue polling.
+
+Run with ``uv run pytest benchmarks/test_venue_opening_hours.py -s``. Scripted
+venues open from 10:00 to 22:00 on a simulated clock, so a whole day runs in
+well under a second. Set ``WOLT_VENUES`` to change the number of venues.
+"""
+
+import os
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.wait_for_wolt.api import WoltApi
+from custom_components.wait_for_wolt.const import CONF_VENUE_OPENING_HOURS, DOMAIN
+from custom_components.wait_for_wolt.coordinator import WoltVenueCoordinator
+
+DAY_START = datetime(2030, 1, 1, tzinfo=UTC)
+OPENS = timedelta(hours=10)
+CLOSES = timedelta(hours=22)
+
+
+async def simulate(hass: HomeAssistant, opening_hours: bool) -> dict[str, Any]:
+    """Poll the scripted venues for one simulated day."""
+    count = int(os.environ.get("WOLT_VENUES", "10"))
+    slugs = [f"sanitized-venue-{index:03}" for index in range(count)]
+    now = DAY_START
+    fetches = 0
+    closed_fetches = 0
+    # How late the first fetch after opening time saw each venue open.
+    noticed_open: dict[str, timedelta] = {}
+
+    async def fetch_venue_details(slug: str) -> dict[str, Any]:
+        nonlocal fetches, closed_fetches
+        fetches += 1
+        opens_at, closes_at = DAY_START + OPENS, DAY_START + CLOSES
+        is_open = opens_at <= now < closes_at
+        if is_open:
+            noticed_open.setdefault(slug, now - opens_at)
+        else:
+            closed_fetches += 1
+        if now >= closes_at:
+            opens_at += timedelta(days=1)
+        return {
+            "venue": {
+                "delivery_open_status": {
+                    "is_open": is_open,
+                    "next_open": None if is_open else opens_at.isoformat(),
+                    "next_close": closes_at.isoformat() if is_open else None,
+                }
+            }
+        }
+
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_venue_details.side_effect = fetch_venue_details
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={}, options={CONF_VENUE_OPENING_HOURS: opening_hours}
+    )
+    entry.add_to_hass(hass)
+    coordinator = WoltVenueCoordinator(hass, entry, api, slugs)
+    with patch(
+        "custom_components.wait_for_wolt.coordinator.dt_util.utcnow",
+        side_effect=lambda: now,
+    ):
+        while now < DAY_START + timedelta(days=1):
+            coordinator.data = await coordinator._async_update_data()
+            now += coordinator.update_interval
+
+    return {
+        "fetches": fetches / count,
+        "closed_fetches": closed_fetches / count,
+        "open_lag": max(noticed_open.values()),
+    }
+
+
+async def test_opening_hours_cut_overnight_venue_fetches(hass: HomeAssistant) -> None:
+    """Report fetches per venue per day and how late each opening is seen."""
+    results = {
+        "fixed": await simulate(hass, opening_hours=False),
+        "opening hours": await simulate(hass, opening_hours=True),
+    }
+
+    print()
+    for name, result in results.items():
+        print(
+            f"{name:>13}: {result['fetches']:.0f} fetches per venue per day, "
+            f"{result['closed_fetches']:.0f} while closed, "
+            f"opening seen after {result['open_lag'].total_seconds():.0f}s"
+        )
+    fixed, scheduled = results["fixed"], results["opening hours"]
+    ratio = fixed["closed_fetches"] / scheduled["closed_fetches"]
+    print(f"opening hours send {ratio:.1f}x fewer fetches while venues are closed")
+    assert scheduled["closed_fetches"] * 10 <= fixed["closed_fetches"]
+    assert scheduled["open_lag"] <= fixed["open_lag"] + timedelta(minutes=5)
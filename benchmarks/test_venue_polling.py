@@ -0,0 +1,142 @@
+"""Time platform setup and one venue cycle with many configured venues.
+
+Run with ``uv run pytest benchmarks/test_venue_polling.py -s``. Set
+``WOLT_VENUES`` to change the number of venues and ``WOLT_VENUE_LATENCY`` the
+fake server's response delay in seconds. The first test measures fetch
+scheduling with the request budget disabled. The second runs a venue cycle with
+the default budget, which venue pages share with the orders page, while orders
+are polled every ``WOLT_ORDER_POLL_SPACING`` seconds, by default the shortest
+order polling interval; with 50 venues it takes about a minute and a half.
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import Mock
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_wolt import FakeWoltServer
+from custom_components.wait_for_wolt.api import WoltApi, WoltRateLimitError
+from custom_components.wait_for_wolt.const import (
+    CONF_VENUE_IDS,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DOMAIN,
+)
+from custom_components.wait_for_wolt.coordinator import (
+    VENUE_CONCURRENCY,
+    VENUE_UPDATE_INTERVAL,
+    WoltCoordinatorData,
+    WoltDataUpdateCoordinator,
+    WoltRuntimeData,
+    WoltVenueCoordinator,
+)
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
+from custom_components.wait_for_wolt.sensor import async_setup_entry
+
+
+async def test_venue_setup_and_cycle_time(hass: HomeAssistant) -> None:
+    """Compare one-after-another venue fetches with the shared venue cycle."""
+    count = int(os.environ.get("WOLT_VENUES", "50"))
+    latency = float(os.environ.get("WOLT_VENUE_LATENCY", "0.05"))
+    slugs = [f"sanitized-venue-{index:03}" for index in range(count)]
+    async with (
+        FakeWoltServer(latency=latency) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        api = WoltApi(
+            session,
+            None,
+            "sanitized-access-token",
+            "sanitized-refresh-token",
+            # Measure fetch scheduling; the next test keeps the request budget.
+            rate_limiter=WoltRateLimiter((1e9, 1e9)),
+            base_url=server.url,
+        )
+        entry = MockConfigEntry(domain=DOMAIN, data={}, options={CONF_VENUE_IDS: slugs})
+        entry.add_to_hass(hass)
+        venue_coordinator = WoltVenueCoordinator(hass, entry, api, slugs)
+        coordinator = Mock(spec=WoltDataUpdateCoordinator)
+        coordinator.data = WoltCoordinatorData.from_payloads({}, frozenset(), {})
+        entry.runtime_data = WoltRuntimeData(api, coordinator, venue_coordinator)
+
+        started = time.perf_counter()
+        for slug in slugs:
+            # What update_before_add did before the venue coordinator.
+            await api.fetch_venue_details(slug)
+        sequential = time.perf_counter() - started
+
+        add_entities = Mock()
+        started = time.perf_counter()
+        await async_setup_entry(hass, entry, add_entities)
+        setup = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await venue_coordinator.async_refresh()
+        cycle = time.perf_counter() - started
+
+    assert venue_coordinator.last_update_success
+    assert len(venue_coordinator.data) == count
+    print(
+        f"\n{count} venues, {latency * 1e3:.0f} ms per response, "
+        f"{VENUE_CONCURRENCY} requests at a time\n"
+        f"one after another: {sequential * 1e3:.0f} ms\n"
+        f"platform setup: {setup * 1e3:.1f} ms (venues fetched in the background)\n"
+        f"shared venue cycle: {cycle * 1e3:.0f} ms"
+    )
+
+
+async def test_venue_cycle_with_default_budget_leaves_order_polls_alone(
+    hass: HomeAssistant,
+) -> None:
+    """Time a venue cycle and the order polls sent while it runs."""
+    count = int(os.environ.get("WOLT_VENUES", "50"))
+    latency = float(os.environ.get("WOLT_VENUE_LATENCY", "0.05"))
+    spacing = float(
+        os.environ.get("WOLT_ORDER_POLL_SPACING", str(DEFAULT_MIN_POLL_INTERVAL))
+    )
+    slugs = [f"sanitized-venue-{index:03}" for index in range(count)]
+    async with (
+        FakeWoltServer(latency=latency) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        account = server.add_account()
+        api = WoltApi(
+            session,
+            None,
+            account.access_token,
+            account.refresh_token,
+            base_url=server.url,
+        )
+        entry = MockConfigEntry(domain=DOMAIN, data={}, options={CONF_VENUE_IDS: slugs})
+        entry.add_to_hass(hass)
+        venue_coordinator = WoltVenueCoordinator(hass, entry, api, slugs)
+
+        started = time.perf_counter()
+        cycle = asyncio.create_task(venue_coordinator.async_refresh())
+        order_polls: list[float] = []
+        failed_polls = 0
+        while not cycle.done():
+            polled = time.perf_counter()
+            try:
+                await api.fetch_orders()
+            except WoltRateLimitError:
+                failed_polls += 1
+            else:
+                order_polls.append(time.perf_counter() - polled)
+            await asyncio.wait({cycle}, timeout=spacing)
+        duration = time.perf_counter() - started
+
+    assert venue_coordinator.last_update_success
+    assert len(venue_coordinator.data) == count
+    print(
+        f"\n{count} venues with the default request budget\n"
+        f"venue cycle: {duration:.0f} s\n"
+        f"{len(order_polls)} order polls during the cycle: "
+        f"slowest {max(order_polls) * 1e3:.0f} ms, {failed_polls} refused"
+    )
+    assert not failed_polls
+    assert max(order_polls) < 1
+    assert duration < VENUE_UPDATE_INTERVAL.total_seconds()
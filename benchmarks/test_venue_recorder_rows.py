@@ -0,0 +1,105 @@
+"""Count the recorder rows a day of venue polling produces.
+
+Run with ``uv run pytest benchmarks/test_venue_recorder_rows.py -s``. Scripted
+venue pages whose delivery estimates move every cycle and whose discount
+changes every few hours are parsed for one day of five-minute cycles. The
+benchmark counts the state rows and distinct attribute rows the recorder would
+store for the previous single venue sensor, with estimates as attributes, and
+for the status sensor plus estimate sensors. Set ``WOLT_VENUE_CYCLES`` to change
+the number of cycles.
+"""
+
+import json
+import os
+import random
+from typing import Any
+
+from custom_components.wait_for_wolt.models import WoltVenue
+from custom_components.wait_for_wolt.sensor import WoltVenueSensor
+
+DISCOUNT_CYCLES = 36
+
+
+def venue_page(cycle: int, rng: random.Random) -> dict[str, Any]:
+    """Return a synthetic venue page for one polling cycle."""
+    low = rng.randint(15, 25)
+    return {
+        "venue": {
+            "online": True,
+            "delivery_open_status": {
+                "is_open": 30 <= cycle % 288 < 270,
+                "value": "Open",
+            },
+            "delivery_configs": [
+                {
+                    "method": "homedelivery",
+                    "estimate": {"min": low, "max": low + rng.randint(5, 15)},
+                }
+            ],
+            "banners": [
+                {"formatted_text": f"Sanitized discount {cycle // DISCOUNT_CYCLES}"}
+            ],
+        },
+        "is_venue_favourite": False,
+    }
+
+
+def count_rows(
+    states: list[Any], attributes: list[dict[str, Any]]
+) -> tuple[int, int, int]:
+    """Return the state rows, attribute rows, and attribute bytes of one entity.
+
+    A state row is written whenever the state or any attribute changes; the
+    recorder shares one attribute row between states with equal recorded
+    attributes.
+    """
+    rows = sum(
+        1
+        for index, state in enumerate(states)
+        if index == 0 or state != states[index - 1]
+    )
+    attribute_rows = {json.dumps(item, sort_keys=True) for item in attributes}
+    return rows, len(attribute_rows), sum(map(len, attribute_rows))
+
+
+def test_venue_recorder_rows_per_day() -> None:
+    """Report recorder rows for attributes-only and measurement estimates."""
+    cycles = int(os.environ.get("WOLT_VENUE_CYCLES", "288"))
+    rng = random.Random(0)
+    venues = [
+        WoltVenue.from_payload("sanitized-venue", venue_page(cycle, rng))
+        for cycle in range(cycles)
+    ]
+    unrecorded = WoltVenueSensor._unrecorded_attributes
+
+    previous = [venue.attributes | venue.estimates for venue in venues]
+    before = count_rows(
+        [(venue.is_open, item) for venue, item in zip(venues, previous, strict=True)],
+        previous,
+    )
+    status = count_rows(
+        [(venue.is_open, venue.attributes) for venue in venues],
+        [
+            {
+                key: value
+                for key, value in venue.attributes.items()
+                if key not in unrecorded
+            }
+            for venue in venues
+        ],
+    )
+    estimate_rows = sum(
+        count_rows([venue.estimates.get(key) for venue in venues], [])[0]
+        for key in venues[0].estimates
+    )
+
+    print(
+        f"\n{cycles} venue cycles\n"
+        f"estimates as attributes: {before[0]} state rows, "
+        f"{before[1]} attribute rows ({before[2]} bytes)\n"
+        f"measurement sensors: {status[0]} status rows, "
+        f"{status[1]} attribute rows ({status[2]} bytes), "
+        f"{estimate_rows} estimate state rows compressed by long-term statistics"
+    )
+    assert status[0] * 10 <= before[0]
+    assert status[2] * 10 <= before[2]
@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from typing import Any
+
 import homeassistant.helpers.config_validation as cv
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.ssl import client_context
 
-from .api import WoltApi
+from .api import WoltApi, create_session
 from .const import (
     CONF_BEARER_TOKEN,
+    CONF_DEDICATED_SESSION,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_ID,
+    CONF_VENUE_IDS,
     DOMAIN,
 )
-from .coordinator import WoltDataUpdateCoordinator, WoltRuntimeData
+from .coordinator import (
+    WoltCoordinatorData,
+    WoltDataUpdateCoordinator,
+    WoltRuntimeData,
+    WoltVenueCoordinator,
+)
+from .retention import WoltOrderRetention
+from .snapshot import WoltSnapshotStore
+from .token_persistence import async_get_token_persister
 
 PLATFORMS = [Platform.SENSOR]
 CONFIG_SCHEMA = cv.platform_only_config_schema(DOMAIN)
@@ -32,6 +47,40 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Move entries and their entities to the current layout, once, at load."""
+    if entry.version > 2:
+        # Downgraded from a release with a newer layout.
+        return False
+    if entry.version == 1:
+        registry = er.async_get(hass)
+
+        @callback
+        def scope_legacy_order_entity(
+            entity: er.RegistryEntry,
+        ) -> dict[str, Any] | None:
+            """Rewrite a legacy ``wolt_{order_id}`` status entity in place."""
+            if (
+                entity.domain != "sensor"
+                or not entity.unique_id.startswith("wolt_")
+                or entity.unique_id.startswith("wolt_venue_")
+            ):
+                return None
+            order_id = entity.unique_id.removeprefix("wolt_")
+            unique_id = f"{entry.entry_id}_{order_id}_status"
+            if registry.async_get_entity_id("sensor", DOMAIN, unique_id) is not None:
+                return None
+            return {
+                "new_unique_id": unique_id,
+                "translation_key": "order_status",
+                "has_entity_name": True,
+            }
+
+        await er.async_migrate_entries(hass, entry.entry_id, scope_legacy_order_entity)
+        hass.config_entries.async_update_entry(entry, version=2)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Create the shared client/coordinator and set up entry platforms."""
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = _entry_snapshot(entry)
@@ -49,22 +98,69 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             runtime_snapshot["options"] = dict(entry.options)
         hass.config_entries.async_update_entry(entry, data=updated_data)
 
+    # Rotations are written in batches; unloading flushes any pending pair.
+    token_persister = async_get_token_persister(hass)
+    entry.async_on_unload(token_persister.async_register(entry, persist_tokens))
+
+    def queue_tokens(access_token: str, refresh_token: str) -> None:
+        """Hand rotated credentials to the batched config-entry writer."""
+        token_persister.async_update(entry.entry_id, access_token, refresh_token)
+
+    if entry.options.get(CONF_DEDICATED_SESSION, False):
+        # Keep Wolt's keep-alive connections out of the shared Home Assistant
+        # pool. The session is closed on unload, including failed setup, and at
+        # shutdown when config entries are not unloaded.
+        session = create_session(client_context())
+
+        async def close_session(_event: Event | None = None) -> None:
+            await session.close()
+
+        entry.async_on_unload(close_session)
+        entry.async_on_unload(
+            hass.bus.async_listen(EVENT_HOMEASSISTANT_CLOSE, close_session)
+        )
+    else:
+        session = async_get_clientsession(hass)
+
     api = WoltApi(
-        async_get_clientsession(hass),
+        session,
         entry.data.get(CONF_SESSION_ID, ""),
         entry.data[CONF_BEARER_TOKEN],
         entry.data[CONF_REFRESH_TOKEN],
-        token_update_callback=persist_tokens,
+        token_update_callback=queue_tokens,
+    )
+    snapshot_store = WoltSnapshotStore(hass, entry.entry_id)
+    coordinator = WoltDataUpdateCoordinator(
+        hass, entry, api, snapshot_store=snapshot_store
     )
-    coordinator = WoltDataUpdateCoordinator(hass, entry, api)
-    entry.runtime_data = WoltRuntimeData(api, coordinator)
+    venue_slugs = {**entry.data, **entry.options}.get(CONF_VENUE_IDS, [])
+    venue_coordinator = (
+        WoltVenueCoordinator(hass, entry, api, venue_slugs) if venue_slugs else None
+    )
+    entry.runtime_data = WoltRuntimeData(api, coordinator, venue_coordinator)
+    entry.async_on_unload(snapshot_store.async_flush)
     try:
-        await coordinator.async_config_entry_first_refresh()
+        if (restored := await snapshot_store.async_load()) is not None:
+            # Start from the last good snapshot instead of waiting on Wolt;
+            # entities flag it as stale until the first live refresh lands.
+            coordinator.data = WoltCoordinatorData.from_restored(restored)
+        else:
+            await coordinator.async_config_entry_first_refresh()
         entry.async_on_unload(entry.add_update_listener(async_reload_entry))
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception:
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
         raise
+    if restored is not None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    if venue_coordinator is not None:
+        # Public venue pages never block setup; their entities are unavailable
+        # until the first venue cycle completes.
+        entry.async_create_background_task(
+            hass, venue_coordinator.async_refresh(), f"{DOMAIN} first venue refresh"
+        )
     return True
 
 
@@ -72,10 +168,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
+        # Runs before the unload callbacks, so a token rotation finishing here
+        # still reaches the persister's final flush.
+        await entry.runtime_data.api.async_close()
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored order snapshot and finish times of a removed entry."""
+    await WoltSnapshotStore(hass, entry.entry_id).async_remove()
+    await WoltOrderRetention(hass, entry.entry_id, timedelta()).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload after user options change, but not after token rotation."""
     if hass.data.get(DOMAIN, {}).get(entry.entry_id) == _entry_snapshot(entry):
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import inspect
+import json
+import logging
+import ssl
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit, urlunsplit
 
 import aiohttp
 
+from .classifier import is_active_order
 from .const import (
     ACTIVE_ORDERS_URL,
     HEADERS,
@@ -17,43 +26,91 @@ from .const import (
     REFRESH_URL,
     VENUE_CONTENT_URL,
 )
+from .rate_limit import TokenBucket, WoltRateLimiter, parse_retry_after
+from .stats import EndpointStats, LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
 
 REQUEST_TIMEOUT = 10
+# JWT access tokens are refreshed in the background once they are this close to
+# expiry, and before the request once they would expire while it is in flight.
+TOKEN_REFRESH_WINDOW = 300
+TOKEN_EXPIRY_MARGIN = REQUEST_TIMEOUT * 3
+# Per-host (burst, refill per second) budgets. One polling cycle with several
+# active orders and venue sensors fits the burst; sustained traffic is capped at
+# one request every two seconds per host. Token refreshes are rare by design.
+RATE_LIMIT = (10.0, 0.5)
+HOST_RATE_LIMITS = {urlsplit(REFRESH_URL).hostname or "": (3.0, 1 / 60)}
+# Requests wait locally for a token for at most this long before failing fast.
+MAX_RATE_LIMIT_DELAY = REQUEST_TIMEOUT
+# Venue pages share the consumer-api budget with the orders page but never
+# borrow from it. They wait, one at a time, until this many requests would
+# still be left, so a long venue cycle cannot delay an order poll.
+BACKGROUND_HEADROOM = 2.0
+# Cool-down applied after a 429 that carries no usable Retry-After header.
+DEFAULT_RETRY_AFTER = 60.0
+# Dedicated connection pool tuning. Idle connections outlive the 30-second active
+# polling interval, so consecutive polls reuse one TLS session per host.
+CONNECTION_LIMIT = 12
+CONNECTION_LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+# Validators are kept for the orders page, a few purchase-tracking URLs and the
+# configured venues. Older entries are evicted first.
+CONDITIONAL_CACHE_SIZE = 64
+
+# Stable endpoint names for statistics. Venue slugs and purchase IDs never become
+# keys, which keeps diagnostics private and per-endpoint memory bounded.
+ENDPOINTS = (
+    ("orders", ACTIVE_ORDERS_URL),
+    ("order_details", ORDER_DETAILS_URL.partition("{")[0]),
+    ("venue", VENUE_CONTENT_URL.partition("{")[0]),
+    ("token_refresh", REFRESH_URL),
+)
 
 TokenUpdateCallback = Callable[[str, str], Awaitable[None] | None]
+RequestKey = tuple[str, str, bool]
 
 
-def is_active_order(order: dict[str, Any]) -> bool:
-    """Return whether an order-list item represents a trackable active order."""
-    if "telemetry" in order:
-        telemetry = order["telemetry"]
-        status_type = (
-            telemetry.get("order_status_type") if isinstance(telemetry, dict) else None
-        )
-        # Current Wolt order-list payloads provide an authoritative telemetry
-        # object. Its absence from an otherwise present/malformed object must
-        # not reactivate an order through legacy CTA/text heuristics.
-        return str(status_type).upper() == "IN_PROGRESS"
-    if "order_status_type" in order:
-        # Older payloads occasionally exposed the same authoritative state at
-        # the top level instead of inside ``telemetry``.
-        return str(order["order_status_type"]).upper() == "IN_PROGRESS"
-
-    call_to_action = order.get("call_to_action")
-    if isinstance(call_to_action, dict):
-        action = call_to_action.get("link") or call_to_action.get("type")
-        if action and "ORDER_TRACKING" in str(action).upper():
-            return True
-
-    status = order.get("status")
-    if isinstance(status, dict):
-        status = status.get("value") or status.get("text") or status.get("label")
-    if not isinstance(status, str) or not status:
-        return False
-    return not any(
-        final_word in status.lower()
-        for final_word in ("delivered", "cancel", "failed", "refunded", "rejected")
+def create_session(ssl_context: ssl.SSLContext) -> aiohttp.ClientSession:
+    """Create a keep-alive session reserved for Wolt's consumer hosts.
+
+    The caller owns the session and must close it.
+    """
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_context,
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
     )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def endpoint_name(url: str) -> str:
+    """Return the statistics name of a Wolt endpoint URL."""
+    for name, prefix in ENDPOINTS:
+        if url.startswith(prefix):
+            return name
+    return "other"
+
+
+def token_expiry(token: str) -> float | None:
+    """Return a JWT's ``exp`` claim without verifying it, or None when opaque."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    segment = parts[1]
+    try:
+        claims = json.loads(
+            base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+        )
+    except ValueError:
+        return None
+    expiry = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(expiry, bool) or not isinstance(expiry, int | float):
+        return None
+    return float(expiry)
 
 
 class WoltApiError(Exception):
@@ -77,13 +134,51 @@ class WoltConnectionError(WoltApiError):
 
 
 class WoltRateLimitError(WoltConnectionError):
-    """Wolt rejected a request because its rate limit was reached."""
+    """Wolt rejected, or the local budget withheld, a rate-limited request."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message, status=status)
+        self.retry_after = retry_after
 
 
 class WoltInvalidPayloadError(WoltApiError):
     """Wolt returned JSON with an incompatible shape."""
 
 
+@dataclass(slots=True)
+class WoltCacheStats:
+    """Work avoided by conditional GET requests."""
+
+    conditional_requests: int = 0
+    not_modified_responses: int = 0
+    bytes_saved: int = 0
+    parses_saved: int = 0
+
+
+@dataclass(slots=True)
+class WoltTokenStats:
+    """How often the access token was refreshed, and why."""
+
+    reactive_refreshes: int = 0
+    proactive_refreshes: int = 0
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Validators and the parsed body of the last successful GET for one URL."""
+
+    etag: str | None
+    last_modified: str | None
+    payload: Any
+    size: int
+
+
 class WoltApi:
     """Asynchronous client for the Wolt endpoints used by this integration."""
 
@@ -95,13 +190,56 @@ class WoltApi:
         refresh_token: str,
         *,
         token_update_callback: TokenUpdateCallback | None = None,
+        rate_limiter: WoltRateLimiter | None = None,
+        base_url: str | None = None,
     ) -> None:
         self._session = session
+        self._base_url = urlsplit(base_url) if base_url is not None else None
         self._session_id = session_id
         self._access_token = access_token
         self._refresh_token = refresh_token
         self._token_update_callback = token_update_callback
         self._refresh_lock = asyncio.Lock()
+        self._background_lock = asyncio.Lock()
+        self._token_expiry: tuple[str, float | None] | None = None
+        self._background_refresh: asyncio.Task[None] | None = None
+        self._token_stats = WoltTokenStats()
+        self._in_flight: dict[RequestKey, asyncio.Task[Any]] = {}
+        self._response_cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._cache_stats = WoltCacheStats()
+        self._endpoint_stats: dict[str, EndpointStats] = {}
+        self._rate_limiter = (
+            rate_limiter
+            if rate_limiter is not None
+            else WoltRateLimiter(RATE_LIMIT, HOST_RATE_LIMITS)
+        )
+
+    @property
+    def cache_stats(self) -> WoltCacheStats:
+        """Return counters for requests answered with 304 Not Modified."""
+        return self._cache_stats
+
+    @property
+    def endpoint_stats(self) -> dict[str, EndpointStats]:
+        """Return request counters and latency histograms per used endpoint."""
+        return self._endpoint_stats
+
+    def latency_histogram(self) -> LatencyHistogram:
+        """Return one latency histogram across every endpoint."""
+        histogram = LatencyHistogram()
+        for stats in self._endpoint_stats.values():
+            histogram.merge(stats.latency)
+        return histogram
+
+    @property
+    def rate_limit_budget(self) -> dict[str, dict[str, Any]]:
+        """Return each Wolt host's immediate budget and any active cool-down."""
+        return self._rate_limiter.as_dict()
+
+    @property
+    def token_stats(self) -> WoltTokenStats:
+        """Return counters for 401-triggered and expiry-triggered refreshes."""
+        return self._token_stats
 
     @property
     def access_token(self) -> str:
@@ -113,6 +251,25 @@ class WoltApi:
         """Return the currently active refresh token."""
         return self._refresh_token
 
+    def _endpoint(self, url: str) -> str:
+        """Return where to send a request for ``url`` when a base URL is set.
+
+        The path and query are kept so one stand-in server can serve every Wolt
+        host. Rate-limit buckets and the response cache still use ``url``.
+        """
+        if self._base_url is None:
+            return url
+        base, parts = self._base_url, urlsplit(url)
+        return urlunsplit(
+            (
+                base.scheme,
+                base.netloc,
+                base.path.rstrip("/") + parts.path,
+                parts.query,
+                "",
+            )
+        )
+
     def _headers(self, *, authenticated: bool) -> dict[str, str]:
         """Build fresh request headers without mutating shared constants."""
         headers = dict(HEADERS)
@@ -129,38 +286,113 @@ class WoltApi:
         *,
         authenticated: bool,
         data: dict[str, str] | None = None,
+        background: bool = False,
     ) -> Any:
         """Perform one request and translate transport/status/payload failures."""
+        bucket = self._rate_limiter.bucket(urlsplit(url).hostname or "")
+        if background:
+            await self._reserve_spare(bucket)
+        else:
+            delay = bucket.reserve(MAX_RATE_LIMIT_DELAY)
+            if delay is None:
+                raise WoltRateLimitError(
+                    "Wolt request budget exhausted", retry_after=bucket.retry_after
+                )
+            if delay:
+                await asyncio.sleep(delay)
         headers = self._headers(authenticated=authenticated)
+        cached = self._response_cache.get(url) if method == "GET" else None
+        if cached is not None:
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
+            self._cache_stats.conditional_requests += 1
+        endpoint = self._endpoint(url)
+        name = endpoint_name(url)
+        if (stats := self._endpoint_stats.get(name)) is None:
+            stats = self._endpoint_stats[name] = EndpointStats()
+        stats.requests += 1
+        started = time.monotonic()
         try:
             async with asyncio.timeout(REQUEST_TIMEOUT):
                 if method == "POST":
-                    request = self._session.post(url, headers=headers, data=data)
+                    request = self._session.post(endpoint, headers=headers, data=data)
                 else:
-                    request = self._session.request(method, url, headers=headers)
+                    request = self._session.request(method, endpoint, headers=headers)
                 async with request as response:
+                    stats.record_status(response.status)
                     if response.status in (401, 403):
                         raise WoltAuthenticationError(
                             "Wolt rejected the supplied credentials",
                             status=response.status,
                         )
                     if response.status == 429:
-                        raise WoltRateLimitError("Wolt rate limit reached")
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        if retry_after is None:
+                            retry_after = DEFAULT_RETRY_AFTER
+                        bucket.penalize(retry_after)
+                        raise WoltRateLimitError(
+                            "Wolt rate limit reached",
+                            status=response.status,
+                            retry_after=retry_after,
+                        )
                     if response.status >= 400:
                         raise WoltConnectionError(
                             f"Wolt request failed with status {response.status}",
                             status=response.status,
                         )
+                    if response.status == 304 and cached is not None:
+                        # The cached object is shared with earlier callers; every
+                        # consumer treats Wolt payloads as read-only.
+                        self._response_cache.move_to_end(url)
+                        self._cache_stats.not_modified_responses += 1
+                        self._cache_stats.bytes_saved += cached.size
+                        self._cache_stats.parses_saved += 1
+                        return cached.payload
                     try:
-                        return await response.json()
+                        payload = await response.json()
                     except (aiohttp.ContentTypeError, TypeError, ValueError) as err:
                         raise WoltInvalidPayloadError(
                             "Wolt returned invalid JSON"
                         ) from err
+                    # ``json()`` already buffered the body, so this does not read
+                    # it again.
+                    size = len(await response.read())
+                    stats.bytes_received += size
+                    if method == "GET":
+                        self._store_validators(url, response, payload, size)
+                    return payload
         except WoltApiError, asyncio.CancelledError:
             raise
         except (TimeoutError, aiohttp.ClientError) as err:
+            if isinstance(err, TimeoutError):
+                stats.timeouts += 1
+            else:
+                stats.connection_errors += 1
             raise WoltConnectionError("Unable to connect to Wolt") from err
+        finally:
+            stats.latency.record(time.monotonic() - started)
+
+    def _store_validators(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse,
+        payload: Any,
+        size: int,
+    ) -> None:
+        """Remember a GET response that Wolt can later confirm with 304."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            self._response_cache.pop(url, None)
+            return
+        self._response_cache[url] = _CachedResponse(etag, last_modified, payload, size)
+        self._response_cache.move_to_end(url)
+        while len(self._response_cache) > CONDITIONAL_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
 
     async def _refresh_access_token(self) -> None:
         """Refresh credentials with Wolt's form-encoded web authentication flow."""
@@ -206,14 +438,124 @@ class WoltApi:
             if inspect.isawaitable(callback_result):
                 await callback_result
 
-    async def _request(self, method: str, url: str, *, auth: bool = True) -> Any:
-        """Request JSON, refreshing and retrying once only after an initial 401."""
+    async def _reserve_spare(self, bucket: TokenBucket) -> None:
+        """Wait in arrival order for a token that keeps headroom for polls.
+
+        There is no deadline: background requests take as long as the budget
+        needs, and fail only while Wolt's cool-down blocks the bucket.
+        """
+        async with self._background_lock:
+            while delay := bucket.reserve_spare(BACKGROUND_HEADROOM):
+                await asyncio.sleep(delay)
+            if delay is None:
+                raise WoltRateLimitError(
+                    "Wolt request budget exhausted", retry_after=bucket.retry_after
+                )
+
+    async def _request(
+        self, method: str, url: str, *, auth: bool = True, background: bool = False
+    ) -> Any:
+        """Request JSON, sharing one in-flight GET between concurrent callers.
+
+        ``background`` requests only spend budget that polls do not need.
+        """
+        if method != "GET":
+            return await self._request_with_refresh(method, url, auth=auth)
+
+        # Like ``_refresh_lock`` for token rotation, a manual refresh racing the
+        # scheduled poll must wait for the request already on the wire instead of
+        # sending an identical one. The shared task is shielded so that one
+        # cancelled caller never cancels the request for the others.
+        key: RequestKey = (method, url, auth)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_with_refresh(
+                    method, url, auth=auth, background=background
+                )
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._finish_in_flight, key))
+        return await asyncio.shield(task)
+
+    def _finish_in_flight(self, key: RequestKey, task: asyncio.Task[Any]) -> None:
+        """Forget a completed shared request so the next call reaches Wolt."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even when every waiter was cancelled.
+            task.exception()
+
+    def _access_token_expiry(self) -> float | None:
+        """Return the current token's expiry, decoding each token only once."""
+        if self._token_expiry is None or self._token_expiry[0] != self._access_token:
+            self._token_expiry = (
+                self._access_token,
+                token_expiry(self._access_token),
+            )
+        return self._token_expiry[1]
+
+    async def _refresh_before_expiry(self) -> None:
+        """Rotate a JWT access token before Wolt has to reject it."""
+        expiry = self._access_token_expiry()
+        if expiry is None:
+            # Opaque tokens keep the 401-driven refresh path.
+            return
+        remaining = expiry - time.time()
+        if remaining <= TOKEN_EXPIRY_MARGIN:
+            await self._refresh_expiring_token(self._access_token)
+        elif remaining <= TOKEN_REFRESH_WINDOW and self._background_refresh is None:
+            self._background_refresh = asyncio.create_task(
+                self._refresh_in_background(self._access_token)
+            )
+
+    async def _refresh_expiring_token(self, expiring_access_token: str) -> None:
+        """Refresh once unless a concurrent caller already rotated the token."""
+        async with self._refresh_lock:
+            if self._access_token == expiring_access_token:
+                await self._refresh_access_token()
+                self._token_stats.proactive_refreshes += 1
+
+    async def _refresh_in_background(self, expiring_access_token: str) -> None:
+        """Refresh a still-valid token without delaying the current request."""
+        try:
+            await self._refresh_expiring_token(expiring_access_token)
+        except WoltApiError as err:
+            # The token is still valid; a later 401 retries the refresh.
+            _LOGGER.debug("Proactive Wolt token refresh failed: %s", err)
+        finally:
+            self._background_refresh = None
+
+    async def async_close(self) -> None:
+        """Finish a token rotation in progress and cancel outstanding requests.
+
+        A rotation is awaited rather than cancelled: Wolt refresh tokens are
+        single use, so the new pair must reach the token callback before the
+        caller stops persisting it.
+        """
+        if (background_refresh := self._background_refresh) is not None:
+            await asyncio.gather(background_refresh, return_exceptions=True)
+        # Holding the lock keeps a request cancelled below from starting a
+        # rotation whose result could no longer be saved.
+        async with self._refresh_lock:
+            requests = list(self._in_flight.values())
+            for task in requests:
+                task.cancel()
+            await asyncio.gather(*requests, return_exceptions=True)
+
+    async def _request_with_refresh(
+        self, method: str, url: str, *, auth: bool = True, background: bool = False
+    ) -> Any:
+        """Request JSON, refreshing before JWT expiry or once after a 401."""
+        if auth:
+            await self._refresh_before_expiry()
         rejected_access_token = self._access_token
         try:
             return await self._perform_request(
                 method,
                 url,
                 authenticated=auth,
+                background=background,
             )
         except WoltAuthenticationError as err:
             if not auth or err.status != 401:
@@ -225,7 +567,34 @@ class WoltApi:
             # submitting the same single-use refresh token twice.
             if self._access_token == rejected_access_token:
                 await self._refresh_access_token()
-        return await self._perform_request(method, url, authenticated=True)
+                self._token_stats.reactive_refreshes += 1
+        return await self._perform_request(
+            method, url, authenticated=True, background=background
+        )
+
+    async def async_warm_up(self, url: str, connections: int = 1) -> None:
+        """Open keep-alive connections to ``url``'s host ahead of real requests.
+
+        Each connection is established with a credential-free ``HEAD`` request to
+        the host root. Failures are ignored; the real request reconnects anyway.
+        """
+        bucket = self._rate_limiter.bucket(urlsplit(url).hostname or "")
+        parts = urlsplit(self._endpoint(url))
+        origin = f"{parts.scheme}://{parts.netloc}/"
+
+        async def open_connection() -> None:
+            if bucket.reserve(0) is None:
+                return
+            try:
+                async with (
+                    asyncio.timeout(REQUEST_TIMEOUT),
+                    self._session.head(origin, headers=dict(HEADERS)),
+                ):
+                    pass
+            except (TimeoutError, aiohttp.ClientError) as err:
+                _LOGGER.debug("Unable to pre-open a Wolt connection: %s", err)
+
+        await asyncio.gather(*(open_connection() for _ in range(connections)))
 
     async def fetch_orders(self) -> list[dict[str, Any]]:
         """Fetch the account's order page, including recent completed orders."""
@@ -253,11 +622,12 @@ class WoltApi:
         raise WoltInvalidPayloadError("Wolt order details payload is invalid")
 
     async def fetch_venue_details(self, slug: str) -> dict[str, Any]:
-        """Fetch public venue details without sending account credentials."""
+        """Fetch public venue details without credentials, on spare budget."""
         data = await self._request(
             "GET",
             VENUE_CONTENT_URL.format(quote(slug, safe="")),
             auth=False,
+            background=True,
         )
         if not isinstance(data, dict):
             raise WoltInvalidPayloadError("Wolt venue payload is invalid")
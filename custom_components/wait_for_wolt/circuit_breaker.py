@@ -0,0 +1,106 @@
+"""Home Assistant-independent circuit breaker for optional Wolt endpoints."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+
+class CircuitState(StrEnum):
+    """Whether requests to a guarded endpoint are currently attempted."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling a failing endpoint, probing again after exponential cool-down.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. Once the
+    cool-down elapses, exactly one probe request is allowed; its success closes
+    the breaker and its failure reopens it with twice the previous cool-down.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        cooldown: float,
+        max_cooldown: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._base_cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._cooldown = cooldown
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, moving from open to half-open when due."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._cooldown
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent, reserving the half-open probe."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker and reset its cool-down."""
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._cooldown = self._base_cooldown
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening or reopening the breaker when due."""
+        self._consecutive_failures += 1
+        if self._state is CircuitState.HALF_OPEN:
+            self._cooldown = min(self._cooldown * 2, self._max_cooldown)
+            self._open()
+        elif (
+            self._state is CircuitState.CLOSED
+            and self._consecutive_failures >= self._failure_threshold
+        ):
+            self._open()
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Return an unused probe after a result that proves nothing."""
+        self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-safe summary for diagnostics."""
+        state = self.state
+        retry_in = (
+            max(0.0, self._cooldown - (self._clock() - self._opened_at))
+            if state is CircuitState.OPEN
+            else 0.0
+        )
+        return {
+            "state": state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "cooldown_seconds": round(self._cooldown, 1),
+            "retry_in_seconds": round(retry_in, 1),
+        }
@@ -0,0 +1,209 @@
+"""Home Assistant-independent one-pass classification of Wolt order payloads."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+
+# Wolt reuses a small set of status strings, so classifications are memoized.
+STATUS_CACHE_SIZE = 256
+# Polls repeat the same ETA strings until Wolt revises the estimate.
+ETA_CACHE_SIZE = 64
+# Nested ETA objects are searched this many levels deep, which bounds the work
+# a hostile payload can cause to a few hundred values.
+MAX_ETA_DEPTH = 3
+# Longer strings cannot be ISO 8601 timestamps and are neither parsed nor cached.
+MAX_ETA_LENGTH = 40
+_ETA_KEYS = ("delivery_eta", "estimated_delivery_time", "eta")
+_ETA_OBJECT_KEYS = ("value", "timestamp", "max", "end")
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+# Legacy status text of orders that are no longer trackable.
+_LEGACY_FINAL_STATUS = re.compile("delivered|cancel|failed|refunded|rejected")
+# Display text that contradicts an IN_PROGRESS telemetry status.
+_FINAL_DISPLAY_STATUS = re.compile(
+    "delivered|completed|finished|cancel|fail|reject|refund"
+)
+# Normalized statuses and their tokens, highest precedence first. A status
+# containing tokens of several groups takes the earliest group.
+_STATUS_TOKENS = (
+    ("cancelled", ("cancel", "refunded")),
+    ("failed", ("fail", "reject", "declin")),
+    ("delivered", ("delivered", "completed", "finished")),
+    ("arriving", ("arriv", "nearby", "almost_there")),
+    ("on_the_way", ("on_the_way", "en_route", "courier_delivery", "delivery")),
+    ("picked_up", ("picked_up", "courier_pickup")),
+    ("ready_for_pickup", ("ready", "awaiting_pickup")),
+    ("preparing", ("prepar", "production", "restaurant")),
+    ("pending", ("pending", "received", "created", "in_progress", "accepted")),
+)
+_STATUS_PRECEDENCE = {status: rank for rank, (status, _) in enumerate(_STATUS_TOKENS)}
+# At one position the alternation prefers the group with the highest precedence;
+# searching again from the next position also finds overlapping tokens.
+_STATUS_MATCHER = re.compile(
+    "|".join(f"(?P<{status}>{'|'.join(tokens)})" for status, tokens in _STATUS_TOKENS)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class OrderClassification:
+    """What one order payload says about the order's state."""
+
+    active: bool
+    raw_status: str | None
+    status: str
+    eta: datetime | None
+
+
+def classify_order(order: dict[str, Any]) -> OrderClassification:
+    """Read the activity, status, and ETA of an order payload in one pass.
+
+    Telemetry, or the older top-level ``order_status_type``, is authoritative.
+    Only payloads without either fall back to the tracking call to action and
+    the status text.
+    """
+    authoritative = True
+    status_type: Any = None
+    if "telemetry" in order:
+        telemetry = order["telemetry"]
+        if isinstance(telemetry, dict):
+            status_type = telemetry.get("order_status_type")
+    elif "order_status_type" in order:
+        status_type = order["order_status_type"]
+    else:
+        authoritative = False
+
+    status = order.get("status")
+    if isinstance(status, dict):
+        status = status.get("value") or status.get("text") or status.get("label")
+
+    if not authoritative:
+        raw_status = str(status) if status is not None else None
+        active = _has_tracking_action(order) or (
+            isinstance(status, str)
+            and bool(status)
+            and _LEGACY_FINAL_STATUS.search(status.lower()) is None
+        )
+    elif str(status_type).upper() != "IN_PROGRESS":
+        raw_status = str(status_type) if status_type is not None else None
+        active = False
+    else:
+        # Display text claiming a final state is stale while telemetry still
+        # reports the order in progress.
+        if status is None or _is_final_display_status(str(status)):
+            status = status_type
+        raw_status = str(status)
+        active = True
+
+    return OrderClassification(
+        active=active,
+        raw_status=raw_status,
+        status=classify_order_status(raw_status) if raw_status else "unknown",
+        eta=extract_order_eta(order),
+    )
+
+
+def is_active_order(order: dict[str, Any]) -> bool:
+    """Return whether an order-list item represents a trackable active order."""
+    return classify_order(order).active
+
+
+def normalize_order_status(order: dict[str, Any]) -> str:
+    """Map unstable Wolt status text to a fixed Home Assistant enum."""
+    return classify_order(order).status
+
+
+def _has_tracking_action(order: dict[str, Any]) -> bool:
+    """Return whether a legacy order links to its tracking page."""
+    call_to_action = order.get("call_to_action")
+    if not isinstance(call_to_action, dict):
+        return False
+    action = call_to_action.get("link") or call_to_action.get("type")
+    return bool(action) and "ORDER_TRACKING" in str(action).upper()
+
+
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def _is_final_display_status(status: str) -> bool:
+    """Return whether display text claims the order has finished."""
+    value = _NON_ALPHANUMERIC.sub("_", status.lower())
+    return _FINAL_DISPLAY_STATUS.search(value) is not None
+
+
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def classify_order_status(raw: str) -> str:
+    """Map one raw Wolt status string to the Home Assistant enum."""
+    value = _NON_ALPHANUMERIC.sub("_", raw.casefold())
+    best = len(_STATUS_TOKENS)
+    position = 0
+    while (match := _STATUS_MATCHER.search(value, position)) is not None:
+        best = min(best, _STATUS_PRECEDENCE[match.lastgroup])
+        if best == 0:
+            break
+        position = match.start() + 1
+    return _STATUS_TOKENS[best][0] if best < len(_STATUS_TOKENS) else "unknown"
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """Parse an explicit timestamp without guessing from duration text.
+
+    Nested objects are searched iteratively, depth first in key order, and at
+    most ``MAX_ETA_DEPTH`` levels deep.
+    """
+    pending = [(value, 0)]
+    while pending:
+        value, depth = pending.pop()
+        if isinstance(value, str):
+            if (parsed := _parse_eta_string(value)) is not None:
+                return parsed
+        elif isinstance(value, dict):
+            if depth < MAX_ETA_DEPTH:
+                pending.extend(
+                    (value[key], depth + 1)
+                    for key in reversed(_ETA_OBJECT_KEYS)
+                    if key in value
+                )
+        elif (parsed := _parse_eta_epoch(value)) is not None:
+            return parsed
+    return None
+
+
+def _parse_eta_epoch(value: Any) -> datetime | None:
+    """Parse a Unix timestamp in seconds or milliseconds."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    timestamp = value / 1000 if value > 10_000_000_000 else value
+    # Explicit ETAs must be plausible wall-clock timestamps. Small values
+    # are durations/range bounds, not Unix timestamps.
+    if not 1_577_836_800 <= timestamp <= 4_102_444_800:
+        return None
+    try:
+        return datetime.fromtimestamp(timestamp, UTC)
+    except OSError, OverflowError, ValueError:
+        return None
+
+
+def _parse_eta_string(value: str) -> datetime | None:
+    """Parse an aware ISO 8601 timestamp, memoizing strings of plausible length."""
+    if len(value) > MAX_ETA_LENGTH:
+        return None
+    return _parse_iso_timestamp(value)
+
+
+@lru_cache(maxsize=ETA_CACHE_SIZE)
+def _parse_iso_timestamp(value: str) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else None
+
+
+def extract_order_eta(order: dict[str, Any]) -> datetime | None:
+    """Extract the first explicit timestamp-shaped ETA."""
+    for key in _ETA_KEYS:
+        if (parsed := parse_timestamp(order.get(key))) is not None:
+            return parsed
+    return None
@@ -5,6 +5,10 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     TextSelector,
     TextSelectorConfig,
     TextSelectorType,
@@ -12,21 +16,73 @@ from homeassistant.helpers.selector import (
 
 from .const import (
     CONF_BEARER_TOKEN,
+    CONF_DEDICATED_SESSION,
+    CONF_DETAIL_CONCURRENCY,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_ORDER_RETENTION,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_ID,
     CONF_VENUE_IDS,
+    CONF_VENUE_OPENING_HOURS,
+    DEFAULT_DETAIL_CONCURRENCY,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_ORDER_RETENTION,
     DOMAIN,
+    MAX_DETAIL_CONCURRENCY,
 )
 
 SECRET_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
 REQUIRED_SECRET = vol.All(SECRET_SELECTOR, vol.Length(min=1))
+DETAIL_CONCURRENCY_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            min=1, max=MAX_DETAIL_CONCURRENCY, step=1, mode=NumberSelectorMode.BOX
+        )
+    ),
+    vol.Coerce(int),
+)
+
+
+def _poll_interval_selector(minimum: int, maximum: int) -> vol.All:
+    """Return a whole-second interval field."""
+    return vol.All(
+        NumberSelector(
+            NumberSelectorConfig(
+                min=minimum,
+                max=maximum,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            )
+        ),
+        vol.Coerce(int),
+    )
+
+
+# Wolt is never polled faster than the original 30-second active interval.
+MIN_POLL_INTERVAL_SELECTOR = _poll_interval_selector(30, 300)
+MAX_POLL_INTERVAL_SELECTOR = _poll_interval_selector(60, 1800)
+ORDER_RETENTION_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            min=1,
+            max=720,
+            step=1,
+            mode=NumberSelectorMode.BOX,
+            unit_of_measurement="h",
+        )
+    ),
+    vol.Coerce(int),
+)
 
 
 class WoltConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Wait for Wolt."""
 
-    VERSION = 1
+    VERSION = 2
 
     DATA_SCHEMA = vol.Schema(
         {
@@ -116,14 +172,37 @@ class WoltOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
     """Handle option flows for the integration."""
 
     async def async_step_init(self, user_input=None):
-        if user_input is not None:
+        errors = {}
+        if user_input is not None and user_input.get(
+            CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+        ) > user_input.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL):
+            errors["base"] = "invalid_poll_bounds"
+        elif user_input is not None:
             venue_ids = [
                 v.strip()
                 for v in user_input.get(CONF_VENUE_IDS, "").split("\n")
                 if v.strip()
             ]
 
-            options = {CONF_VENUE_IDS: venue_ids}
+            options = {
+                CONF_VENUE_IDS: venue_ids,
+                CONF_VENUE_OPENING_HOURS: user_input.get(
+                    CONF_VENUE_OPENING_HOURS, True
+                ),
+                CONF_DETAIL_CONCURRENCY: user_input.get(
+                    CONF_DETAIL_CONCURRENCY, DEFAULT_DETAIL_CONCURRENCY
+                ),
+                CONF_DEDICATED_SESSION: user_input.get(CONF_DEDICATED_SESSION, False),
+                CONF_MIN_POLL_INTERVAL: user_input.get(
+                    CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                ),
+                CONF_MAX_POLL_INTERVAL: user_input.get(
+                    CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                ),
+                CONF_ORDER_RETENTION: user_input.get(
+                    CONF_ORDER_RETENTION, DEFAULT_ORDER_RETENTION
+                ),
+            }
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
                 data={
@@ -157,6 +236,42 @@ class WoltOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                 vol.Optional(CONF_VENUE_IDS, default=current): TextSelector(
                     {"multiline": True}
                 ),
+                vol.Optional(
+                    CONF_VENUE_OPENING_HOURS,
+                    default=self.config_entry.options.get(
+                        CONF_VENUE_OPENING_HOURS, True
+                    ),
+                ): BooleanSelector(),
+                vol.Optional(
+                    CONF_DETAIL_CONCURRENCY,
+                    default=self.config_entry.options.get(
+                        CONF_DETAIL_CONCURRENCY, DEFAULT_DETAIL_CONCURRENCY
+                    ),
+                ): DETAIL_CONCURRENCY_SELECTOR,
+                vol.Optional(
+                    CONF_DEDICATED_SESSION,
+                    default=self.config_entry.options.get(
+                        CONF_DEDICATED_SESSION, False
+                    ),
+                ): BooleanSelector(),
+                vol.Optional(
+                    CONF_MIN_POLL_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                    ),
+                ): MIN_POLL_INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_MAX_POLL_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                    ),
+                ): MAX_POLL_INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_ORDER_RETENTION,
+                    default=self.config_entry.options.get(
+                        CONF_ORDER_RETENTION, DEFAULT_ORDER_RETENTION
+                    ),
+                ): ORDER_RETENTION_SELECTOR,
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
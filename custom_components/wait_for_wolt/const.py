@@ -6,8 +6,22 @@ CONF_SESSION_ID = "session_id"
 CONF_BEARER_TOKEN = "bearer_token"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_VENUE_IDS = "venue_ids"
+CONF_DETAIL_CONCURRENCY = "detail_concurrency"
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_ORDER_RETENTION = "order_retention"
+CONF_VENUE_OPENING_HOURS = "venue_opening_hours"
 
 DEFAULT_NAME = "Wolt Order"
+# Rich tracking details are fetched one order at a time unless the user opts in.
+DEFAULT_DETAIL_CONCURRENCY = 1
+MAX_DETAIL_CONCURRENCY = 5
+# Adaptive order polling stays within these user-adjustable bounds, in seconds.
+DEFAULT_MIN_POLL_INTERVAL = 30
+DEFAULT_MAX_POLL_INTERVAL = 300
+# Hours that a finished order keeps its entities and device.
+DEFAULT_ORDER_RETENTION = 24
 
 REFRESH_URL = "https://authentication.wolt.com/v1/wauth2/access_token"
 # Updated endpoints based on the current Wolt web client
@@ -2,38 +2,127 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryAuthFailed
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
+    KEEPALIVE_TIMEOUT,
     WoltApi,
+    WoltApiError,
     WoltAuthenticationError,
     WoltConnectionError,
     WoltInvalidPayloadError,
     WoltRateLimitError,
-    is_active_order,
 )
-from .const import DOMAIN
+from .circuit_breaker import CircuitBreaker
+from .classifier import OrderClassification, classify_order
+from .const import (
+    CONF_DEDICATED_SESSION,
+    CONF_DETAIL_CONCURRENCY,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_VENUE_OPENING_HOURS,
+    DEFAULT_DETAIL_CONCURRENCY,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DOMAIN,
+    ORDER_DETAILS_URL,
+)
+from .models import WoltOrder, WoltVenue
+from .scheduler import PollScheduler, VenuePollScheduler
+from .snapshot import WoltSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
-ACTIVE_UPDATE_INTERVAL = timedelta(seconds=30)
-IDLE_UPDATE_INTERVAL = timedelta(minutes=5)
+# Default bounds of the adaptive order schedule: the fastest rate used near
+# delivery and the slowest used while no order is active.
+ACTIVE_UPDATE_INTERVAL = timedelta(seconds=DEFAULT_MIN_POLL_INTERVAL)
+IDLE_UPDATE_INTERVAL = timedelta(seconds=DEFAULT_MAX_POLL_INTERVAL)
+# Stop calling the optional purchase-tracking endpoint after repeated failures,
+# probing it again after a cool-down that doubles while it keeps failing.
+DETAIL_FAILURE_THRESHOLD = 3
+DETAIL_COOLDOWN = timedelta(minutes=1)
+DETAIL_MAX_COOLDOWN = timedelta(minutes=30)
+# Public venue pages are polled conservatively, a few at a time, because they
+# share the consumer host's request budget with order polling.
+VENUE_UPDATE_INTERVAL = timedelta(minutes=5)
+VENUE_CONCURRENCY = 4
+# Venues due within this window of a cycle are fetched in that cycle.
+VENUE_DUE_WINDOW = timedelta(minutes=1)
+# Listener context notified when a poll discovers order IDs not seen before.
+# Listeners with an order ID as context hear only about that order; listeners
+# without a context hear about every poll.
+NEW_ORDERS = object()
 
 
 @dataclass(frozen=True, slots=True)
 class WoltCoordinatorData:
-    """One coherent snapshot of account orders and active-order details."""
+    """One coherent snapshot of parsed account orders."""
 
-    orders: dict[str, dict[str, Any]]
+    orders: dict[str, WoltOrder]
     active_order_ids: frozenset[str]
-    details: dict[str, dict[str, Any]]
+    detailed_order_ids: frozenset[str]
+    # Loaded from the stored snapshot and not yet confirmed by a live refresh.
+    restored: bool = False
+
+    @classmethod
+    def from_payloads(
+        cls,
+        orders: dict[str, dict[str, Any]],
+        active_order_ids: frozenset[str],
+        details: dict[str, dict[str, Any]],
+        classified: Mapping[str, OrderClassification] | None = None,
+    ) -> WoltCoordinatorData:
+        """Parse raw order summaries and rich details into one snapshot.
+
+        ``classified`` holds the summaries' classifications from active-order
+        discovery, which orders without rich details reuse.
+        """
+        classified = classified or {}
+        return cls(
+            {
+                order_id: WoltOrder.from_payload(
+                    order_id,
+                    summary,
+                    details.get(order_id),
+                    active=order_id in active_order_ids,
+                    classification=classified.get(order_id),
+                )
+                for order_id, summary in orders.items()
+            },
+            active_order_ids,
+            frozenset(details),
+        )
+
+    @classmethod
+    def from_restored(cls, orders: dict[str, WoltOrder]) -> WoltCoordinatorData:
+        """Wrap orders restored from storage until the first live refresh."""
+        return cls(
+            orders,
+            frozenset(order_id for order_id, order in orders.items() if order.active),
+            frozenset(),
+            restored=True,
+        )
+
+    def changed_order_ids(self, previous: WoltCoordinatorData | None) -> frozenset[str]:
+        """Return IDs added, removed, or changed since ``previous``."""
+        if previous is None:
+            return frozenset(self.orders)
+        old, new = previous.orders, self.orders
+        return frozenset(old.keys() ^ new.keys()) | frozenset(
+            order_id
+            for order_id, order in new.items()
+            if order_id in old and old[order_id] != order
+        )
 
 
 class WoltDataUpdateCoordinator(DataUpdateCoordinator[WoltCoordinatorData]):
@@ -44,57 +133,212 @@ class WoltDataUpdateCoordinator(DataUpdateCoordinator[WoltCoordinatorData]):
         hass: HomeAssistant,
         entry: ConfigEntry,
         api: WoltApi,
+        snapshot_store: WoltSnapshotStore | None = None,
     ) -> None:
         """Initialize the coordinator at the conservative idle interval."""
+        self.scheduler = PollScheduler(
+            min_interval=timedelta(
+                seconds=entry.options.get(
+                    CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                )
+            ),
+            max_interval=timedelta(
+                seconds=entry.options.get(
+                    CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                )
+            ),
+        )
         super().__init__(
             hass,
             _LOGGER,
             config_entry=entry,
             name=DOMAIN,
-            update_interval=IDLE_UPDATE_INTERVAL,
+            update_interval=self.scheduler.max_interval,
         )
         self.api = api
+        self._snapshot_store = snapshot_store
+        self._detail_concurrency = max(
+            1,
+            int(entry.options.get(CONF_DETAIL_CONCURRENCY, DEFAULT_DETAIL_CONCURRENCY)),
+        )
+        self._warm_up_connections = bool(
+            entry.options.get(CONF_DEDICATED_SESSION, False)
+        )
+        self.detail_breaker = CircuitBreaker(
+            failure_threshold=DETAIL_FAILURE_THRESHOLD,
+            cooldown=DETAIL_COOLDOWN.total_seconds(),
+            max_cooldown=DETAIL_MAX_COOLDOWN.total_seconds(),
+        )
         self._rich_tracking_warning_logged = False
+        self._listeners_by_context: dict[Any, list[CALLBACK_TYPE]] = {}
+        # Contexts to notify for the snapshot being published; None means all.
+        self._changed_contexts: frozenset[Any] | None = None
+        self._notified_success: bool | None = None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates, indexed by order ID or ``NEW_ORDERS`` context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        listeners = self._listeners_by_context.setdefault(context, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            listeners.remove(update_callback)
+            if not listeners and self._listeners_by_context.get(context) is listeners:
+                del self._listeners_by_context[context]
+
+        return remove
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners of changed orders, or everyone on availability change."""
+        contexts, self._changed_contexts = self._changed_contexts, None
+        if contexts is None or self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        for context in (None, *contexts):
+            for update_callback in list(self._listeners_by_context.get(context, ())):
+                update_callback()
 
     async def _async_update_data(self) -> WoltCoordinatorData:
         """Fetch orders and details, translating failures for Home Assistant."""
+        previous = self.data
         try:
-            raw_orders = await self.api.fetch_orders()
+            if (
+                self._warm_up_connections
+                and previous is not None
+                and previous.active_order_ids
+                and self.update_interval is not None
+                and self.update_interval.total_seconds() > KEEPALIVE_TIMEOUT
+            ):
+                # The restaurant-api connection has expired since the last poll.
+                # Open the connections this cycle's detail requests will share
+                # while the orders page is fetched, off the critical path.
+                raw_orders, _ = await asyncio.gather(
+                    self.api.fetch_orders(),
+                    self.api.async_warm_up(
+                        ORDER_DETAILS_URL,
+                        min(self._detail_concurrency, len(previous.active_order_ids)),
+                    ),
+                )
+            else:
+                raw_orders = await self.api.fetch_orders()
             orders = {
                 order_id: order
                 for order in raw_orders
                 if (order_id := self.order_id(order)) is not None
             }
+            classified = {
+                order_id: classify_order(order) for order_id, order in orders.items()
+            }
             active_order_ids = frozenset(
-                order_id for order_id, order in orders.items() if is_active_order(order)
+                order_id
+                for order_id, classification in classified.items()
+                if classification.active
+            )
+            details, rich_tracking_failed = await self._async_fetch_details(
+                sorted(active_order_ids)
             )
-            details: dict[str, dict[str, Any]] = {}
-            rich_tracking_failed = False
-            # Orders are normally singular. Keep requests sequential to avoid bursts
-            # against Wolt's unofficial consumer endpoints.
-            for order_id in sorted(active_order_ids):
-                try:
-                    details[order_id] = await self.api.fetch_order_details(order_id)
-                except WoltAuthenticationError, WoltRateLimitError:
-                    raise
-                except WoltConnectionError, WoltInvalidPayloadError:
-                    # The summary remains useful while the optional rich endpoint
-                    # is unavailable or has not populated a newly placed order.
-                    rich_tracking_failed = True
             if rich_tracking_failed and not self._rich_tracking_warning_logged:
                 _LOGGER.warning("Rich Wolt order tracking details are unavailable")
             self._rich_tracking_warning_logged = rich_tracking_failed
         except WoltAuthenticationError as err:
             raise ConfigEntryAuthFailed("Wolt authentication failed") from err
         except WoltRateLimitError as err:
-            raise UpdateFailed("Wolt rate limit reached") from err
+            # Wait out Wolt's cool-down instead of polling again next interval.
+            raise UpdateFailed(
+                "Wolt rate limit reached", retry_after=err.retry_after
+            ) from err
         except (WoltConnectionError, WoltInvalidPayloadError) as err:
             raise UpdateFailed("Unable to update Wolt orders") from err
 
-        self.update_interval = (
-            ACTIVE_UPDATE_INTERVAL if active_order_ids else IDLE_UPDATE_INTERVAL
+        data = WoltCoordinatorData.from_payloads(
+            orders, active_order_ids, details, classified
         )
-        return WoltCoordinatorData(orders, active_order_ids, details)
+        self.update_interval = self.scheduler.next_interval(
+            data.orders.values(), dt_util.utcnow()
+        )
+        if previous is None or previous.restored:
+            # Replace every value, including restored ones shown as stale.
+            self._changed_contexts = None
+        else:
+            changed = data.changed_order_ids(previous)
+            # Entities exist only for active orders, so an already-listed order
+            # that becomes active, such as a scheduled one, needs them too.
+            if (
+                not orders.keys() <= previous.orders.keys()
+                or not active_order_ids <= previous.active_order_ids
+            ):
+                changed |= {NEW_ORDERS}
+            self._changed_contexts = changed
+        if self._snapshot_store is not None and (
+            self._changed_contexts is None or self._changed_contexts
+        ):
+            self._snapshot_store.async_save(data.orders)
+        return data
+
+    async def _async_fetch_details(
+        self, order_ids: list[str]
+    ) -> tuple[dict[str, dict[str, Any]], bool]:
+        """Fetch rich details for active orders, at most N requests at a time."""
+        fetched: dict[str, dict[str, Any]] = {}
+        rich_tracking_failed = False
+        # Orders are normally singular. The default of one request at a time keeps
+        # group or simultaneous orders from bursting against Wolt's unofficial
+        # consumer endpoints; the semaphore wakes waiters in sorted order.
+        semaphore = asyncio.Semaphore(self._detail_concurrency)
+
+        async def fetch(order_id: str) -> None:
+            nonlocal rich_tracking_failed
+            async with semaphore:
+                if not self.detail_breaker.allow_request():
+                    # Serve the summary only until the cool-down allows a probe.
+                    rich_tracking_failed = True
+                    return
+                try:
+                    fetched[order_id] = await self.api.fetch_order_details(order_id)
+                except WoltAuthenticationError, WoltRateLimitError:
+                    raise
+                except WoltConnectionError as err:
+                    # The summary remains useful while the optional rich endpoint
+                    # is unavailable. Only transport failures and server errors
+                    # count against the endpoint; a 4xx concerns this order.
+                    if err.status is None or err.status >= 500:
+                        self.detail_breaker.record_failure()
+                    rich_tracking_failed = True
+                except WoltInvalidPayloadError:
+                    # Wolt has not populated a newly placed order yet; the
+                    # endpoint itself answered.
+                    rich_tracking_failed = True
+                else:
+                    self.detail_breaker.record_success()
+                finally:
+                    # Aborted or cancelled requests say nothing about the endpoint.
+                    self.detail_breaker.release()
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for order_id in order_ids:
+                    group.create_task(fetch(order_id))
+        except ExceptionGroup as err:
+            # Abort the cycle with one typed error, as the sequential loop did.
+            raise next(
+                (
+                    error
+                    for error in err.exceptions
+                    if isinstance(error, WoltAuthenticationError)
+                ),
+                err.exceptions[0],
+            ) from None
+        details = {
+            order_id: fetched[order_id] for order_id in order_ids if order_id in fetched
+        }
+        return details, rich_tracking_failed
 
     @staticmethod
     def order_id(order: dict[str, Any]) -> str | None:
@@ -103,9 +347,99 @@ class WoltDataUpdateCoordinator(DataUpdateCoordinator[WoltCoordinatorData]):
         return str(value) if value else None
 
 
+class WoltVenueCoordinator(DataUpdateCoordinator[dict[str, WoltVenue]]):
+    """Fetch the configured public venue pages that are due in each cycle.
+
+    Each venue has its own next fetch time, so venues closed overnight are
+    skipped while open ones keep the regular interval. The coordinator wakes
+    for the earliest due venue.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: WoltApi,
+        slugs: Sequence[str],
+    ) -> None:
+        """Initialize the coordinator for the configured venue slugs."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"{DOMAIN} venues",
+            update_interval=VENUE_UPDATE_INTERVAL,
+        )
+        self.api = api
+        self.slugs = tuple(dict.fromkeys(slugs))
+        self.scheduler = VenuePollScheduler(
+            interval=VENUE_UPDATE_INTERVAL,
+            opening_hours=bool(entry.options.get(CONF_VENUE_OPENING_HOURS, True)),
+        )
+        self._next_fetch: dict[str, datetime] = {}
+
+    async def async_request_refresh(self) -> None:
+        """Fetch every venue on a requested refresh, not only the due ones."""
+        self._next_fetch.clear()
+        await super().async_request_refresh()
+
+    async def _async_update_data(self) -> dict[str, WoltVenue]:
+        """Fetch the venues that are due, keeping the ones that answered."""
+        now = dt_util.utcnow()
+        due = [
+            slug
+            for slug in self.slugs
+            if self._next_fetch.get(slug, now) <= now + VENUE_DUE_WINDOW
+        ]
+        venues: dict[str, WoltVenue] = {}
+        errors: list[WoltApiError] = []
+        semaphore = asyncio.Semaphore(VENUE_CONCURRENCY)
+
+        async def fetch(slug: str) -> None:
+            async with semaphore:
+                try:
+                    details = await self.api.fetch_venue_details(slug)
+                except WoltApiError as err:
+                    errors.append(err)
+                    return
+            venues[slug] = WoltVenue.from_payload(slug, details)
+
+        async with asyncio.TaskGroup() as group:
+            for slug in due:
+                group.create_task(fetch(slug))
+        for slug in due:
+            self._next_fetch[slug] = self.scheduler.next_fetch(venues.get(slug), now)
+        self.update_interval = max(
+            VENUE_DUE_WINDOW, min(self._next_fetch.values(), default=now) - now
+        )
+        previous = self.data or {}
+        for slug in self.slugs:
+            if slug not in due and slug in previous:
+                # Not due this cycle: keep the last fetched state.
+                venues[slug] = previous[slug]
+        if errors and not venues:
+            if rate_limited := next(
+                (err for err in errors if isinstance(err, WoltRateLimitError)), None
+            ):
+                raise UpdateFailed(
+                    "Wolt rate limit reached", retry_after=rate_limited.retry_after
+                ) from rate_limited
+            raise UpdateFailed("Unable to update Wolt venues") from errors[0]
+        if errors:
+            # Only the venues that did not answer become unavailable until their
+            # next fetch; the cycle fails when no venue is left to show.
+            _LOGGER.warning(
+                "Unable to update %s of %s configured Wolt venues",
+                len(errors),
+                len(self.slugs),
+            )
+        return {slug: venues[slug] for slug in self.slugs if slug in venues}
+
+
 @dataclass(slots=True)
 class WoltRuntimeData:
     """Runtime objects owned by one Wolt config entry."""
 
     api: WoltApi
     coordinator: WoltDataUpdateCoordinator
+    venue_coordinator: WoltVenueCoordinator | None = None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -31,6 +32,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return operational counts without order, courier, venue, or credential data."""
     del hass
+    api = entry.runtime_data.api
     coordinator = entry.runtime_data.coordinator
     data = coordinator.data
     interval = coordinator.update_interval
@@ -41,9 +43,19 @@ async def async_get_config_entry_diagnostics(
             "last_update_success": coordinator.last_update_success,
             "known_order_count": len(data.orders),
             "active_order_count": len(data.active_order_ids),
-            "rich_detail_count": len(data.details),
+            "rich_detail_count": len(data.detailed_order_ids),
             "update_interval_seconds": (
                 int(interval.total_seconds()) if interval is not None else None
             ),
+            "rich_tracking_circuit": coordinator.detail_breaker.as_dict(),
+        },
+        "api": {
+            "endpoints": {
+                name: stats.as_dict()
+                for name, stats in sorted(api.endpoint_stats.items())
+            },
+            "token_refreshes": asdict(api.token_stats),
+            "response_cache": asdict(api.cache_stats),
+            "rate_limit_budget": api.rate_limit_budget,
         },
     }
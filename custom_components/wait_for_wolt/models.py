@@ -0,0 +1,149 @@
+"""Parse-once order model shared by the coordinator and entities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .classifier import OrderClassification, classify_order, parse_timestamp
+
+
+@dataclass(frozen=True, slots=True)
+class WoltOrder:
+    """The fields of one Wolt purchase that the integration uses.
+
+    Built once per polling cycle from the order-page summary merged with any rich
+    tracking details; the raw payloads are not retained.
+    """
+
+    purchase_id: str
+    active: bool
+    raw_status: str | None
+    status: str
+    eta: datetime | None
+    venue_name: str | None
+
+    @classmethod
+    def from_payload(
+        cls,
+        purchase_id: str,
+        summary: dict[str, Any],
+        details: dict[str, Any] | None = None,
+        *,
+        active: bool,
+        classification: OrderClassification | None = None,
+    ) -> WoltOrder:
+        """Parse a summary and optional rich details, which take precedence.
+
+        ``classification`` of the summary alone is reused when there are no
+        details to merge, so the payload is not classified a second time.
+        """
+        order = {**summary, **details} if details else summary
+        if details or classification is None:
+            classification = classify_order(order)
+        venue = summary.get("venue")
+        venue_name = venue.get("name") if isinstance(venue, dict) else None
+        if not isinstance(venue_name, str):
+            venue_name = order.get("venue_name")
+        return cls(
+            purchase_id=purchase_id,
+            active=active,
+            raw_status=classification.raw_status,
+            status=classification.status,
+            eta=classification.eta,
+            venue_name=venue_name if isinstance(venue_name, str) else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WoltVenue:
+    """The public state of one configured venue, parsed once per polling cycle."""
+
+    slug: str
+    is_open: bool
+    next_open: datetime | None
+    next_close: datetime | None
+    attributes: dict[str, Any]
+    # Delivery-time estimates in minutes, such as ``homedelivery_estimate_min``.
+    estimates: dict[str, float]
+
+    @classmethod
+    def from_payload(cls, slug: str, details: dict[str, Any]) -> WoltVenue:
+        """Parse a venue page, without assuming optional metadata exists."""
+        venue = details.get("venue") or details.get("venue_info") or {}
+        open_info = venue.get("delivery_open_status") or venue.get("open_status") or {}
+
+        is_open = open_info.get("is_open")
+        if is_open is None:
+            is_open = venue.get("online")
+        if is_open is None:
+            is_open = venue.get("is_open")
+
+        # Extract numeric estimates for available delivery methods
+        estimates: dict[str, float] = {}
+        for cfg in venue.get("delivery_configs", []):
+            method = cfg.get("method")
+            estimate = cfg.get("estimate") or {}
+            if not method or not estimate:
+                continue
+            for bound in ("min", "max"):
+                value = estimate.get(bound)
+                if isinstance(value, int | float) and not isinstance(value, bool):
+                    estimates[f"{method}_estimate_{bound}"] = value
+
+        # Parse useful metadata from the header section
+        header = venue.get("header", {})
+        statuses = (
+            header.get("delivery_method_statuses", [])
+            if isinstance(header, dict)
+            else []
+        )
+        meta = (
+            statuses[0].get("metadata", [])
+            if statuses and isinstance(statuses[0], dict)
+            else []
+        )
+        rating = None
+        delivery_fee = None
+        service_fee = None
+        min_order_text = None
+        for item in meta:
+            icon = item.get("icon")
+            value = item.get("value")
+            if icon and icon.startswith("RATING"):
+                rating = value
+            elif icon == "CYCLIST":
+                delivery_fee = value
+            elif value and "Min. order" in value:
+                min_order_text = value
+            elif value and "Service fee" in value:
+                service_fee = value
+
+        banner_text = None
+        if venue.get("banners"):
+            banner = venue["banners"][0]
+            discount = banner.get("discount") or banner
+            banner_text = discount.get("formatted_text")
+
+        attributes = {
+            "online": venue.get("online"),
+            "open_status": open_info.get("value"),
+            "next_open": open_info.get("next_open"),
+            "next_close": open_info.get("next_close"),
+            "order_minimum": details.get("order_minimum"),
+            "is_venue_favourite": details.get("is_venue_favourite"),
+            "rating": rating,
+            "delivery_fee": delivery_fee,
+            "service_fee": service_fee,
+            "min_order_text": min_order_text,
+            "discount": banner_text,
+        }
+        return cls(
+            slug=slug,
+            is_open=bool(is_open),
+            next_open=parse_timestamp(open_info.get("next_open")),
+            next_close=parse_timestamp(open_info.get("next_close")),
+            attributes=attributes,
+            estimates=estimates,
+        )
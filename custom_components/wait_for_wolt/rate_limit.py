@@ -0,0 +1,149 @@
+"""Home Assistant-independent per-host request budgets for Wolt endpoints."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+Clock = Callable[[], float]
+
+
+def parse_retry_after(
+    value: str | None, *, now: datetime | None = None
+) -> float | None:
+    """Return a ``Retry-After`` header as seconds, accepting delta or HTTP date."""
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - (now or datetime.now(UTC))).total_seconds())
+
+
+class TokenBucket:
+    """Classic token bucket that can also be blocked for a server penalty."""
+
+    __slots__ = ("_blocked_until", "_clock", "_tokens", "_updated", "capacity", "rate")
+
+    def __init__(self, capacity: float, rate: float, *, clock: Clock) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _refill(self) -> float:
+        """Add the tokens earned since the last call and return the current time."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        return now
+
+    @property
+    def remaining(self) -> float:
+        """Return the requests that can be sent immediately."""
+        now = self._refill()
+        if now < self._blocked_until:
+            return 0.0
+        return max(0.0, self._tokens)
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds until the next request may be sent."""
+        now = self._refill()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-safe summary for diagnostics."""
+        now = self._refill()
+        cool_down = max(0.0, self._blocked_until - now)
+        return {
+            "remaining": round(self.remaining, 1),
+            "retry_in_seconds": round(self.retry_after, 1),
+            "cool_down_seconds": round(cool_down, 1),
+        }
+
+    def reserve(self, max_delay: float) -> float | None:
+        """Take one token, returning the wait before using it or None if denied."""
+        now = self._refill()
+        if now < self._blocked_until:
+            return None
+        delay = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        if delay > max_delay:
+            return None
+        # Borrowing below zero keeps concurrent waiters in arrival order.
+        self._tokens -= 1
+        return delay
+
+    def reserve_spare(self, headroom: float) -> float | None:
+        """Take one token only if ``headroom`` tokens are left for other requests.
+
+        Returns 0 once the token is taken, the wait before trying again
+        otherwise, or None while the bucket is blocked. Unlike ``reserve`` this
+        never borrows, so it never delays the requests that do.
+        """
+        now = self._refill()
+        if now < self._blocked_until:
+            return None
+        needed = 1 + min(headroom, self.capacity - 1) - self._tokens
+        if needed > 0:
+            return needed / self.rate
+        self._tokens -= 1
+        return 0.0
+
+    def penalize(self, seconds: float) -> None:
+        """Block the bucket for a server-imposed cool-down and drop its burst."""
+        now = self._refill()
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = min(self._tokens, 0.0)
+
+
+class WoltRateLimiter:
+    """Lazily created token buckets, one per Wolt host."""
+
+    def __init__(
+        self,
+        default: tuple[float, float],
+        overrides: Mapping[str, tuple[float, float]] | None = None,
+        *,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self._default = default
+        self._overrides = dict(overrides or {})
+        self._clock = clock
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Return the bucket that budgets requests to ``host``."""
+        if (bucket := self._buckets.get(host)) is None:
+            capacity, rate = self._overrides.get(host, self._default)
+            bucket = self._buckets[host] = TokenBucket(
+                capacity, rate, clock=self._clock
+            )
+        return bucket
+
+    def remaining_budget(self) -> dict[str, float]:
+        """Return the immediately available requests for every used host."""
+        return {host: bucket.remaining for host, bucket in self._buckets.items()}
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return every used host's budget and cool-down for diagnostics."""
+        return {
+            host: bucket.as_dict() for host, bucket in sorted(self._buckets.items())
+        }
@@ -0,0 +1,106 @@
+"""Retention window for the entities of finished Wolt orders."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Set
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .models import WoltOrder
+from .scheduler import FINISHED_STATUSES
+
+STORAGE_VERSION = 1
+# Finish times changing within this many seconds share one write.
+RETENTION_SAVE_DELAY = 60
+# Orders whose entities are removed per coordinator update, so the backlog of a
+# long-running installation is cleared without stalling the event loop.
+REMOVAL_BATCH_SIZE = 20
+
+
+class WoltOrderRetention:
+    """Remember when tracked orders finished and report those past retention.
+
+    An order counts as finished once its status is delivered, cancelled, or
+    failed, or once it no longer appears on Wolt's order page. Finish times are
+    stored so that restarts do not restart the window.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, retention: timedelta
+    ) -> None:
+        self.retention = retention
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.retention", private=True
+        )
+        self._finished_at: dict[str, datetime] = {}
+        self._dirty = False
+
+    async def async_load(self) -> None:
+        """Load the finish times stored by a previous run."""
+        stored = await self._store.async_load() or {}
+        for order_id, value in stored.get("finished_at", {}).items():
+            if (finished_at := dt_util.parse_datetime(value)) is not None:
+                self._finished_at[order_id] = finished_at
+
+    @callback
+    def async_expired(
+        self,
+        orders: Mapping[str, WoltOrder],
+        tracked_order_ids: Set[str],
+        now: datetime,
+    ) -> list[str]:
+        """Record finish times and return at most one batch of expired orders."""
+        changed = False
+        for order_id in self._finished_at.keys() - tracked_order_ids:
+            # Entities removed by other means no longer need a finish time.
+            del self._finished_at[order_id]
+            changed = True
+        expired: list[str] = []
+        for order_id in tracked_order_ids:
+            order = orders.get(order_id)
+            if order is not None and order.status not in FINISHED_STATUSES:
+                changed |= self._finished_at.pop(order_id, None) is not None
+                continue
+            if (finished_at := self._finished_at.get(order_id)) is None:
+                self._finished_at[order_id] = now
+                changed = True
+            elif now - finished_at >= self.retention:
+                expired.append(order_id)
+        if changed:
+            self._async_schedule_save()
+        return sorted(expired)[:REMOVAL_BATCH_SIZE]
+
+    @callback
+    def async_forget(self, order_ids: Iterable[str]) -> None:
+        """Drop the finish times of orders whose entities were removed."""
+        for order_id in order_ids:
+            self._finished_at.pop(order_id, None)
+        self._async_schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write pending finish times now, for example before a reload."""
+        if self._dirty:
+            await self._store.async_save(self._data())
+
+    async def async_remove(self) -> None:
+        """Delete the stored finish times."""
+        await self._store.async_remove()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._dirty = True
+        self._store.async_delay_save(self._data, RETENTION_SAVE_DELAY)
+
+    def _data(self) -> dict[str, Any]:
+        self._dirty = False
+        return {
+            "finished_at": {
+                order_id: finished_at.isoformat()
+                for order_id, finished_at in self._finished_at.items()
+            }
+        }
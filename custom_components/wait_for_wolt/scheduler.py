@@ -0,0 +1,90 @@
+"""Home Assistant-independent adaptive polling schedules for orders and venues."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import WoltOrder, WoltVenue
+
+# Statuses in which the courier, and so the ETA, moves from minute to minute.
+FAST_STATUSES = frozenset({"ready_for_pickup", "picked_up", "on_the_way", "arriving"})
+# Statuses after which Wolt has nothing more to report for an order.
+FINISHED_STATUSES = frozenset({"delivered", "cancelled", "failed"})
+# While an order is pending or preparing, poll a few times per remaining ETA
+# window so a revised estimate is noticed without polling every 30 seconds.
+POLLS_PER_ETA_WINDOW = 4
+# Poll at the fastest allowed rate this close to, or past, the ETA.
+NEAR_ETA = timedelta(minutes=5)
+# Pending or preparing orders without an ETA.
+PREPARING_INTERVAL = timedelta(minutes=2)
+# A venue closed until a known time is fetched this long before it opens.
+VENUE_OPENING_LEAD = timedelta(minutes=2)
+# Longest wait between fetches of a closed venue, in case its hours change.
+VENUE_SAFETY_INTERVAL = timedelta(hours=1)
+
+
+class PollScheduler:
+    """Pick the next order poll interval from status and time to ETA.
+
+    Each active order asks for an interval: the minimum while a courier is
+    involved or the ETA is near, a fraction of the remaining time while the
+    venue prepares it, and the maximum once it is finished. The most urgent
+    order wins, and the result is clamped to the configured bounds.
+    """
+
+    def __init__(self, *, min_interval: timedelta, max_interval: timedelta) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+
+    def next_interval(self, orders: Iterable[WoltOrder], now: datetime) -> timedelta:
+        """Return how long to wait before polling orders again."""
+        interval = self.max_interval
+        for order in orders:
+            if order.active:
+                interval = min(interval, self._order_interval(order, now))
+        return max(self.min_interval, interval)
+
+    def _order_interval(self, order: WoltOrder, now: datetime) -> timedelta:
+        if order.status in FINISHED_STATUSES:
+            return self.max_interval
+        if order.status in FAST_STATUSES:
+            return self.min_interval
+        if order.eta is None:
+            return PREPARING_INTERVAL
+        remaining = order.eta - now
+        if remaining <= NEAR_ETA:
+            return self.min_interval
+        return remaining / POLLS_PER_ETA_WINDOW
+
+
+class VenuePollScheduler:
+    """Pick when to fetch each venue next from its opening hours.
+
+    Open venues, and venues without known opening hours, are fetched every
+    ``interval``, plus once at a closing time that falls inside it. A venue
+    closed until a known time is fetched shortly before it opens and again at
+    the opening time, with a safety fetch at least every hour in between.
+    """
+
+    def __init__(self, *, interval: timedelta, opening_hours: bool = True) -> None:
+        self.interval = interval
+        self.opening_hours = opening_hours
+
+    def next_fetch(self, venue: WoltVenue | None, now: datetime) -> datetime:
+        """Return when to fetch a venue again; None means its fetch failed."""
+        regular = now + self.interval
+        if venue is None or not self.opening_hours:
+            return regular
+        if venue.is_open:
+            if venue.next_close is not None and now < venue.next_close < regular:
+                return venue.next_close
+            return regular
+        if venue.next_open is None or venue.next_open <= now:
+            return regular
+        wake = venue.next_open - VENUE_OPENING_LEAD
+        if wake <= now:
+            wake = venue.next_open
+        return min(wake, now + VENUE_SAFETY_INTERVAL)
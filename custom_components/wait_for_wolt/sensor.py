@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-import re
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -13,32 +14,37 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import CONF_NAME, EntityCategory, UnitOfTime
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .api import WoltApi, WoltApiError
+from .api import WoltApi
 from .const import (
     CONF_BEARER_TOKEN,
+    CONF_ORDER_RETENTION,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_ID,
     CONF_VENUE_IDS,
     DEFAULT_NAME,
+    DEFAULT_ORDER_RETENTION,
     DOMAIN,
 )
-from .coordinator import WoltDataUpdateCoordinator
+from .coordinator import NEW_ORDERS, WoltDataUpdateCoordinator, WoltVenueCoordinator
+from .models import WoltOrder, WoltVenue
+from .retention import WoltOrderRetention
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=5)
-
 ORDER_STATUS_OPTIONS = [
     "pending",
     "preparing",
@@ -66,110 +72,45 @@ ORDER_ETA_DESCRIPTION = SensorEntityDescription(
 )
 
 
-def _raw_status(order: dict[str, Any]) -> str | None:
-    """Extract a scalar status while respecting authoritative telemetry."""
-    status_type: Any = None
-    if "telemetry" in order:
-        telemetry = order["telemetry"]
-        status_type = (
-            telemetry.get("order_status_type") if isinstance(telemetry, dict) else None
-        )
-        if str(status_type).upper() != "IN_PROGRESS":
-            return str(status_type) if status_type is not None else None
-    elif "order_status_type" in order:
-        status_type = order["order_status_type"]
-        if str(status_type).upper() != "IN_PROGRESS":
-            return str(status_type) if status_type is not None else None
-
-    status = order.get("status")
-    if isinstance(status, dict):
-        status = status.get("value") or status.get("text") or status.get("label")
-    if status is None:
-        status = status_type
-    if str(status_type).upper() == "IN_PROGRESS" and status is not None:
-        display_status = re.sub(r"[^a-z0-9]+", "_", str(status).strip().lower()).strip(
-            "_"
-        )
-        if any(
-            token in display_status
-            for token in (
-                "delivered",
-                "completed",
-                "finished",
-                "cancel",
-                "fail",
-                "reject",
-                "refund",
-            )
-        ):
-            return str(status_type)
-    return str(status) if status is not None else None
-
-
-def normalize_order_status(order: dict[str, Any]) -> str:
-    """Map unstable Wolt status text to a fixed Home Assistant enum."""
-    raw = _raw_status(order)
-    if not raw:
-        return "unknown"
-    value = re.sub(r"[^a-z0-9]+", "_", raw.casefold()).strip("_")
-    if any(token in value for token in ("cancel", "refunded")):
-        return "cancelled"
-    if any(token in value for token in ("fail", "reject", "declin")):
-        return "failed"
-    if any(token in value for token in ("delivered", "completed", "finished")):
-        return "delivered"
-    if any(token in value for token in ("arriv", "nearby", "almost_there")):
-        return "arriving"
-    if any(
-        token in value
-        for token in ("on_the_way", "en_route", "courier_delivery", "delivery")
-    ):
-        return "on_the_way"
-    if any(token in value for token in ("picked_up", "courier_pickup")):
-        return "picked_up"
-    if any(token in value for token in ("ready", "awaiting_pickup")):
-        return "ready_for_pickup"
-    if any(token in value for token in ("prepar", "production", "restaurant")):
-        return "preparing"
-    if any(
-        token in value
-        for token in ("pending", "received", "created", "in_progress", "accepted")
-    ):
-        return "pending"
-    return "unknown"
-
-
-def _parse_eta(value: Any) -> datetime | None:
-    """Parse an ETA without guessing from human-readable duration text."""
-    if isinstance(value, bool):
-        return None
-    if isinstance(value, dict):
-        for key in ("value", "timestamp", "max", "end"):
-            if key in value and (parsed := _parse_eta(value[key])) is not None:
-                return parsed
-        return None
-    if isinstance(value, int | float):
-        timestamp = value / 1000 if value > 10_000_000_000 else value
-        # Explicit ETAs must be plausible wall-clock timestamps. Small values
-        # are durations/range bounds, not Unix timestamps.
-        if not 1_577_836_800 <= timestamp <= 4_102_444_800:
-            return None
-        try:
-            return datetime.fromtimestamp(timestamp, UTC)
-        except OSError, OverflowError, ValueError:
-            return None
-    if not isinstance(value, str):
-        return None
-    parsed = dt_util.parse_datetime(value)
-    return parsed if parsed is not None and parsed.tzinfo is not None else None
-
-
-def extract_order_eta(order: dict[str, Any]) -> datetime | None:
-    """Extract the first explicit timestamp-shaped ETA."""
-    for key in ("delivery_eta", "estimated_delivery_time", "eta"):
-        if (parsed := _parse_eta(order.get(key))) is not None:
-            return parsed
-    return None
+@dataclass(frozen=True, kw_only=True)
+class WoltApiSensorEntityDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor derived from the Wolt client's statistics."""
+
+    value_fn: Callable[[WoltApi], StateType]
+
+
+def _latency_p95_ms(api: WoltApi) -> int | None:
+    """Return the 95th-percentile request latency across all endpoints."""
+    value = api.latency_histogram().percentile(0.95)
+    return round(value * 1000) if value is not None else None
+
+
+API_SENSOR_DESCRIPTIONS = (
+    WoltApiSensorEntityDescription(
+        key="api_requests",
+        translation_key="api_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda api: sum(
+            stats.requests for stats in api.endpoint_stats.values()
+        ),
+    ),
+    WoltApiSensorEntityDescription(
+        key="api_latency_p95",
+        translation_key="api_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_latency_p95_ms,
+    ),
+    WoltApiSensorEntityDescription(
+        key="token_refreshes",
+        translation_key="token_refreshes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda api: (
+            api.token_stats.reactive_refreshes + api.token_stats.proactive_refreshes
+        ),
+    ),
+)
 
 
 PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
@@ -217,60 +158,101 @@ async def async_setup_entry(
     data = {**entry.data, **entry.options}
     runtime = entry.runtime_data
     coordinator = runtime.coordinator
-    api = runtime.api
     name = data.get(CONF_NAME, DEFAULT_NAME)
-    venues = data.get(CONF_VENUE_IDS, [])
-    if venues:
+    if (venue_coordinator := runtime.venue_coordinator) is not None:
+        # Venues are fetched in the background; entities stay unavailable until
+        # the first cycle lands instead of delaying platform setup.
         async_add_entities(
-            [WoltVenueSensor(api, slug, f"{name} {slug}") for slug in venues],
-            update_before_add=True,
+            WoltVenueSensor(venue_coordinator, slug, f"{name} {slug}")
+            for slug in venue_coordinator.slugs
+        )
+        known_estimates: set[tuple[str, str]] = set()
+
+        @callback
+        def async_add_new_estimates() -> None:
+            """Add estimate sensors for delivery methods seen for the first time."""
+            new_estimates = sorted(
+                (slug, key)
+                for slug, venue in (venue_coordinator.data or {}).items()
+                for key in venue.estimates
+                if (slug, key) not in known_estimates
+            )
+            if not new_estimates:
+                return
+            known_estimates.update(new_estimates)
+            async_add_entities(
+                WoltVenueEstimateSensor(venue_coordinator, slug, key, f"{name} {slug}")
+                for slug, key in new_estimates
+            )
+
+        async_add_new_estimates()
+        entry.async_on_unload(
+            venue_coordinator.async_add_listener(async_add_new_estimates)
         )
 
+    async_add_entities(
+        WoltApiDiagnosticSensor(coordinator, entry.entry_id, description)
+        for description in API_SENSOR_DESCRIPTIONS
+    )
+
+    registry = er.async_get(hass)
+    # This entry's registered order entities, indexed once here and kept current
+    # from registry events, so polls never scan the registry or order history.
+    registered_order_ids: dict[str, str] = {
+        entity.entity_id: order_id
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if entity.domain == "sensor"
+        and entity.platform == DOMAIN
+        and (order_id := _order_id_from_unique_id(entry.entry_id, entity.unique_id))
+    }
     known_order_ids: set[str] = set()
+    # Registered orders whose entities have not been created in this run yet.
+    unseen_registered_ids = set(registered_order_ids.values())
 
     @callback
-    def async_add_new_orders() -> None:
-        registry = er.async_get(hass)
-        candidate_order_ids = set(coordinator.data.active_order_ids)
-        for order_id in coordinator.data.orders:
-            if any(
-                _owned_registry_entity(
-                    registry,
-                    entry.entry_id,
-                    unique_id,
-                )
-                is not None
-                for unique_id in (
-                    f"wolt_{order_id}",
-                    _order_unique_id(entry.entry_id, order_id, "status"),
-                    _order_unique_id(entry.entry_id, order_id, "eta"),
-                )
-            ):
-                candidate_order_ids.add(order_id)
+    def async_index_registry_change(
+        event: Event[er.EventEntityRegistryUpdatedData],
+    ) -> None:
+        entity_id = event.data["entity_id"]
+        old_entity_id = event.data.get("old_entity_id", entity_id)
+        order_id = registered_order_ids.pop(old_entity_id, None)
+        if order_id is not None and order_id not in registered_order_ids.values():
+            unseen_registered_ids.discard(order_id)
+        entity = registry.async_get(entity_id)
+        if (
+            event.data["action"] != "remove"
+            and entity is not None
+            and entity.config_entry_id == entry.entry_id
+            and entity.platform == DOMAIN
+            and (order_id := _order_id_from_unique_id(entry.entry_id, entity.unique_id))
+        ):
+            registered_order_ids[entity_id] = order_id
+            if order_id not in known_order_ids:
+                unseen_registered_ids.add(order_id)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, async_index_registry_change
+        )
+    )
 
-        new_order_ids = candidate_order_ids - known_order_ids
+    @callback
+    def async_add_new_orders() -> None:
+        data = coordinator.data
+        new_order_ids = {
+            order_id
+            for order_id in data.active_order_ids
+            if order_id not in known_order_ids
+        }
+        new_order_ids.update(
+            order_id for order_id in unseen_registered_ids if order_id in data.orders
+        )
         if not new_order_ids:
             return
         known_order_ids.update(new_order_ids)
+        unseen_registered_ids.difference_update(new_order_ids)
         entities: list[SensorEntity] = []
         for order_id in sorted(new_order_ids):
-            status_unique_id = _order_unique_id(entry.entry_id, order_id, "status")
-            legacy_entity = _owned_registry_entity(
-                registry,
-                entry.entry_id,
-                f"wolt_{order_id}",
-            )
-            if (
-                legacy_entity is not None
-                and registry.async_get_entity_id("sensor", DOMAIN, status_unique_id)
-                is None
-            ):
-                registry.async_update_entity(
-                    legacy_entity.entity_id,
-                    new_unique_id=status_unique_id,
-                    translation_key="order_status",
-                    has_entity_name=True,
-                )
             entities.extend(
                 (
                     WoltOrderStatusSensor(coordinator, entry.entry_id, order_id),
@@ -279,19 +261,57 @@ async def async_setup_entry(
             )
         async_add_entities(entities)
 
+    retention = WoltOrderRetention(
+        hass,
+        entry.entry_id,
+        timedelta(hours=data.get(CONF_ORDER_RETENTION, DEFAULT_ORDER_RETENTION)),
+    )
+    await retention.async_load()
+    entry.async_on_unload(retention.async_flush)
+    device_registry = dr.async_get(hass)
+
+    @callback
+    def async_remove_expired_orders() -> None:
+        """Remove one batch of finished orders' entities and devices."""
+        if not coordinator.last_update_success or coordinator.data.restored:
+            # Orders missing from a failed or restored snapshot prove nothing.
+            return
+        expired = retention.async_expired(
+            coordinator.data.orders,
+            set(registered_order_ids.values()),
+            dt_util.utcnow(),
+        )
+        if not expired:
+            return
+        expired_ids = set(expired)
+        for entity_id, order_id in list(registered_order_ids.items()):
+            if order_id in expired_ids:
+                registry.async_remove(entity_id)
+        for order_id in expired:
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, f"{entry.entry_id}:{order_id}")}
+            )
+            if device is not None:
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=entry.entry_id
+                )
+        known_order_ids.difference_update(expired_ids)
+        retention.async_forget(expired)
+        _LOGGER.debug("Removed entities of %s finished Wolt orders", len(expired))
+
+    entry.async_on_unload(coordinator.async_add_listener(async_remove_expired_orders))
     async_add_new_orders()
-    entry.async_on_unload(coordinator.async_add_listener(async_add_new_orders))
+    entry.async_on_unload(
+        coordinator.async_add_listener(async_add_new_orders, NEW_ORDERS)
+    )
 
 
-def _owned_registry_entity(
-    registry: er.EntityRegistry,
-    entry_id: str,
-    unique_id: str,
-) -> er.RegistryEntry | None:
-    """Return a sensor registry entity only when this config entry owns it."""
-    entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
-    entity = registry.async_get(entity_id) if entity_id is not None else None
-    return entity if entity is not None and entity.config_entry_id == entry_id else None
+def _order_id_from_unique_id(entry_id: str, unique_id: str) -> str | None:
+    """Return the purchase ID of an order entity's unique ID."""
+    if not unique_id.startswith(f"{entry_id}_"):
+        return None
+    order_id, _, key = unique_id.removeprefix(f"{entry_id}_").rpartition("_")
+    return order_id if order_id and key in ("status", "eta") else None
 
 
 def _order_unique_id(entry_id: str, order_id: str, key: str) -> str:
@@ -299,6 +319,12 @@ def _order_unique_id(entry_id: str, order_id: str, key: str) -> str:
     return f"{entry_id}_{order_id}_{key}"
 
 
+# Shared, never mutated attributes, so state writes of order entities do not
+# allocate. Home Assistant copies them into each state.
+_NO_ATTRIBUTES: Mapping[str, Any] = {}
+_RESTORED_ATTRIBUTES: Mapping[str, Any] = {"stale": True}
+
+
 class WoltOrderEntity(CoordinatorEntity[WoltDataUpdateCoordinator], SensorEntity):
     """Base for a privacy-safe Wolt order entity."""
 
@@ -311,7 +337,8 @@ class WoltOrderEntity(CoordinatorEntity[WoltDataUpdateCoordinator], SensorEntity
         entry_id: str,
         order_id: str,
     ) -> None:
-        super().__init__(coordinator)
+        # Subscribe by order ID so polls that leave this order alone skip it.
+        super().__init__(coordinator, context=order_id)
         self.order_id = order_id
         self._entry_id = entry_id
 
@@ -321,12 +348,16 @@ class WoltOrderEntity(CoordinatorEntity[WoltDataUpdateCoordinator], SensorEntity
         return super().available and self.order_id in self.coordinator.data.orders
 
     @property
-    def _order_data(self) -> dict[str, Any]:
-        """Merge the order summary with richer active tracking details."""
-        return {
-            **self.coordinator.data.orders.get(self.order_id, {}),
-            **self.coordinator.data.details.get(self.order_id, {}),
-        }
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Flag restored values; never persist order metadata as attributes."""
+        return (
+            _RESTORED_ATTRIBUTES if self.coordinator.data.restored else _NO_ATTRIBUTES
+        )
+
+    @property
+    def _order(self) -> WoltOrder | None:
+        """Return the parsed order from the shared snapshot."""
+        return self.coordinator.data.orders.get(self.order_id)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -357,12 +388,8 @@ class WoltOrderStatusSensor(WoltOrderEntity):
     @property
     def native_value(self) -> str:
         """Return a fixed automation-safe enum value."""
-        return normalize_order_status(self._order_data)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Never persist order metadata or payload fragments as attributes."""
-        return {}
+        order = self._order
+        return order.status if order is not None else "unknown"
 
 
 class WoltOrderEtaSensor(WoltOrderEntity):
@@ -383,105 +410,142 @@ class WoltOrderEtaSensor(WoltOrderEntity):
     @property
     def native_value(self) -> datetime | None:
         """Return an aware timestamp or unknown when Wolt provides no explicit ETA."""
-        return extract_order_eta(self._order_data)
+        order = self._order
+        return order.eta if order is not None else None
 
 
-class WoltVenueSensor(SensorEntity):
-    """Sensor representing a Wolt venue's availability."""
+class WoltApiDiagnosticSensor(
+    CoordinatorEntity[WoltDataUpdateCoordinator], SensorEntity
+):
+    """Disabled-by-default request statistic of the account's Wolt client."""
+
+    entity_description: WoltApiSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: WoltDataUpdateCoordinator,
+        entry_id: str,
+        description: WoltApiSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="Wolt",
+            name="Wolt account",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available when polling fails; that is when the numbers matter."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the statistic as of the latest polling cycle."""
+        return self.entity_description.value_fn(self.coordinator.api)
+
+
+class WoltVenueEntity(CoordinatorEntity[WoltVenueCoordinator], SensorEntity):
+    """Base for a sensor of one public Wolt venue."""
 
     _attr_attribution = "Data provided by Wolt"
 
-    def __init__(self, api: WoltApi, slug: str, name: str) -> None:
-        self.api = api
+    def __init__(self, coordinator: WoltVenueCoordinator, slug: str) -> None:
+        super().__init__(coordinator, context=slug)
         self.slug = slug
+        self._written: tuple[Any, ...] | None = None
+
+    @property
+    def available(self) -> bool:
+        """Remain available while the last cycle fetched this venue."""
+        return super().available and self._venue is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the state or its attributes changed."""
+        # Every venue cycle notifies every venue entity, and most cycles change
+        # nothing a sensor shows.
+        written = (self.available, self.native_value, self.extra_state_attributes)
+        if written != self._written:
+            self._written = written
+            self.async_write_ha_state()
+
+    @property
+    def _venue(self) -> WoltVenue | None:
+        """Return the parsed venue from the shared snapshot."""
+        venues = self.coordinator.data
+        return venues.get(self.slug) if venues is not None else None
+
+
+class WoltVenueSensor(WoltVenueEntity):
+    """Sensor representing a Wolt venue's availability."""
+
+    _attr_icon = "mdi:store"
+    # Free text and schedule values that change without the venue opening or
+    # closing; they are shown but kept out of the recorder's attribute rows.
+    _unrecorded_attributes = frozenset(
+        {
+            "delivery_fee",
+            "discount",
+            "min_order_text",
+            "next_close",
+            "next_open",
+            "order_minimum",
+            "rating",
+            "service_fee",
+        }
+    )
+
+    def __init__(self, coordinator: WoltVenueCoordinator, slug: str, name: str) -> None:
+        super().__init__(coordinator, slug)
         self._attr_name = name
         self._attr_unique_id = f"wolt_venue_{slug}"
-        self._state = None
-        self._attr_extra_state_attributes = {}
-        self._attr_available = False
-        self._attr_icon = "mdi:store"
 
     @property
-    def native_value(self):
-        return self._state
-
-    async def async_update(self) -> None:
-        try:
-            details = await self.api.fetch_venue_details(self.slug)
-        except WoltApiError as err:
-            self._attr_available = False
-            _LOGGER.warning("Unable to update a configured Wolt venue: %s", err)
-            return
-        if not details:
-            self._attr_available = False
-            _LOGGER.warning("Configured Wolt venue details were not found")
-            return
+    def native_value(self) -> str | None:
+        """Return whether the venue currently accepts delivery orders."""
+        venue = self._venue
+        if venue is None:
+            return None
+        return "open" if venue.is_open else "closed"
 
-        venue = details.get("venue") or details.get("venue_info") or {}
-        self._attr_available = True
-        open_info = venue.get("delivery_open_status") or venue.get("open_status") or {}
-
-        is_open = open_info.get("is_open")
-        if is_open is None:
-            is_open = venue.get("online")
-        if is_open is None:
-            is_open = venue.get("is_open")
-        self._state = "open" if is_open else "closed"
-
-        # Extract estimates for available delivery methods
-        estimates: dict[str, Any] = {}
-        for cfg in venue.get("delivery_configs", []):
-            method = cfg.get("method")
-            estimate = cfg.get("estimate") or {}
-            if method and estimate:
-                estimates[f"{method}_estimate_min"] = estimate.get("min")
-                estimates[f"{method}_estimate_max"] = estimate.get("max")
-
-        # Parse useful metadata from the header section
-        header = venue.get("header", {})
-        statuses = (
-            header.get("delivery_method_statuses", [])
-            if isinstance(header, dict)
-            else []
-        )
-        meta = (
-            statuses[0].get("metadata", [])
-            if statuses and isinstance(statuses[0], dict)
-            else []
-        )
-        rating = None
-        delivery_fee = None
-        service_fee = None
-        min_order_text = None
-        for item in meta:
-            icon = item.get("icon")
-            value = item.get("value")
-            if icon and icon.startswith("RATING"):
-                rating = value
-            elif icon == "CYCLIST":
-                delivery_fee = value
-            elif value and "Min. order" in value:
-                min_order_text = value
-            elif value and "Service fee" in value:
-                service_fee = value
-
-        banner_text = None
-        if venue.get("banners"):
-            banner = venue["banners"][0]
-            discount = banner.get("discount") or banner
-            banner_text = discount.get("formatted_text")
-
-        self._attr_extra_state_attributes = {
-            "online": venue.get("online"),
-            "open_status": open_info.get("value"),
-            "next_open": open_info.get("next_open"),
-            "next_close": open_info.get("next_close"),
-            "order_minimum": details.get("order_minimum"),
-            "is_venue_favourite": details.get("is_venue_favourite"),
-            "rating": rating,
-            "delivery_fee": delivery_fee,
-            "service_fee": service_fee,
-            "min_order_text": min_order_text,
-            "discount": banner_text,
-            **estimates,
-        }
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the venue's public metadata."""
+        venue = self._venue
+        return venue.attributes if venue is not None else {}
+
+
+class WoltVenueEstimateSensor(WoltVenueEntity):
+    """Delivery-time estimate bound of one venue's delivery method, in minutes."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: WoltVenueCoordinator, slug: str, key: str, name: str
+    ) -> None:
+        super().__init__(coordinator, slug)
+        self.key = key
+        self._attr_name = f"{name} {key.replace('_', ' ')}"
+        self._attr_unique_id = f"wolt_venue_{slug}_{key}"
+
+    @property
+    def available(self) -> bool:
+        """Remain available while the venue reports this estimate."""
+        venue = self._venue
+        return super().available and venue is not None and self.key in venue.estimates
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the estimate in minutes."""
+        venue = self._venue
+        return venue.estimates.get(self.key) if venue is not None else None
@@ -0,0 +1,113 @@
+"""Persistent cache of the last good order snapshot for non-blocking setup."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from itertools import islice
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .models import WoltOrder
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_MINOR_VERSION = 1
+# Active orders are stored first; older history beyond this bound is simply
+# read from Wolt again by the first live refresh.
+MAX_STORED_ORDERS = 50
+# Snapshot changes within this many seconds share one write; Home Assistant
+# writes a pending snapshot at shutdown.
+SNAPSHOT_SAVE_DELAY = 30
+
+
+class _SnapshotStore(Store[dict[str, Any]]):
+    """Store whose data from another layout version is dropped, not converted."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Discard a cache the running version cannot read; polling rebuilds it."""
+        _LOGGER.debug(
+            "Discarding Wolt snapshot stored as version %s.%s",
+            old_major_version,
+            old_minor_version,
+        )
+        return {}
+
+
+class WoltSnapshotStore:
+    """Save the fields order entities show, and restore them on the next setup.
+
+    Only the purchase ID, active flag, normalized status, and ETA are written;
+    venue names, raw status text, and Wolt payloads never reach the disk.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = _SnapshotStore(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.snapshot",
+            private=True,
+            minor_version=STORAGE_MINOR_VERSION,
+        )
+        self._pending: Mapping[str, WoltOrder] | None = None
+
+    async def async_load(self) -> dict[str, WoltOrder] | None:
+        """Return the stored orders, or None without a readable snapshot."""
+        stored = await self._store.async_load()
+        if not stored or not isinstance(orders := stored.get("orders"), list):
+            return None
+        try:
+            return {
+                item["id"]: WoltOrder(
+                    purchase_id=item["id"],
+                    active=bool(item["active"]),
+                    raw_status=None,
+                    status=item["status"],
+                    eta=dt_util.parse_datetime(item["eta"]) if item["eta"] else None,
+                    venue_name=None,
+                )
+                for item in orders[:MAX_STORED_ORDERS]
+            }
+        except KeyError, TypeError, ValueError:
+            _LOGGER.debug("Ignoring an unreadable Wolt snapshot")
+            return None
+
+    @callback
+    def async_save(self, orders: Mapping[str, WoltOrder]) -> None:
+        """Schedule a write of ``orders``, bounded to the most relevant ones."""
+        self._pending = orders
+        self._store.async_delay_save(self._compact, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a scheduled snapshot now, for example before a reload."""
+        if self._pending is not None:
+            await self._store.async_save(self._compact())
+
+    def _compact(self) -> dict[str, Any]:
+        orders, self._pending = self._pending or {}, None
+        ranked = sorted(orders.values(), key=lambda order: not order.active)
+        return {
+            "orders": [
+                {
+                    "id": order.purchase_id,
+                    "active": order.active,
+                    "status": order.status,
+                    "eta": order.eta.isoformat() if order.eta else None,
+                }
+                for order in islice(ranked, MAX_STORED_ORDERS)
+            ]
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
@@ -0,0 +1,94 @@
+"""Home Assistant-independent request statistics for Wolt endpoints."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Any
+
+# Upper bounds in seconds. Slower requests land in one overflow bucket, so a
+# histogram never grows however many requests it records.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with bucket-resolution percentiles."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, seconds: float) -> None:
+        """Count one request that took ``seconds``."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's counts to this one."""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound that ``fraction`` of requests stayed within.
+
+        Requests slower than the last bound report that bound; the request
+        timeout caps them there in practice.
+        """
+        total = sum(self.counts)
+        if not total:
+            return None
+        rank = max(1, ceil(fraction * total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS[min(index, len(LATENCY_BUCKETS) - 1)]
+        return LATENCY_BUCKETS[-1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return percentiles in milliseconds and the raw bucket counts."""
+        summary: dict[str, Any] = {}
+        for name, fraction in (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            value = self.percentile(fraction)
+            summary[name] = round(value * 1000) if value is not None else None
+        summary["buckets"] = {
+            **{
+                f"le_{round(bound * 1000)}ms": count
+                for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=False)
+            },
+            "overflow": self.counts[-1],
+        }
+        return summary
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Counters for one Wolt endpoint, updated in constant time and memory."""
+
+    requests: int = 0
+    status_classes: dict[str, int] = field(default_factory=dict)
+    timeouts: int = 0
+    connection_errors: int = 0
+    rate_limited: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record_status(self, status: int) -> None:
+        """Count a response by status class, and separately when it is a 429."""
+        status_class = f"{status // 100}xx"
+        self.status_classes[status_class] = self.status_classes.get(status_class, 0) + 1
+        if status == 429:
+            self.rate_limited += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-safe summary for diagnostics."""
+        return {
+            "requests": self.requests,
+            "status_classes": dict(sorted(self.status_classes.items())),
+            "timeouts": self.timeouts,
+            "connection_errors": self.connection_errors,
+            "rate_limited": self.rate_limited,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
@@ -0,0 +1,117 @@
+"""Coalesced persistence of rotated Wolt credentials."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CONF_BEARER_TOKEN, CONF_REFRESH_TOKEN, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rotations within this window, including those of other accounts hitting the
+# same expiry boundary, share one config-entry storage write.
+TOKEN_PERSIST_DELAY = 10.0
+
+DATA_TOKEN_PERSISTER: HassKey[WoltTokenPersister] = HassKey(f"{DOMAIN}_token_persister")
+
+TokenWriter = Callable[[str, str], None]
+
+
+@dataclass(slots=True)
+class _EntryTokens:
+    """The writer of one config entry and the credentials it last stored."""
+
+    entry: ConfigEntry
+    write: TokenWriter
+    stored: tuple[str, str]
+
+
+class WoltTokenPersister:
+    """Keep rotated tokens in memory and write them to config entries in batches.
+
+    The API client already uses the newest pair in memory; only the storage write
+    is deferred. Pending pairs are flushed on unload and Home Assistant shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant, delay: float = TOKEN_PERSIST_DELAY) -> None:
+        self._hass = hass
+        self._delay = delay
+        self._entries: dict[str, _EntryTokens] = {}
+        self._pending: dict[str, tuple[str, str]] = {}
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def async_register(self, entry: ConfigEntry, write: TokenWriter) -> CALLBACK_TYPE:
+        """Start batching an entry's rotations; the returned callback flushes them."""
+        self._entries[entry.entry_id] = _EntryTokens(
+            entry,
+            write,
+            (entry.data[CONF_BEARER_TOKEN], entry.data[CONF_REFRESH_TOKEN]),
+        )
+
+        @callback
+        def unregister() -> None:
+            self.async_flush()
+            self._entries.pop(entry.entry_id, None)
+
+        return unregister
+
+    @callback
+    def async_update(
+        self, entry_id: str, access_token: str, refresh_token: str
+    ) -> None:
+        """Queue the newest credentials of an entry for the next batched write."""
+        self._pending[entry_id] = (access_token, refresh_token)
+        if self._cancel_timer is None:
+            self._cancel_timer = async_call_later(
+                self._hass, self._delay, self._async_timer_fired
+            )
+
+    @callback
+    def async_flush(self) -> None:
+        """Write every queued pair now."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        pending, self._pending = self._pending, {}
+        for entry_id, tokens in pending.items():
+            if (entry_tokens := self._entries.get(entry_id)) is None:
+                continue
+            data = entry_tokens.entry.data
+            if (
+                data.get(CONF_BEARER_TOKEN),
+                data.get(CONF_REFRESH_TOKEN),
+            ) != entry_tokens.stored:
+                # The user re-entered credentials since the runtime loaded;
+                # those replace anything rotated from the older pair.
+                _LOGGER.debug("Discarding rotated Wolt tokens for replaced credentials")
+                continue
+            entry_tokens.write(*tokens)
+            entry_tokens.stored = tokens
+
+    @callback
+    def _async_timer_fired(self, _now: datetime) -> None:
+        self._cancel_timer = None
+        self.async_flush()
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        self.async_flush()
+
+
+@callback
+def async_get_token_persister(hass: HomeAssistant) -> WoltTokenPersister:
+    """Return the token persister shared by every Wolt config entry."""
+    if (persister := hass.data.get(DATA_TOKEN_PERSISTER)) is None:
+        persister = hass.data[DATA_TOKEN_PERSISTER] = WoltTokenPersister(hass)
+    return persister
@@ -1,6 +1,9 @@
 """Synthetic offline tests for the Home Assistant-independent Wolt API client."""
 
 import asyncio
+import base64
+import json
+import time
 from collections import deque
 from typing import Any
 
@@ -8,6 +11,7 @@ import aiohttp
 import pytest
 
 from custom_components.wait_for_wolt.api import (
+    TOKEN_REFRESH_WINDOW,
     WoltApi,
     WoltAuthenticationError,
     WoltConnectionError,
@@ -20,20 +24,34 @@ from custom_components.wait_for_wolt.const import (
     REFRESH_URL,
     VENUE_CONTENT_URL,
 )
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
 
 
 class FakeResponse:
     """Minimal asynchronous response implementing the API client's contract."""
 
-    def __init__(self, status: int, payload: Any = None) -> None:
+    def __init__(
+        self,
+        status: int,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self.status = status
+        self.headers = headers or {}
         self._payload = payload
+        self.json_calls = 0
 
     async def json(self) -> Any:
+        self.json_calls += 1
         if isinstance(self._payload, BaseException):
             raise self._payload
         return self._payload
 
+    async def read(self) -> bytes:
+        if isinstance(self._payload, BaseException):
+            return b""
+        return json.dumps(self._payload).encode()
+
 
 class FakeRequestContext:
     """Minimal aiohttp request context manager."""
@@ -75,6 +93,9 @@ class FakeSession:
         )
         return FakeRequestContext(self._responses.popleft())
 
+    def head(self, url: str, *, headers: dict[str, str]) -> FakeRequestContext:
+        return self.request("HEAD", url, headers=headers)
+
     def post(
         self,
         url: str,
@@ -269,6 +290,8 @@ async def test_unauthorized_request_refreshes_persists_and_retries_once() -> Non
     assert api.access_token == rotated[0]
     assert api.refresh_token == rotated[1]
     assert persisted == [rotated]
+    assert api.token_stats.reactive_refreshes == 1
+    assert api.token_stats.proactive_refreshes == 0
 
 
 async def test_concurrent_unauthorized_requests_share_one_token_refresh() -> None:
@@ -284,20 +307,17 @@ async def test_concurrent_unauthorized_requests_share_one_token_refresh() -> Non
         *,
         authenticated: bool,
         data: dict[str, str] | None = None,
+        background: bool = False,
     ) -> Any:
         nonlocal initial_requests
-        del data
-        if (
-            url == ACTIVE_ORDERS_URL
-            and authenticated
-            and api.access_token == "test-access-token"
-        ):
+        del url, data, background
+        if authenticated and api.access_token == "test-access-token":
             initial_requests += 1
             if initial_requests == 2:
                 both_initial_requests_started.set()
             await both_initial_requests_started.wait()
             raise WoltAuthenticationError("expired", status=401)
-        return {"orders": []}
+        return {"orders": [], "order_details": {}}
 
     async def refresh_access_token() -> None:
         nonlocal refreshes
@@ -307,15 +327,225 @@ async def test_concurrent_unauthorized_requests_share_one_token_refresh() -> Non
     api._perform_request = perform_request  # type: ignore[method-assign]
     api._refresh_access_token = refresh_access_token  # type: ignore[method-assign]
 
-    first, second = await asyncio.gather(
-        api.fetch_active_orders(), api.fetch_active_orders()
+    # Distinct endpoints, because identical concurrent GETs are coalesced.
+    orders, details = await asyncio.gather(
+        api.fetch_active_orders(), api.fetch_order_details("purchase-001")
     )
 
-    assert first == second == []
+    assert orders == []
+    assert details == {}
     assert initial_requests == 2
     assert refreshes == 1
 
 
+def gated_perform_request(
+    api: WoltApi,
+    release: asyncio.Event,
+    result: Any,
+) -> list[str]:
+    """Replace the transport with one that blocks until ``release`` is set."""
+    urls: list[str] = []
+
+    async def perform_request(
+        _method: str,
+        url: str,
+        *,
+        authenticated: bool,
+        data: dict[str, str] | None = None,
+        background: bool = False,
+    ) -> Any:
+        del authenticated, data, background
+        urls.append(url)
+        await release.wait()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    api._perform_request = perform_request  # type: ignore[method-assign]
+    return urls
+
+
+async def test_concurrent_identical_gets_share_one_request() -> None:
+    """Coalesce a manual refresh racing the scheduled poll into one request."""
+    api = make_api(FakeSession())
+    release = asyncio.Event()
+    urls = gated_perform_request(api, release, {"orders": [{"id": "order-001"}]})
+
+    first = asyncio.create_task(api.fetch_orders())
+    second = asyncio.create_task(api.fetch_orders())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == [{"id": "order-001"}]
+    assert urls == [ACTIVE_ORDERS_URL]
+    assert api._in_flight == {}
+
+
+async def test_coalesced_callers_share_the_same_exception() -> None:
+    """Deliver one failure to every waiter instead of retrying per caller."""
+    api = make_api(FakeSession())
+    release = asyncio.Event()
+    urls = gated_perform_request(api, release, WoltConnectionError("offline"))
+
+    waiters = [asyncio.create_task(api.fetch_venue_details("venue")) for _ in "ab"]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert len(urls) == 1
+    assert all(isinstance(result, WoltConnectionError) for result in results)
+    assert results[0] is results[1]
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_request() -> None:
+    """Let the remaining callers finish when one coalesced caller is cancelled."""
+    api = make_api(FakeSession())
+    release = asyncio.Event()
+    urls = gated_perform_request(api, release, {"orders": []})
+
+    cancelled = asyncio.create_task(api.fetch_orders())
+    remaining = asyncio.create_task(api.fetch_orders())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await remaining == []
+    assert cancelled.cancelled()
+    assert len(urls) == 1
+
+
+async def test_sequential_gets_are_not_coalesced() -> None:
+    """Only share requests that are in flight at the same time."""
+    session = FakeSession(
+        FakeResponse(200, {"orders": []}),
+        FakeResponse(200, {"orders": []}),
+    )
+    api = make_api(session)
+
+    await api.fetch_orders()
+    await api.fetch_orders()
+
+    assert len(session.calls) == 2
+
+
+def make_jwt(expires_in: float) -> str:
+    """Build an unsigned synthetic JWT with an ``exp`` claim."""
+    claims = json.dumps({"exp": int(time.time() + expires_in)}).encode()
+    payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode()
+    return f"sanitized-header.{payload}.sanitized-signature"
+
+
+def make_jwt_api(session: FakeSession, expires_in: float) -> WoltApi:
+    """Create an API client whose access token expires after ``expires_in``."""
+    return WoltApi(
+        session,  # type: ignore[arg-type]
+        "test-session",
+        make_jwt(expires_in),
+        "test-refresh-token",
+    )
+
+
+async def test_expired_jwt_is_refreshed_before_the_request() -> None:
+    """Skip the doomed 401 round trip when the token has already expired."""
+    session = FakeSession(
+        FakeResponse(200, {"access_token": "next-access-token"}),
+        FakeResponse(200, {"orders": []}),
+    )
+    api = make_jwt_api(session, -60)
+
+    assert await api.fetch_orders() == []
+
+    assert [call["url"] for call in session.calls] == [REFRESH_URL, ACTIVE_ORDERS_URL]
+    assert session.calls[1]["headers"]["authorization"] == "Bearer next-access-token"
+    assert api.token_stats.proactive_refreshes == 1
+    assert api.token_stats.reactive_refreshes == 0
+
+
+async def test_expiring_jwt_is_refreshed_in_background() -> None:
+    """Use the still-valid token now and rotate it before it expires."""
+    session = FakeSession(
+        FakeResponse(200, {"orders": []}),
+        FakeResponse(200, {"access_token": "next-access-token"}),
+    )
+    api = make_jwt_api(session, TOKEN_REFRESH_WINDOW / 2)
+    expiring_token = api.access_token
+
+    assert await api.fetch_orders() == []
+    while api._background_refresh is not None:
+        await asyncio.sleep(0)
+
+    assert [call["url"] for call in session.calls] == [ACTIVE_ORDERS_URL, REFRESH_URL]
+    assert session.calls[0]["headers"]["authorization"] == f"Bearer {expiring_token}"
+    assert api.access_token == "next-access-token"
+    assert api.token_stats.proactive_refreshes == 1
+
+
+async def test_close_saves_a_rotation_in_progress_and_cancels_requests() -> None:
+    """Deliver the new single-use pair on close instead of dropping it."""
+    rotated: list[tuple[str, str]] = []
+    api = WoltApi(
+        FakeSession(),  # type: ignore[arg-type]
+        "test-session",
+        make_jwt(TOKEN_REFRESH_WINDOW / 2),
+        "test-refresh-token",
+        token_update_callback=lambda *tokens: rotated.append(tokens),
+    )
+    release_refresh = asyncio.Event()
+
+    async def perform_request(
+        _method: str,
+        url: str,
+        *,
+        authenticated: bool,
+        data: dict[str, str] | None = None,
+        background: bool = False,
+    ) -> Any:
+        del authenticated, data, background
+        if url == REFRESH_URL:
+            await release_refresh.wait()
+            return {
+                "access_token": "next-access-token",
+                "refresh_token": "next-refresh-token",
+            }
+        if url == ACTIVE_ORDERS_URL:
+            return {"orders": []}
+        await asyncio.Event().wait()  # A venue page that never answers.
+
+    api._perform_request = perform_request  # type: ignore[method-assign]
+    assert await api.fetch_orders() == []
+    pending = asyncio.create_task(api.fetch_venue_details("sanitized-venue"))
+    await asyncio.sleep(0)
+
+    closing = asyncio.create_task(api.async_close())
+    await asyncio.sleep(0)
+    assert not closing.done()
+    release_refresh.set()
+    await closing
+
+    assert rotated == [("next-access-token", "next-refresh-token")]
+    assert api._background_refresh is None
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    assert api._in_flight == {}
+
+
+async def test_fresh_and_opaque_tokens_are_not_refreshed_proactively() -> None:
+    """Leave long-lived JWTs and undecodable tokens to the 401 fallback."""
+    session = FakeSession(
+        FakeResponse(200, {"orders": []}),
+        FakeResponse(200, {"orders": []}),
+    )
+
+    await make_jwt_api(session, 3600).fetch_orders()
+    await make_api(session).fetch_orders()
+
+    assert [call["url"] for call in session.calls] == [
+        ACTIVE_ORDERS_URL,
+        ACTIVE_ORDERS_URL,
+    ]
+
+
 @pytest.mark.parametrize("failed_status", [400, 401, 403])
 async def test_authentication_failure_raises_without_looping(
     failed_status: int,
@@ -393,6 +623,209 @@ async def test_order_details_accepts_legacy_list_shape() -> None:
     }
 
 
+async def test_unchanged_orders_page_is_served_from_validator_cache() -> None:
+    """Revalidate with the ETag and reuse the parsed body on 304 Not Modified."""
+    payload = {"orders": [{"purchase_id": "purchase-001"}]}
+    not_modified = FakeResponse(304)
+    session = FakeSession(
+        FakeResponse(200, payload, {"ETag": '"orders-v1"'}),
+        not_modified,
+    )
+    api = make_api(session)
+
+    first = await api.fetch_orders()
+    second = await api.fetch_orders()
+
+    assert first == second == payload["orders"]
+    assert "If-None-Match" not in session.calls[0]["headers"]
+    assert session.calls[1]["headers"]["If-None-Match"] == '"orders-v1"'
+    assert not_modified.json_calls == 0
+    assert api.cache_stats.conditional_requests == 1
+    assert api.cache_stats.not_modified_responses == 1
+    assert api.cache_stats.parses_saved == 1
+    assert api.cache_stats.bytes_saved == len(json.dumps(payload).encode())
+
+
+async def test_last_modified_validator_is_replaced_by_changed_response() -> None:
+    """Send If-Modified-Since and cache the newer body when Wolt returns 200."""
+    session = FakeSession(
+        FakeResponse(200, {"orders": []}, {"Last-Modified": "sanitized-date-1"}),
+        FakeResponse(
+            200,
+            {"orders": [{"purchase_id": "purchase-001"}]},
+            {"Last-Modified": "sanitized-date-2"},
+        ),
+        FakeResponse(304),
+    )
+    api = make_api(session)
+
+    assert await api.fetch_orders() == []
+    assert await api.fetch_orders() == [{"purchase_id": "purchase-001"}]
+    assert await api.fetch_orders() == [{"purchase_id": "purchase-001"}]
+
+    assert session.calls[1]["headers"]["If-Modified-Since"] == "sanitized-date-1"
+    assert session.calls[2]["headers"]["If-Modified-Since"] == "sanitized-date-2"
+    assert api.cache_stats.not_modified_responses == 1
+
+
+async def test_responses_without_validators_are_not_cached() -> None:
+    """Only send conditional headers when Wolt supplied a validator."""
+    session = FakeSession(
+        FakeResponse(200, {"orders": []}),
+        FakeResponse(200, {"orders": []}),
+    )
+    api = make_api(session)
+
+    await api.fetch_orders()
+    await api.fetch_orders()
+
+    assert "If-None-Match" not in session.calls[1]["headers"]
+    assert "If-Modified-Since" not in session.calls[1]["headers"]
+    assert api.cache_stats.conditional_requests == 0
+
+
+async def test_rate_limit_honors_retry_after_without_contacting_wolt() -> None:
+    """Carry Retry-After and reject further calls to the penalized host locally."""
+    session = FakeSession(
+        FakeResponse(429, headers={"Retry-After": "120"}),
+        FakeResponse(200, {"order_details": {"status": "delivery"}}),
+    )
+    api = make_api(session)
+
+    with pytest.raises(WoltRateLimitError) as first:
+        await api.fetch_orders()
+    with pytest.raises(WoltRateLimitError) as second:
+        await api.fetch_venue_details("venue")
+    details = await api.fetch_order_details("purchase-001")
+
+    assert first.value.status == 429
+    assert first.value.retry_after == 120
+    assert second.value.status is None
+    assert 0 < second.value.retry_after <= 120
+    assert [call["url"] for call in session.calls] == [
+        ACTIVE_ORDERS_URL,
+        ORDER_DETAILS_URL.format("purchase-001"),
+    ]
+    assert details == {"status": "delivery"}
+    budget = api.rate_limit_budget
+    assert budget["consumer-api.wolt.com"]["remaining"] == 0
+    assert 0 < budget["consumer-api.wolt.com"]["cool_down_seconds"] <= 120
+    assert budget["restaurant-api.wolt.com"]["remaining"] > 0
+    assert budget["restaurant-api.wolt.com"]["cool_down_seconds"] == 0
+
+
+async def test_venue_pages_leave_budget_for_the_orders_page() -> None:
+    """Queue venue pages behind the headroom instead of delaying order polls."""
+    session = FakeSession(
+        FakeResponse(200, {"venue": {"online": True}}),
+        FakeResponse(200, {"orders": []}),
+    )
+    api = WoltApi(
+        session,  # type: ignore[arg-type]
+        None,
+        "test-access-token",
+        "test-refresh-token",
+        rate_limiter=WoltRateLimiter((3, 0.01)),
+    )
+
+    await api.fetch_venue_details("venue-001")
+    waiting = asyncio.create_task(api.fetch_venue_details("venue-002"))
+    await asyncio.sleep(0)
+    async with asyncio.timeout(1):
+        await api.fetch_orders()
+
+    assert not waiting.done()
+    assert [call["url"] for call in session.calls] == [
+        VENUE_CONTENT_URL.format("venue-001"),
+        ACTIVE_ORDERS_URL,
+    ]
+    await api.async_close()
+    assert waiting.cancelled()
+
+
+async def test_warm_up_opens_credential_free_connections_to_the_host() -> None:
+    """Pre-open restaurant-api connections and ignore warm-up failures."""
+    session = FakeSession(FakeResponse(404), aiohttp.ClientConnectionError())
+
+    await make_api(session).async_warm_up(ORDER_DETAILS_URL, 2)
+
+    assert [(call["method"], call["url"]) for call in session.calls] == [
+        ("HEAD", "https://restaurant-api.wolt.com/"),
+        ("HEAD", "https://restaurant-api.wolt.com/"),
+    ]
+    assert all("authorization" not in call["headers"] for call in session.calls)
+
+
+async def test_base_url_redirects_every_host_but_keeps_per_host_budgets() -> None:
+    """Send all Wolt endpoints to one stand-in server, keeping paths and queries."""
+    session = FakeSession(
+        FakeResponse(401),
+        FakeResponse(
+            200,
+            {
+                "access_token": "test-access-token-next",
+                "refresh_token": "test-refresh-token-next",
+            },
+        ),
+        FakeResponse(200, {"orders": []}),
+        FakeResponse(200, {"order_details": {"status": "delivery"}}),
+        FakeResponse(200),
+    )
+    api = WoltApi(
+        session,  # type: ignore[arg-type]
+        None,
+        "test-access-token",
+        "test-refresh-token",
+        base_url="http://127.0.0.1:8080/wolt/",
+    )
+
+    await api.fetch_orders()
+    await api.fetch_order_details("purchase-001")
+    await api.async_warm_up(ORDER_DETAILS_URL)
+
+    assert [call["url"] for call in session.calls] == [
+        "http://127.0.0.1:8080/wolt/order-xp/web/v1/pages/orders",
+        "http://127.0.0.1:8080/wolt/v1/wauth2/access_token",
+        "http://127.0.0.1:8080/wolt/order-xp/web/v1/pages/orders",
+        "http://127.0.0.1:8080/wolt/v2/order_details/purchase_tracking"
+        "?purchase_id=purchase-001",
+        "http://127.0.0.1:8080/",
+    ]
+    assert set(api.rate_limit_budget) == {
+        "consumer-api.wolt.com",
+        "authentication.wolt.com",
+        "restaurant-api.wolt.com",
+    }
+
+
+async def test_endpoint_stats_count_statuses_bytes_and_failures() -> None:
+    """Record per-endpoint counters without keying on purchase IDs."""
+    session = FakeSession(
+        FakeResponse(200, {"orders": []}),
+        TimeoutError(),
+        FakeResponse(200, {"order_details": {"status": "delivery"}}),
+        FakeResponse(429, headers={"Retry-After": "5"}),
+    )
+    api = make_api(session)
+
+    await api.fetch_orders()
+    with pytest.raises(WoltConnectionError):
+        await api.fetch_orders()
+    await api.fetch_order_details("purchase-001")
+    with pytest.raises(WoltRateLimitError):
+        await api.fetch_order_details("purchase-002")
+
+    stats = api.endpoint_stats
+    assert set(stats) == {"orders", "order_details"}
+    assert stats["orders"].requests == 2
+    assert stats["orders"].status_classes == {"2xx": 1}
+    assert stats["orders"].timeouts == 1
+    assert stats["orders"].bytes_received == len(b'{"orders": []}')
+    assert stats["order_details"].status_classes == {"2xx": 1, "4xx": 1}
+    assert stats["order_details"].rate_limited == 1
+    assert sum(api.latency_histogram().counts) == 4
+
+
 @pytest.mark.parametrize(
     ("response", "exception_type"),
     [
@@ -0,0 +1,246 @@
+"""Tests for offline record/replay of Wolt HTTP exchanges."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.cassette import (
+    REDACTED,
+    Cassette,
+    CassetteMissError,
+    RecordingSession,
+    ReplaySession,
+)
+from custom_components.wait_for_wolt.api import (
+    WoltApi,
+    WoltAuthenticationError,
+    WoltConnectionError,
+)
+from custom_components.wait_for_wolt.const import (
+    ACTIVE_ORDERS_URL,
+    DOMAIN,
+    REFRESH_URL,
+)
+from custom_components.wait_for_wolt.coordinator import WoltDataUpdateCoordinator
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
+from custom_components.wait_for_wolt.sensor import WoltOrderStatusSensor
+
+UNLIMITED = WoltRateLimiter((1e9, 1e9))
+
+
+class StubResponse:
+    """Live-response stand-in for the recording wrapper."""
+
+    def __init__(self, status: int, payload: Any, headers: dict[str, str]) -> None:
+        self.status = status
+        self.headers = headers
+        self._body = json.dumps(payload).encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def json(self) -> Any:
+        return json.loads(self._body)
+
+
+class StubContext:
+    def __init__(self, response: StubResponse) -> None:
+        self._response = response
+
+    async def __aenter__(self) -> StubResponse:
+        return self._response
+
+    async def __aexit__(self, *_args: Any) -> None:
+        return None
+
+
+class StubSession:
+    """Answer token refreshes and order pages like the live endpoints."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: dict[str, str] | None = None,
+    ) -> StubContext:
+        del headers, data
+        if method == "POST":
+            return StubContext(
+                StubResponse(
+                    200,
+                    {
+                        "access_token": "sanitized-live-access",
+                        "refresh_token": "sanitized-live-refresh",
+                    },
+                    {},
+                )
+            )
+        return StubContext(
+            StubResponse(401 if url == ACTIVE_ORDERS_URL else 200, {}, {"ETag": "v1"})
+        )
+
+
+async def test_recording_redacts_credentials_and_replays_identically(
+    tmp_path: Path,
+) -> None:
+    """Never write tokens to disk while keeping exchanges replayable."""
+    recorder = RecordingSession(StubSession())  # type: ignore[arg-type]
+    api = WoltApi(
+        recorder,  # type: ignore[arg-type]
+        "sanitized-session-id",
+        "sanitized-stale-access",
+        "sanitized-refresh-token",
+        rate_limiter=UNLIMITED,
+    )
+
+    with pytest.raises(WoltAuthenticationError):
+        await api.fetch_orders()
+    recorder.save(tmp_path / "recorded.json")
+
+    serialized = (tmp_path / "recorded.json").read_text()
+    for secret in (
+        "sanitized-session-id",
+        "sanitized-stale-access",
+        "sanitized-refresh-token",
+        "sanitized-live-access",
+        "sanitized-live-refresh",
+    ):
+        assert secret not in serialized
+    cassette = Cassette.load(tmp_path / "recorded.json")
+    assert [(item["method"], item["status"]) for item in cassette.interactions] == [
+        ("GET", 401),
+        ("POST", 200),
+        ("GET", 401),
+    ]
+    assert cassette.interactions[1]["data"]["refresh_token"] == REDACTED
+    assert cassette.interactions[1]["json"]["access_token"] == REDACTED
+
+    replay = ReplaySession(cassette)
+    replayed = WoltApi(
+        replay,  # type: ignore[arg-type]
+        None,
+        "sanitized-access-token",
+        "sanitized-refresh-token",
+        rate_limiter=UNLIMITED,
+    )
+    with pytest.raises(WoltAuthenticationError):
+        await replayed.fetch_orders()
+    assert replay.remaining("GET", ACTIVE_ORDERS_URL) == 0
+    assert replay.remaining("POST", REFRESH_URL) == 0
+    with pytest.raises(CassetteMissError):
+        await replayed.fetch_orders()
+
+
+class HangingContext:
+    """A request that never answers, like a Wolt request that times out."""
+
+    async def __aenter__(self) -> StubResponse:
+        await asyncio.Event().wait()
+        raise AssertionError
+
+    async def __aexit__(self, *_args: Any) -> None:
+        return None
+
+
+class TimingOutSession:
+    """Let the first venue page time out and answer the second."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        data: dict[str, str] | None = None,
+    ) -> Any:
+        del method, url, headers, data
+        self.calls += 1
+        if self.calls == 1:
+            return HangingContext()
+        return StubContext(StubResponse(200, {"venue": {"online": True}}, {}))
+
+
+async def test_timed_out_request_is_recorded_and_replayed_in_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep later exchanges in step after the client's own timeout fires."""
+    monkeypatch.setattr("custom_components.wait_for_wolt.api.REQUEST_TIMEOUT", 0.01)
+    recorder = RecordingSession(TimingOutSession())  # type: ignore[arg-type]
+    api = WoltApi(
+        recorder,  # type: ignore[arg-type]
+        None,
+        "sanitized-access-token",
+        "sanitized-refresh-token",
+        rate_limiter=UNLIMITED,
+    )
+
+    with pytest.raises(WoltConnectionError):
+        await api.fetch_venue_details("sanitized-venue")
+    assert await api.fetch_venue_details("sanitized-venue") == {
+        "venue": {"online": True}
+    }
+    recorder.save(tmp_path / "recorded.json")
+
+    cassette = Cassette.load(tmp_path / "recorded.json")
+    assert [item.get("error") for item in cassette.interactions] == ["timeout", None]
+    replayed = WoltApi(
+        ReplaySession(cassette),  # type: ignore[arg-type]
+        None,
+        "sanitized-access-token",
+        "sanitized-refresh-token",
+        rate_limiter=UNLIMITED,
+    )
+    with pytest.raises(WoltConnectionError):
+        await replayed.fetch_venue_details("sanitized-venue")
+    assert await replayed.fetch_venue_details("sanitized-venue") == {
+        "venue": {"online": True}
+    }
+
+
+async def test_synthetic_delivery_replays_through_coordinator_and_sensor(
+    hass: HomeAssistant,
+) -> None:
+    """Replay a recorded delivery offline, including 304s and a detail timeout."""
+    replay = ReplaySession(Cassette.load("synthetic_delivery.json"))
+    api = WoltApi(
+        replay,  # type: ignore[arg-type]
+        None,
+        "sanitized-access-token",
+        "sanitized-refresh-token",
+        rate_limiter=UNLIMITED,
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = WoltDataUpdateCoordinator(hass, entry, api)
+    sensor = WoltOrderStatusSensor(
+        coordinator, entry.entry_id, "sanitized-purchase-001"
+    )
+
+    states = []
+    while replay.remaining("GET", ACTIVE_ORDERS_URL):
+        coordinator.data = await coordinator._async_update_data()
+        states.append(sensor.native_value)
+
+    assert states == [
+        *["pending"] * 2,
+        *["preparing"] * 4,
+        "pending",
+        "picked_up",
+        *["on_the_way"] * 3,
+        "arriving",
+        *["delivered"] * 2,
+    ]
+    assert api.token_stats.reactive_refreshes == 1
+    assert api.cache_stats.not_modified_responses == 12
+    assert replay.position == pytest.approx(660)
@@ -0,0 +1,83 @@
+"""Tests for the Home Assistant-independent optional-endpoint circuit breaker."""
+
+from custom_components.wait_for_wolt.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    """Create a breaker with small synthetic thresholds."""
+    return CircuitBreaker(
+        failure_threshold=2, cooldown=60, max_cooldown=200, clock=clock
+    )
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    """Tolerate isolated failures but stop after the threshold is reached."""
+    breaker = make_breaker(FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_allows_one_probe_and_closes_on_success() -> None:
+    """Probe once after the cool-down and resume normal traffic on success."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now = 60
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_doubles_cooldown_up_to_the_maximum() -> None:
+    """Back off exponentially while the endpoint keeps failing."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    for expected_cooldown in (120, 200, 200):
+        clock.now += breaker.as_dict()["cooldown_seconds"]
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.as_dict()["cooldown_seconds"] == expected_cooldown
+
+
+def test_released_probe_can_be_retried() -> None:
+    """Return the probe when its request ended without an endpoint verdict."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 60
+
+    assert breaker.allow_request()
+    breaker.release()
+
+    assert breaker.allow_request()
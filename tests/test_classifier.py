@@ -0,0 +1,237 @@
+"""Tests for the one-pass Wolt order classifier."""
+
+import random
+import re
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from custom_components.wait_for_wolt.classifier import (
+    MAX_ETA_DEPTH,
+    STATUS_CACHE_SIZE,
+    OrderClassification,
+    classify_order,
+    classify_order_status,
+    extract_order_eta,
+    normalize_order_status,
+)
+
+# The token scans the compiled classifier replaced, kept as a reference.
+REFERENCE_FINAL_TOKENS = (
+    "delivered",
+    "completed",
+    "finished",
+    "cancel",
+    "fail",
+    "reject",
+    "refund",
+)
+REFERENCE_STATUS_TOKENS = (
+    ("cancelled", ("cancel", "refunded")),
+    ("failed", ("fail", "reject", "declin")),
+    ("delivered", ("delivered", "completed", "finished")),
+    ("arriving", ("arriv", "nearby", "almost_there")),
+    ("on_the_way", ("on_the_way", "en_route", "courier_delivery", "delivery")),
+    ("picked_up", ("picked_up", "courier_pickup")),
+    ("ready_for_pickup", ("ready", "awaiting_pickup")),
+    ("preparing", ("prepar", "production", "restaurant")),
+    ("pending", ("pending", "received", "created", "in_progress", "accepted")),
+)
+
+
+def reference_normalize(order: dict[str, Any]) -> str:
+    """Classify a status the way the scanning implementation did."""
+    status_type = order["telemetry"]["order_status_type"]
+    status = order["status"]["value"] or status_type
+    if str(status_type).upper() != "IN_PROGRESS":
+        raw = status_type
+    else:
+        display = re.sub(r"[^a-z0-9]+", "_", status.strip().lower()).strip("_")
+        final = any(token in display for token in REFERENCE_FINAL_TOKENS)
+        raw = status_type if final else status
+    if not raw:
+        return "unknown"
+    value = re.sub(r"[^a-z0-9]+", "_", raw.casefold()).strip("_")
+    for normalized, tokens in REFERENCE_STATUS_TOKENS:
+        if any(token in value for token in tokens):
+            return normalized
+    return "unknown"
+
+
+def status_corpus(count: int) -> list[str]:
+    """Build display strings mixing status tokens, noise, case, and separators."""
+    words = [token for _, tokens in REFERENCE_STATUS_TOKENS for token in tokens] + [
+        "In progress",
+        "Order received",
+        "Courier",
+        "pick",
+        "ed",
+        "up",
+        "on",
+        "the",
+        "way",
+        "REFUND",
+        "ß",
+        "İ",
+        "new private state",
+        "",
+    ]
+    rng = random.Random(20300101)
+    corpus = []
+    for _ in range(count):
+        parts = rng.choices(words, k=rng.randint(1, 4))
+        separator = rng.choice(["", " ", "_", "-", ". ", " / "])
+        text = separator.join(parts)
+        corpus.append(rng.choice([str.upper, str.title, str])(text))
+    return corpus
+
+
+@pytest.mark.parametrize(
+    ("order", "expected"),
+    [
+        (
+            {
+                "telemetry": {"order_status_type": "IN_PROGRESS"},
+                "status": {"value": "Preparing your order"},
+                "delivery_eta": "2030-01-01T12:30:00Z",
+            },
+            OrderClassification(
+                True,
+                "Preparing your order",
+                "preparing",
+                datetime(2030, 1, 1, 12, 30, tzinfo=UTC),
+            ),
+        ),
+        (
+            {
+                "telemetry": {"order_status_type": "IN_PROGRESS"},
+                "status": {"value": "Delivered"},
+            },
+            OrderClassification(True, "IN_PROGRESS", "pending", None),
+        ),
+        (
+            {"telemetry": None, "call_to_action": {"link": "ORDER_TRACKING"}},
+            OrderClassification(False, None, "unknown", None),
+        ),
+        (
+            {"order_status_type": "DELIVERED", "status": "On the way"},
+            OrderClassification(False, "DELIVERED", "delivered", None),
+        ),
+        (
+            {"call_to_action": {"type": "order_tracking"}, "status": "Delivered"},
+            OrderClassification(True, "Delivered", "delivered", None),
+        ),
+        (
+            {"status": {"text": "Courier nearby"}},
+            OrderClassification(True, "Courier nearby", "arriving", None),
+        ),
+        (
+            {"status": "Order refunded"},
+            OrderClassification(False, "Order refunded", "cancelled", None),
+        ),
+        ({}, OrderClassification(False, None, "unknown", None)),
+    ],
+)
+def test_order_is_classified_in_one_pass(
+    order: dict[str, Any], expected: OrderClassification
+) -> None:
+    """Apply telemetry, legacy status type, call to action, then status text."""
+    assert classify_order(order) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Preparing your order", "preparing"),
+        ("READY_FOR_PICKUP", "ready_for_pickup"),
+        ("Courier picked up", "picked_up"),
+        ("On the way", "on_the_way"),
+        ("Courier nearby", "arriving"),
+        ("CANCELLED", "cancelled"),
+        ("REJECTED", "failed"),
+        ("new private state", "unknown"),
+    ],
+)
+def test_order_status_normalization_is_stable(raw: str, expected: str) -> None:
+    """Keep automations stable when Wolt changes display text."""
+    assert normalize_order_status({"status": {"value": raw}}) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2030-01-01T12:30:00Z", datetime(2030, 1, 1, 12, 30, tzinfo=UTC)),
+        (1893501000000, datetime(2030, 1, 1, 12, 30, tzinfo=UTC)),
+        (35, None),
+        (0, None),
+        (-1, None),
+        ({"min": 25, "max": 35}, None),
+        (True, None),
+        ("25-35 min", None),
+        (None, None),
+    ],
+)
+def test_order_eta_requires_an_explicit_timestamp(value: Any, expected: Any) -> None:
+    """Never guess a timestamp from Wolt's human-readable duration text."""
+    assert extract_order_eta({"delivery_eta": value}) == expected
+
+
+@pytest.mark.parametrize("status_type", ["IN_PROGRESS", "DELIVERED", ""])
+def test_compiled_classifier_matches_the_token_scans(status_type: str) -> None:
+    """Keep every precedence decision of the scanning implementation."""
+    for status in status_corpus(5000):
+        order = {
+            "telemetry": {"order_status_type": status_type or status},
+            "status": {"value": status},
+        }
+        assert normalize_order_status(order) == reference_normalize(order), status
+
+
+def test_status_classification_is_memoized_within_a_bound() -> None:
+    """Reuse results for Wolt's repeated strings without unbounded growth."""
+    classify_order_status.cache_clear()
+    for _ in range(3):
+        for status in ("Preparing your order", "On the way", "Delivered"):
+            classify_order_status(status)
+    for status in status_corpus(STATUS_CACHE_SIZE * 2):
+        classify_order_status(status)
+
+    info = classify_order_status.cache_info()
+    assert info.hits >= 6
+    assert info.currsize <= STATUS_CACHE_SIZE
+
+
+def nested_eta(depth: int, value: Any) -> dict[str, Any]:
+    """Wrap ``value`` in ``depth`` levels of ETA objects."""
+    for _ in range(depth):
+        value = {"value": value}
+    return value
+
+
+def test_nested_eta_objects_are_searched_within_a_depth_limit() -> None:
+    """Parse nested ETA objects iteratively without recursing without bound."""
+    timestamp = "2030-01-01T12:30:00Z"
+
+    assert extract_order_eta(
+        {"delivery_eta": nested_eta(MAX_ETA_DEPTH, timestamp)}
+    ) == datetime(2030, 1, 1, 12, 30, tzinfo=UTC)
+    assert (
+        extract_order_eta({"delivery_eta": nested_eta(MAX_ETA_DEPTH + 1, timestamp)})
+        is None
+    )
+    assert extract_order_eta({"delivery_eta": nested_eta(100_000, timestamp)}) is None
+    assert (
+        extract_order_eta(
+            {"delivery_eta": {"min": timestamp, "max": {"value": "25-35 min"}}}
+        )
+        is None
+    )
+    assert extract_order_eta(
+        {"delivery_eta": {"value": {"end": 35}, "end": 1893501000}}
+    ) == datetime(2030, 1, 1, 12, 30, tzinfo=UTC)
+
+
+def test_oversized_eta_strings_are_rejected_without_parsing() -> None:
+    """Never parse or cache strings that cannot be timestamps."""
+    assert extract_order_eta({"delivery_eta": "2030-01-01T12:30:00Z" * 1000}) is None
@@ -10,6 +10,9 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.wait_for_wolt import async_reload_entry
 from custom_components.wait_for_wolt.const import (
     CONF_BEARER_TOKEN,
+    CONF_DETAIL_CONCURRENCY,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_ID,
     CONF_VENUE_IDS,
@@ -110,10 +113,12 @@ async def test_options_update_credentials_venues_and_reload(
             CONF_BEARER_TOKEN: "sanitized-access-token-next",
             CONF_REFRESH_TOKEN: "sanitized-refresh-token-next",
             CONF_VENUE_IDS: "sanitized-venue\nsecond-sanitized-venue",
+            CONF_DETAIL_CONCURRENCY: 3,
         },
     )
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_DETAIL_CONCURRENCY] == 3
     assert entry.data[CONF_SESSION_ID] == "sanitized-session-id-next"
     assert entry.data[CONF_BEARER_TOKEN] == "sanitized-access-token-next"
     assert entry.data[CONF_REFRESH_TOKEN] == "sanitized-refresh-token-next"
@@ -142,11 +147,37 @@ async def test_options_blank_secret_fields_preserve_saved_tokens(
     )
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_DETAIL_CONCURRENCY] == 1
     assert entry.data[CONF_SESSION_ID] == ""
     assert entry.data[CONF_BEARER_TOKEN] == "sanitized-access-token"
     assert entry.data[CONF_REFRESH_TOKEN] == "sanitized-refresh-token"
 
 
+async def test_options_reject_inverted_poll_bounds(hass: HomeAssistant) -> None:
+    """Keep the form open when the fastest interval exceeds the slowest."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MIN_POLL_INTERVAL: 120, CONF_MAX_POLL_INTERVAL: 60},
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_poll_bounds"}
+    assert entry.options == {}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MIN_POLL_INTERVAL: 60, CONF_MAX_POLL_INTERVAL: 600},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_MIN_POLL_INTERVAL] == 60
+    assert entry.options[CONF_MAX_POLL_INTERVAL] == 600
+
+
 async def test_reauthentication_updates_credentials_and_reloads(
     hass: HomeAssistant,
 ) -> None:
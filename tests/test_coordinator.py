@@ -1,7 +1,10 @@
 """Tests for shared Wolt polling and Home Assistant error semantics."""
 
-from datetime import timedelta
-from unittest.mock import AsyncMock, call
+import asyncio
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import Any
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntryAuthFailed
@@ -16,20 +19,37 @@ from custom_components.wait_for_wolt.api import (
     WoltInvalidPayloadError,
     WoltRateLimitError,
 )
-from custom_components.wait_for_wolt.const import DOMAIN
+from custom_components.wait_for_wolt.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from custom_components.wait_for_wolt.const import (
+    CONF_DEDICATED_SESSION,
+    CONF_DETAIL_CONCURRENCY,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_VENUE_OPENING_HOURS,
+    DOMAIN,
+    ORDER_DETAILS_URL,
+)
 from custom_components.wait_for_wolt.coordinator import (
     ACTIVE_UPDATE_INTERVAL,
     IDLE_UPDATE_INTERVAL,
+    NEW_ORDERS,
+    VENUE_CONCURRENCY,
+    VENUE_UPDATE_INTERVAL,
     WoltDataUpdateCoordinator,
+    WoltVenueCoordinator,
 )
 
 
 def make_coordinator(
     hass: HomeAssistant,
     api: AsyncMock,
+    options: dict[str, Any] | None = None,
 ) -> WoltDataUpdateCoordinator:
     """Create a coordinator with a synthetic config entry."""
-    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options=options or {})
     entry.add_to_hass(hass)
     return WoltDataUpdateCoordinator(hass, entry, api)
 
@@ -60,16 +80,16 @@ async def test_coordinator_fetches_one_shared_active_order_snapshot(
 
     data = await coordinator._async_update_data()
 
-    assert data.orders == {
-        "purchase-active": active,
-        "purchase-complete": completed,
-        "purchase-second": second_active,
+    assert {
+        order_id: (order.active, order.status)
+        for order_id, order in data.orders.items()
+    } == {
+        "purchase-active": (True, "on_the_way"),
+        "purchase-complete": (False, "delivered"),
+        "purchase-second": (True, "on_the_way"),
     }
     assert data.active_order_ids == frozenset({"purchase-active", "purchase-second"})
-    assert data.details == {
-        "purchase-active": {"status": {"value": "On the way"}},
-        "purchase-second": {"status": {"value": "On the way"}},
-    }
+    assert data.detailed_order_ids == frozenset({"purchase-active", "purchase-second"})
     assert coordinator.update_interval == ACTIVE_UPDATE_INTERVAL
     api.fetch_orders.assert_awaited_once_with()
     assert api.fetch_order_details.await_args_list == [
@@ -90,11 +110,36 @@ async def test_coordinator_uses_conservative_idle_interval(
 
     assert data.orders == {}
     assert data.active_order_ids == frozenset()
-    assert data.details == {}
+    assert data.detailed_order_ids == frozenset()
     assert coordinator.update_interval == IDLE_UPDATE_INTERVAL
     api.fetch_order_details.assert_not_awaited()
 
 
+async def test_preparing_order_polls_within_configured_bounds(
+    hass: HomeAssistant,
+) -> None:
+    """Poll a preparing order slowly, but never slower than the maximum option."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(1)
+    api.fetch_order_details.return_value = {
+        "status": "Preparing your order",
+        "delivery_eta": "2030-01-01T12:40:00+00:00",
+    }
+    coordinator = make_coordinator(
+        hass, api, {CONF_MIN_POLL_INTERVAL: 45, CONF_MAX_POLL_INTERVAL: 240}
+    )
+
+    with patch(
+        "custom_components.wait_for_wolt.coordinator.dt_util.utcnow",
+        return_value=datetime(2030, 1, 1, 12, 0, tzinfo=UTC),
+    ):
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(minutes=4)
+        api.fetch_order_details.return_value = {"status": "On the way"}
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=45)
+
+
 @pytest.mark.parametrize(
     "error",
     [WoltConnectionError("not ready", status=404), WoltInvalidPayloadError("changed")],
@@ -115,9 +160,10 @@ async def test_optional_tracking_failure_keeps_order_summary_available(
 
     data = await make_coordinator(hass, api)._async_update_data()
 
-    assert data.orders == {"purchase-active": active}
+    assert list(data.orders) == ["purchase-active"]
+    assert data.orders["purchase-active"].status == "pending"
     assert data.active_order_ids == frozenset({"purchase-active"})
-    assert data.details == {}
+    assert data.detailed_order_ids == frozenset()
 
 
 async def test_optional_tracking_warning_is_not_repeated_each_active_poll(
@@ -162,6 +208,21 @@ async def test_coordinator_translates_update_failures(
         await make_coordinator(hass, api)._async_update_data()
 
 
+async def test_rate_limit_failure_defers_the_next_poll(
+    hass: HomeAssistant,
+) -> None:
+    """Hand Wolt's Retry-After to Home Assistant's coordinator scheduling."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.side_effect = WoltRateLimitError(
+        "limited", status=429, retry_after=120
+    )
+
+    with pytest.raises(UpdateFailed) as err:
+        await make_coordinator(hass, api)._async_update_data()
+
+    assert err.value.retry_after == 120
+
+
 async def test_coordinator_translates_auth_failure_to_reauthentication(
     hass: HomeAssistant,
 ) -> None:
@@ -173,6 +234,410 @@ async def test_coordinator_translates_auth_failure_to_reauthentication(
         await make_coordinator(hass, api)._async_update_data()
 
 
+def active_orders(count: int) -> list[dict[str, Any]]:
+    """Build synthetic in-progress orders in reverse ID order."""
+    return [
+        {
+            "purchase_id": f"purchase-{index:03}",
+            "telemetry": {"order_status_type": "IN_PROGRESS"},
+        }
+        for index in reversed(range(count))
+    ]
+
+
+async def test_detail_concurrency_is_bounded_and_order_is_deterministic(
+    hass: HomeAssistant,
+) -> None:
+    """Overlap at most N detail requests and keep results in purchase-ID order."""
+    in_flight = 0
+    peak = 0
+
+    async def fetch_order_details(order_id: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Finish later orders first to prove ordering does not follow completion.
+        await asyncio.sleep(0.001 * (10 - int(order_id[-3:])))
+        in_flight -= 1
+        if order_id == "purchase-002":
+            raise WoltConnectionError("not ready", status=404)
+        return {"status": order_id}
+
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(5)
+    api.fetch_order_details.side_effect = fetch_order_details
+    coordinator = make_coordinator(hass, api, {CONF_DETAIL_CONCURRENCY: 3})
+
+    data = await coordinator._async_update_data()
+
+    assert peak == 3
+    assert sorted(data.detailed_order_ids) == [
+        "purchase-000",
+        "purchase-001",
+        "purchase-003",
+        "purchase-004",
+    ]
+    assert data.active_order_ids == frozenset(
+        f"purchase-{index:03}" for index in range(5)
+    )
+
+
+async def test_default_detail_fetching_stays_sequential(
+    hass: HomeAssistant,
+) -> None:
+    """Keep one rich tracking request in flight unless the user opts in."""
+    in_flight = 0
+    peak = 0
+
+    async def fetch_order_details(order_id: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"status": order_id}
+
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(3)
+    api.fetch_order_details.side_effect = fetch_order_details
+
+    await make_coordinator(hass, api)._async_update_data()
+
+    assert peak == 1
+    assert api.fetch_order_details.await_args_list == [
+        call("purchase-000"),
+        call("purchase-001"),
+        call("purchase-002"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (WoltAuthenticationError("rejected", status=401), ConfigEntryAuthFailed),
+        (WoltRateLimitError("limited", status=429), UpdateFailed),
+    ],
+)
+async def test_concurrent_detail_fatal_errors_abort_the_cycle(
+    hass: HomeAssistant,
+    error: Exception,
+    expected: type[Exception],
+) -> None:
+    """Abort on authentication or rate-limit errors from any parallel request."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(4)
+    api.fetch_order_details.side_effect = [{}, error, {}, {}]
+
+    with pytest.raises(expected):
+        await make_coordinator(
+            hass, api, {CONF_DETAIL_CONCURRENCY: 4}
+        )._async_update_data()
+
+
+async def test_open_detail_circuit_serves_summary_and_probes_after_cooldown(
+    hass: HomeAssistant,
+) -> None:
+    """Stop polling a failing rich endpoint and probe it again after cool-down."""
+    now = 0.0
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(1)
+    api.fetch_order_details.side_effect = WoltConnectionError("down", status=503)
+    coordinator = make_coordinator(hass, api)
+    coordinator.detail_breaker = CircuitBreaker(
+        failure_threshold=2, cooldown=60, max_cooldown=600, clock=lambda: now
+    )
+
+    for _ in range(4):
+        data = await coordinator._async_update_data()
+
+    assert api.fetch_order_details.await_count == 2
+    assert coordinator.detail_breaker.state is CircuitState.OPEN
+    assert data.detailed_order_ids == frozenset()
+    assert data.active_order_ids == frozenset({"purchase-000"})
+
+    now = 60
+    api.fetch_order_details.side_effect = None
+    api.fetch_order_details.return_value = {"status": "delivery"}
+    data = await coordinator._async_update_data()
+
+    assert api.fetch_order_details.await_count == 3
+    assert coordinator.detail_breaker.state is CircuitState.CLOSED
+    assert data.detailed_order_ids == frozenset({"purchase-000"})
+    assert data.orders["purchase-000"].status == "on_the_way"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [WoltConnectionError("not ready", status=404), WoltInvalidPayloadError("empty")],
+)
+async def test_unpopulated_new_order_does_not_open_the_detail_circuit(
+    hass: HomeAssistant,
+    error: Exception,
+) -> None:
+    """Keep probing rich tracking while Wolt has not populated a new order."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(1)
+    api.fetch_order_details.side_effect = error
+    coordinator = make_coordinator(hass, api)
+    coordinator.detail_breaker = CircuitBreaker(
+        failure_threshold=2, cooldown=60, max_cooldown=600, clock=lambda: 0.0
+    )
+
+    for _ in range(4):
+        data = await coordinator._async_update_data()
+
+    assert api.fetch_order_details.await_count == 4
+    assert coordinator.detail_breaker.state is CircuitState.CLOSED
+    assert data.active_order_ids == frozenset({"purchase-000"})
+
+
+async def test_expired_keepalive_is_warmed_up_alongside_the_orders_page(
+    hass: HomeAssistant,
+) -> None:
+    """Pre-open restaurant-api connections while the orders page is fetched."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(3)
+    api.fetch_order_details.return_value = {"status": "Preparing your order"}
+    coordinator = make_coordinator(
+        hass,
+        api,
+        {CONF_DEDICATED_SESSION: True, CONF_DETAIL_CONCURRENCY: 2},
+    )
+
+    # No warm-up before an orders page has shown an active order, nor while
+    # polls are fast enough for the keep-alive to hold the connection.
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.update_interval = ACTIVE_UPDATE_INTERVAL
+    coordinator.data = await coordinator._async_update_data()
+    api.async_warm_up.assert_not_awaited()
+
+    # Each request only finishes once the other has started.
+    orders_started = asyncio.Event()
+    warm_up_started = asyncio.Event()
+
+    async def fetch_orders() -> list[dict[str, Any]]:
+        orders_started.set()
+        await warm_up_started.wait()
+        return active_orders(3)
+
+    async def async_warm_up(url: str, connections: int) -> None:
+        warm_up_started.set()
+        await orders_started.wait()
+
+    api.fetch_orders.side_effect = fetch_orders
+    api.async_warm_up.side_effect = async_warm_up
+    coordinator.update_interval = timedelta(minutes=3)
+    async with asyncio.timeout(1):
+        await coordinator._async_update_data()
+
+    api.async_warm_up.assert_awaited_once_with(ORDER_DETAILS_URL, 2)
+
+
+async def test_shared_session_is_not_warmed_up(hass: HomeAssistant) -> None:
+    """Leave Home Assistant's shared connection pool alone by default."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(1)
+
+    await make_coordinator(hass, api)._async_update_data()
+
+    api.async_warm_up.assert_not_awaited()
+
+
+async def test_listeners_hear_only_about_changed_orders(
+    hass: HomeAssistant,
+) -> None:
+    """Skip entities whose order a poll left unchanged, except around failures."""
+    statuses = {"purchase-000": "Preparing", "purchase-001": "Preparing"}
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = active_orders(2)
+    api.fetch_order_details.side_effect = lambda order_id: {
+        "status": statuses[order_id]
+    }
+    coordinator = make_coordinator(hass, api)
+    calls: list[Any] = []
+    contexts = ("purchase-000", "purchase-001", NEW_ORDERS, None)
+    removers = [
+        coordinator.async_add_listener(partial(calls.append, context), context)
+        for context in contexts
+    ]
+
+    async def refresh() -> list[Any]:
+        calls.clear()
+        await coordinator.async_refresh()
+        return calls
+
+    assert await refresh() == list(contexts)
+    assert await refresh() == [None]
+    statuses["purchase-001"] = "On the way"
+    assert await refresh() == [None, "purchase-001"]
+    statuses["purchase-002"] = "Preparing"
+    api.fetch_orders.return_value = active_orders(3)
+    assert await refresh() == [None, NEW_ORDERS]
+    api.fetch_orders.side_effect = WoltConnectionError("offline")
+    assert await refresh() == list(contexts)
+
+    for remove in removers:
+        remove()
+
+
+async def test_listed_order_becoming_active_is_announced_as_new(
+    hass: HomeAssistant,
+) -> None:
+    """Let the platform add entities for a scheduled order once it starts."""
+    order = {
+        "purchase_id": "purchase-000",
+        "telemetry": {"order_status_type": "SCHEDULED"},
+    }
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_orders.return_value = [order]
+    api.fetch_order_details.return_value = {"status": "Preparing"}
+    coordinator = make_coordinator(hass, api)
+    calls: list[Any] = []
+    remove = coordinator.async_add_listener(
+        partial(calls.append, NEW_ORDERS), NEW_ORDERS
+    )
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    calls.clear()
+
+    order["telemetry"]["order_status_type"] = "IN_PROGRESS"
+    await coordinator.async_refresh()
+
+    assert coordinator.data.active_order_ids == {"purchase-000"}
+    assert calls == [NEW_ORDERS]
+    remove()
+
+
+async def test_venue_cycle_fetches_every_slug_with_bounded_concurrency(
+    hass: HomeAssistant,
+) -> None:
+    """Fetch all venues in one cycle, a few at a time, keeping partial results."""
+    slugs = [f"sanitized-venue-{index:02}" for index in range(VENUE_CONCURRENCY * 3)]
+    in_flight = 0
+    most_in_flight = 0
+
+    async def fetch_venue_details(slug: str) -> dict[str, Any]:
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if slug == "sanitized-venue-00":
+            raise WoltConnectionError("offline")
+        return {"venue": {"delivery_open_status": {"is_open": True}}}
+
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_venue_details.side_effect = fetch_venue_details
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = WoltVenueCoordinator(hass, entry, api, [*slugs, slugs[1]])
+
+    venues = await coordinator._async_update_data()
+
+    assert api.fetch_venue_details.await_count == len(slugs)
+    assert most_in_flight == VENUE_CONCURRENCY
+    assert list(venues) == slugs[1:]
+    assert all(venue.is_open for venue in venues.values())
+
+
+async def test_venue_cycle_fails_only_when_no_venue_answers(
+    hass: HomeAssistant,
+) -> None:
+    """Honor Wolt's cool-down when every venue request is rate limited."""
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_venue_details.side_effect = WoltRateLimitError(
+        "limited", status=429, retry_after=120
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = WoltVenueCoordinator(hass, entry, api, ["sanitized-venue"])
+
+    with pytest.raises(UpdateFailed) as err:
+        await coordinator._async_update_data()
+
+    assert err.value.retry_after == 120
+
+
+@pytest.mark.parametrize(("opening_hours", "closed_fetches"), [(True, 1), (False, 3)])
+async def test_closed_venue_is_not_fetched_again_until_it_opens(
+    hass: HomeAssistant,
+    opening_hours: bool,
+    closed_fetches: int,
+) -> None:
+    """Keep a closed venue's last state overnight while open venues are polled."""
+    now = datetime(2030, 1, 1, 23, 0, tzinfo=UTC)
+    payloads = {
+        "sanitized-open": {"venue": {"delivery_open_status": {"is_open": True}}},
+        "sanitized-closed": {
+            "venue": {
+                "delivery_open_status": {
+                    "is_open": False,
+                    "next_open": "2030-01-02T08:00:00Z",
+                }
+            }
+        },
+    }
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_venue_details.side_effect = payloads.__getitem__
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={}, options={CONF_VENUE_OPENING_HOURS: opening_hours}
+    )
+    entry.add_to_hass(hass)
+    coordinator = WoltVenueCoordinator(hass, entry, api, list(payloads))
+
+    with patch(
+        "custom_components.wait_for_wolt.coordinator.dt_util.utcnow",
+        side_effect=lambda: now,
+    ):
+        for _ in range(3):
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.update_interval == VENUE_UPDATE_INTERVAL
+            now += coordinator.update_interval
+
+    fetched = [item.args[0] for item in api.fetch_venue_details.await_args_list]
+    assert fetched.count("sanitized-open") == 3
+    assert fetched.count("sanitized-closed") == closed_fetches
+    assert list(coordinator.data) == list(payloads)
+    assert not coordinator.data["sanitized-closed"].is_open
+
+
+async def test_failed_venue_does_not_hide_venues_that_were_not_due(
+    hass: HomeAssistant,
+) -> None:
+    """Drop only the venue that failed while a closed venue keeps its state."""
+    now = datetime(2030, 1, 1, 23, 0, tzinfo=UTC)
+    payloads = {
+        "sanitized-open": {"venue": {"delivery_open_status": {"is_open": True}}},
+        "sanitized-closed": {
+            "venue": {
+                "delivery_open_status": {
+                    "is_open": False,
+                    "next_open": "2030-01-02T08:00:00Z",
+                }
+            }
+        },
+    }
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_venue_details.side_effect = payloads.__getitem__
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = WoltVenueCoordinator(hass, entry, api, list(payloads))
+
+    with patch(
+        "custom_components.wait_for_wolt.coordinator.dt_util.utcnow",
+        side_effect=lambda: now,
+    ):
+        await coordinator.async_refresh()
+        now += coordinator.update_interval
+        api.fetch_venue_details.side_effect = WoltConnectionError("offline")
+        await coordinator.async_refresh()
+
+    api.fetch_venue_details.assert_awaited_with("sanitized-open")
+    assert api.fetch_venue_details.await_count == 3
+    assert coordinator.last_update_success
+    assert list(coordinator.data) == ["sanitized-closed"]
+
+
 def test_poll_intervals_are_intentionally_conservative() -> None:
     """Document the active and idle request-volume policy."""
     assert timedelta(seconds=30) == ACTIVE_UPDATE_INTERVAL
@@ -8,6 +8,8 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.wait_for_wolt.api import WoltApi
+from custom_components.wait_for_wolt.circuit_breaker import CircuitBreaker
 from custom_components.wait_for_wolt.const import (
     CONF_BEARER_TOKEN,
     CONF_REFRESH_TOKEN,
@@ -22,6 +24,8 @@ from custom_components.wait_for_wolt.coordinator import (
 from custom_components.wait_for_wolt.diagnostics import (
     async_get_config_entry_diagnostics,
 )
+from custom_components.wait_for_wolt.rate_limit import WoltRateLimiter
+from custom_components.wait_for_wolt.stats import EndpointStats
 
 
 async def test_diagnostics_expose_counts_without_credentials_or_order_pii(
@@ -39,7 +43,7 @@ async def test_diagnostics_expose_counts_without_credentials_or_order_pii(
         options={CONF_VENUE_IDS: ["private-venue-slug"]},
     )
     coordinator = Mock()
-    coordinator.data = WoltCoordinatorData(
+    coordinator.data = WoltCoordinatorData.from_payloads(
         orders={
             "private-purchase-id": {
                 "purchase_id": "private-purchase-id",
@@ -56,7 +60,33 @@ async def test_diagnostics_expose_counts_without_credentials_or_order_pii(
     )
     coordinator.last_update_success = True
     coordinator.update_interval = timedelta(seconds=30)
-    entry.runtime_data = WoltRuntimeData(Mock(), coordinator)
+    coordinator.detail_breaker = CircuitBreaker(
+        failure_threshold=1, cooldown=60, max_cooldown=600, clock=lambda: 0.0
+    )
+    coordinator.detail_breaker.record_failure()
+    limiter = WoltRateLimiter((10, 0.5), clock=lambda: 0.0)
+    api = WoltApi(
+        Mock(),
+        None,
+        "private-access-token",
+        "private-refresh-token",
+        rate_limiter=limiter,
+    )
+    limiter.bucket("consumer-api.wolt.com").penalize(30)
+    limiter.bucket("restaurant-api.wolt.com").reserve(0)
+    stats = api.endpoint_stats.setdefault("orders", EndpointStats())
+    stats.requests = 2
+    stats.record_status(200)
+    stats.record_status(429)
+    stats.bytes_received = 512
+    stats.latency.record(0.08)
+    stats.latency.record(0.3)
+    api.token_stats.reactive_refreshes = 1
+    api.cache_stats.conditional_requests = 3
+    api.cache_stats.not_modified_responses = 2
+    api.cache_stats.bytes_saved = 1024
+    api.cache_stats.parses_saved = 2
+    entry.runtime_data = WoltRuntimeData(api, coordinator)
 
     diagnostics = await async_get_config_entry_diagnostics(hass, entry)
     serialized = json.dumps(diagnostics)
@@ -79,4 +109,57 @@ async def test_diagnostics_expose_counts_without_credentials_or_order_pii(
         "active_order_count": 1,
         "rich_detail_count": 1,
         "update_interval_seconds": 30,
+        "rich_tracking_circuit": {
+            "state": "open",
+            "consecutive_failures": 1,
+            "cooldown_seconds": 60,
+            "retry_in_seconds": 60,
+        },
+    }
+    assert diagnostics["api"] == {
+        "endpoints": {
+            "orders": {
+                "requests": 2,
+                "status_classes": {"2xx": 1, "4xx": 1},
+                "timeouts": 0,
+                "connection_errors": 0,
+                "rate_limited": 1,
+                "bytes_received": 512,
+                "latency": {
+                    "p50_ms": 100,
+                    "p95_ms": 500,
+                    "p99_ms": 500,
+                    "buckets": {
+                        "le_50ms": 0,
+                        "le_100ms": 1,
+                        "le_250ms": 0,
+                        "le_500ms": 1,
+                        "le_1000ms": 0,
+                        "le_2500ms": 0,
+                        "le_5000ms": 0,
+                        "le_10000ms": 0,
+                        "overflow": 0,
+                    },
+                },
+            }
+        },
+        "token_refreshes": {"reactive_refreshes": 1, "proactive_refreshes": 0},
+        "response_cache": {
+            "conditional_requests": 3,
+            "not_modified_responses": 2,
+            "bytes_saved": 1024,
+            "parses_saved": 2,
+        },
+        "rate_limit_budget": {
+            "consumer-api.wolt.com": {
+                "remaining": 0,
+                "retry_in_seconds": 30,
+                "cool_down_seconds": 30,
+            },
+            "restaurant-api.wolt.com": {
+                "remaining": 9,
+                "retry_in_seconds": 0,
+                "cool_down_seconds": 0,
+            },
+        },
     }
@@ -0,0 +1,99 @@
+"""Tests for the local fake Wolt server used by load benchmarks."""
+
+import aiohttp
+import pytest
+
+from benchmarks.fake_wolt import FakeWoltServer, Phase
+from custom_components.wait_for_wolt.api import (
+    WoltApi,
+    WoltAuthenticationError,
+    WoltRateLimitError,
+)
+
+LIFECYCLE = (
+    Phase("Order received", 10),
+    Phase("On the way", 10),
+    Phase("Delivered", 0, telemetry="DELIVERED"),
+)
+
+
+async def test_api_follows_scripted_lifecycle_and_token_expiry() -> None:
+    """Advance one synthetic order to delivery, refreshing an expired token."""
+    now = 0.0
+    async with (
+        FakeWoltServer(
+            lifecycle=LIFECYCLE,
+            token_lifetime=15,
+            jwt_tokens=False,
+            clock=lambda: now,
+        ) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        account = server.add_account()
+        api = WoltApi(
+            session,
+            None,
+            account.access_token,
+            account.refresh_token,
+            base_url=server.url,
+        )
+        statuses = []
+        for _ in range(3):
+            orders = await api.fetch_active_orders()
+            statuses.append(
+                [
+                    (await api.fetch_order_details(order["purchase_id"]))["status"]
+                    for order in orders
+                ]
+            )
+            now += 10
+
+    assert statuses == [["Order received"], ["On the way"], []]
+    assert api.token_stats.reactive_refreshes == 1
+    assert server.stats["refreshes"] == 1
+
+
+async def test_fake_server_throttles_with_retry_after() -> None:
+    """Inject 429 responses that the client turns into a typed cool-down."""
+    async with (
+        FakeWoltServer(throttle_rate=1.0, retry_after=7) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        account = server.add_account()
+        api = WoltApi(
+            session,
+            None,
+            account.access_token,
+            account.refresh_token,
+            base_url=server.url,
+        )
+        with pytest.raises(WoltRateLimitError) as err:
+            await api.fetch_orders()
+
+    assert err.value.retry_after == 7
+    assert server.stats["throttled"] == 1
+
+
+async def test_fake_server_rejects_reused_refresh_tokens() -> None:
+    """Rotate refresh tokens once, like Wolt's single-use web flow."""
+    async with (
+        FakeWoltServer() as server,
+        aiohttp.ClientSession() as session,
+    ):
+        account = server.add_account()
+        clients = [
+            WoltApi(
+                session,
+                None,
+                "sanitized-invalid-access-token",
+                account.refresh_token,
+                base_url=server.url,
+            )
+            for _ in range(2)
+        ]
+        assert await clients[0].fetch_orders()
+        with pytest.raises(WoltAuthenticationError):
+            await clients[1].fetch_orders()
+
+    assert server.stats["refreshes"] == 1
+    assert server.stats["rejected_refreshes"] == 1
@@ -1,12 +1,21 @@
 """Tests for the Wait for Wolt config-entry lifecycle."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import ANY, AsyncMock, Mock, call, patch
 
 from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
+from custom_components.wait_for_wolt import async_migrate_entry
 from custom_components.wait_for_wolt.api import (
     WoltApi,
     WoltAuthenticationError,
@@ -14,12 +23,18 @@ from custom_components.wait_for_wolt.api import (
 )
 from custom_components.wait_for_wolt.const import (
     CONF_BEARER_TOKEN,
+    CONF_DEDICATED_SESSION,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_ID,
     CONF_VENUE_IDS,
     DOMAIN,
 )
 from custom_components.wait_for_wolt.coordinator import WoltCoordinatorData
+from custom_components.wait_for_wolt.snapshot import (
+    STORAGE_MINOR_VERSION,
+    STORAGE_VERSION,
+)
+from custom_components.wait_for_wolt.token_persistence import TOKEN_PERSIST_DELAY
 
 ENTRY_DATA = {
     "name": "Sanitized Wolt",
@@ -37,8 +52,9 @@ async def test_config_entry_setup_rotation_reload_and_unload(
     entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
     entry.add_to_hass(hass)
     api = Mock()
+    api.async_close = AsyncMock()
     coordinator = Mock()
-    coordinator.data = WoltCoordinatorData({}, frozenset(), {})
+    coordinator.data = WoltCoordinatorData.from_payloads({}, frozenset(), {})
     coordinator.async_config_entry_first_refresh = AsyncMock()
     cancel_listener = Mock()
     coordinator.async_add_listener.return_value = cancel_listener
@@ -57,7 +73,7 @@ async def test_config_entry_setup_rotation_reload_and_unload(
         await hass.async_block_till_done()
         assert entry.state is ConfigEntryState.LOADED
         coordinator.async_config_entry_first_refresh.assert_awaited_once_with()
-        coordinator_class.assert_called_once_with(hass, entry, api)
+        coordinator_class.assert_called_once_with(hass, entry, api, snapshot_store=ANY)
 
         token_callback = api_class.call_args.kwargs["token_update_callback"]
         with patch.object(
@@ -65,6 +81,11 @@ async def test_config_entry_setup_rotation_reload_and_unload(
         ) as reload_entry:
             token_callback("rotated-access-token", "rotated-refresh-token")
             await hass.async_block_till_done()
+            assert entry.data[CONF_BEARER_TOKEN] == "sanitized-access-token"
+            async_fire_time_changed(
+                hass, dt_util.utcnow() + timedelta(seconds=TOKEN_PERSIST_DELAY)
+            )
+            await hass.async_block_till_done()
             assert entry.data[CONF_BEARER_TOKEN] == "rotated-access-token"
             assert entry.data[CONF_REFRESH_TOKEN] == "rotated-refresh-token"
             reload_entry.assert_not_awaited()
@@ -93,7 +114,135 @@ async def test_config_entry_setup_rotation_reload_and_unload(
         await hass.async_block_till_done()
 
     assert entry.state is ConfigEntryState.NOT_LOADED
-    cancel_listener.assert_called_once_with()
+    api.async_close.assert_awaited_once_with()
+    # The sensor platform listens for new orders and for expired finished orders.
+    assert coordinator.async_add_listener.call_count == 2
+    assert cancel_listener.call_args_list == [call(), call()]
+
+
+async def test_token_rotations_are_coalesced_and_flushed_on_unload(
+    hass: HomeAssistant,
+) -> None:
+    """Write only the newest rotated pair, once, when the entry unloads.
+
+    A rotation still finishing at unload is part of that write.
+    """
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+    coordinator = Mock()
+    coordinator.data = WoltCoordinatorData.from_payloads({}, frozenset(), {})
+    coordinator.async_config_entry_first_refresh = AsyncMock()
+
+    with (
+        patch("custom_components.wait_for_wolt.WoltApi") as api_class,
+        patch(
+            "custom_components.wait_for_wolt.WoltDataUpdateCoordinator",
+            return_value=coordinator,
+        ),
+    ):
+        api_class.return_value.async_close = AsyncMock()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        token_callback = api_class.call_args.kwargs["token_update_callback"]
+
+        async def finish_rotation() -> None:
+            # A background refresh that completes while the entry unloads.
+            token_callback("rotated-access-3", "rotated-refresh-3")
+
+        api_class.return_value.async_close.side_effect = finish_rotation
+
+        with patch.object(
+            hass.config_entries,
+            "async_update_entry",
+            wraps=hass.config_entries.async_update_entry,
+        ) as update_entry:
+            for index in range(3):
+                token_callback(f"rotated-access-{index}", f"rotated-refresh-{index}")
+            await hass.async_block_till_done()
+            update_entry.assert_not_called()
+
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+        assert update_entry.call_count == 1
+    assert entry.data[CONF_BEARER_TOKEN] == "rotated-access-3"
+    assert entry.data[CONF_REFRESH_TOKEN] == "rotated-refresh-3"
+
+
+async def test_pending_rotation_never_overwrites_reentered_credentials(
+    hass: HomeAssistant,
+) -> None:
+    """Drop a queued rotation of old tokens once the user enters new ones."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+    coordinator = Mock()
+    coordinator.data = WoltCoordinatorData.from_payloads({}, frozenset(), {})
+    coordinator.async_config_entry_first_refresh = AsyncMock()
+
+    with (
+        patch("custom_components.wait_for_wolt.WoltApi") as api_class,
+        patch(
+            "custom_components.wait_for_wolt.WoltDataUpdateCoordinator",
+            return_value=coordinator,
+        ),
+    ):
+        api_class.return_value.async_close = AsyncMock()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        token_callback = api_class.call_args.kwargs["token_update_callback"]
+        token_callback("stale-rotated-access", "stale-rotated-refresh")
+
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                CONF_BEARER_TOKEN: "reentered-access-token",
+                CONF_REFRESH_TOKEN: "reentered-refresh-token",
+            },
+        )
+        await hass.async_block_till_done()
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.data[CONF_BEARER_TOKEN] == "reentered-access-token"
+    assert entry.data[CONF_REFRESH_TOKEN] == "reentered-refresh-token"
+
+
+async def test_dedicated_session_is_used_and_closed_on_unload(
+    hass: HomeAssistant,
+) -> None:
+    """Own a tuned Wolt connection pool only when the option is enabled."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=ENTRY_DATA, options={CONF_DEDICATED_SESSION: True}
+    )
+    entry.add_to_hass(hass)
+    session = Mock()
+    session.close = AsyncMock()
+    coordinator = Mock()
+    coordinator.data = WoltCoordinatorData.from_payloads({}, frozenset(), {})
+    coordinator.async_config_entry_first_refresh = AsyncMock()
+
+    with (
+        patch(
+            "custom_components.wait_for_wolt.create_session",
+            return_value=session,
+        ),
+        patch("custom_components.wait_for_wolt.WoltApi") as api_class,
+        patch(
+            "custom_components.wait_for_wolt.WoltDataUpdateCoordinator",
+            return_value=coordinator,
+        ),
+    ):
+        api_class.return_value.async_close = AsyncMock()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert api_class.call_args.args[0] is session
+        session.close.assert_not_awaited()
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    session.close.assert_awaited_once_with()
 
 
 async def test_transient_first_refresh_enters_setup_retry(
@@ -142,8 +291,9 @@ async def test_loaded_entry_reauthentication_schedules_exactly_one_reload(
     entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
     entry.add_to_hass(hass)
     api = Mock()
+    api.async_close = AsyncMock()
     coordinator = Mock()
-    coordinator.data = WoltCoordinatorData({}, frozenset(), {})
+    coordinator.data = WoltCoordinatorData.from_payloads({}, frozenset(), {})
     coordinator.async_config_entry_first_refresh = AsyncMock()
 
     with (
@@ -182,3 +332,188 @@ async def test_loaded_entry_reauthentication_schedules_exactly_one_reload(
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "reauth_successful"
     reload_entry.assert_awaited_once_with(entry.entry_id)
+
+
+async def test_stored_snapshot_sets_up_without_waiting_for_wolt(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Restore the last snapshot as stale and refresh from Wolt in the background."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshot"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": STORAGE_MINOR_VERSION,
+        "key": f"{DOMAIN}.{entry.entry_id}.snapshot",
+        "data": {
+            "orders": [
+                {
+                    "id": "sanitized-purchase-001",
+                    "active": True,
+                    "status": "preparing",
+                    "eta": "2030-01-01T12:30:00+00:00",
+                }
+            ]
+        },
+    }
+    wolt_responded = asyncio.Event()
+
+    async def fetch_orders() -> list[dict[str, Any]]:
+        await wolt_responded.wait()
+        return [
+            {
+                "purchase_id": "sanitized-purchase-001",
+                "status": {"value": "On the way"},
+                "telemetry": {"order_status_type": "IN_PROGRESS"},
+            }
+        ]
+
+    with (
+        patch.object(WoltApi, "fetch_orders", side_effect=fetch_orders),
+        patch.object(
+            WoltApi,
+            "fetch_order_details",
+            AsyncMock(side_effect=WoltConnectionError("offline")),
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.state is ConfigEntryState.LOADED
+        status = hass.states.get("sensor.wolt_order_status")
+        assert status.state == "preparing"
+        assert status.attributes["stale"] is True
+
+        wolt_responded.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        status = hass.states.get("sensor.wolt_order_status")
+        assert status.state == "on_the_way"
+        assert "stale" not in status.attributes
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshot"]["data"]
+    assert stored["orders"] == [
+        {
+            "id": "sanitized-purchase-001",
+            "active": True,
+            "status": "on_the_way",
+            "eta": None,
+        }
+    ]
+
+
+async def test_venues_are_fetched_without_delaying_setup(
+    hass: HomeAssistant,
+) -> None:
+    """Add venue entities at once and fill them from the first venue cycle.
+
+    Estimate sensors are added once the cycle shows which delivery methods the
+    venue offers.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=ENTRY_DATA,
+        options={CONF_VENUE_IDS: ["sanitized-venue"]},
+    )
+    entry.add_to_hass(hass)
+    wolt_responded = asyncio.Event()
+
+    async def fetch_venue_details(slug: str) -> dict[str, Any]:
+        await wolt_responded.wait()
+        return {
+            "venue": {
+                "delivery_open_status": {"is_open": True},
+                "delivery_configs": [
+                    {"method": "homedelivery", "estimate": {"min": 20, "max": 30}}
+                ],
+            }
+        }
+
+    with (
+        patch.object(WoltApi, "fetch_orders", AsyncMock(return_value=[])),
+        patch.object(
+            WoltApi, "fetch_venue_details", side_effect=fetch_venue_details
+        ) as fetch_venue,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.state is ConfigEntryState.LOADED
+        venue = hass.states.get("sensor.sanitized_wolt_sanitized_venue")
+        assert venue.state == "unavailable"
+
+        wolt_responded.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        venue = hass.states.get("sensor.sanitized_wolt_sanitized_venue")
+        assert venue.state == "open"
+        assert "homedelivery_estimate_min" not in venue.attributes
+        estimate = hass.states.get(
+            "sensor.sanitized_wolt_sanitized_venue_homedelivery_estimate_min"
+        )
+        assert estimate.state == "20"
+        assert estimate.attributes["unit_of_measurement"] == "min"
+        fetch_venue.assert_awaited_once_with("sanitized-venue")
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_migration_scopes_legacy_order_entities_once(
+    hass: HomeAssistant,
+) -> None:
+    """Rewrite legacy order unique IDs at load, leaving venues and collisions."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, version=1)
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+
+    def register(unique_id: str) -> er.RegistryEntry:
+        return registry.async_get_or_create(
+            "sensor", DOMAIN, unique_id, config_entry=entry
+        )
+
+    legacy = register("wolt_sanitized-purchase-001")
+    venue = register("wolt_venue_sanitized-venue")
+    duplicate = register("wolt_sanitized-purchase-002")
+    register(f"{entry.entry_id}_sanitized-purchase-002_status")
+
+    assert await async_migrate_entry(hass, entry)
+
+    assert entry.version == 2
+    migrated = registry.async_get(legacy.entity_id)
+    assert migrated.unique_id == f"{entry.entry_id}_sanitized-purchase-001_status"
+    assert migrated.translation_key == "order_status"
+    assert migrated.has_entity_name
+    assert registry.async_get(venue.entity_id).unique_id == venue.unique_id
+    assert registry.async_get(duplicate.entity_id).unique_id == duplicate.unique_id
+
+
+async def test_migration_never_touches_another_entrys_legacy_entity(
+    hass: HomeAssistant,
+) -> None:
+    """Never steal another account's legacy registry entity on an ID collision."""
+    first_entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, version=1)
+    first_entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    legacy = registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "wolt_sanitized-purchase-001",
+        config_entry=first_entry,
+    )
+    second_entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, version=1)
+    second_entry.add_to_hass(hass)
+
+    assert await async_migrate_entry(hass, second_entry)
+
+    unchanged = registry.async_get(legacy.entity_id)
+    assert unchanged.config_entry_id == first_entry.entry_id
+    assert unchanged.unique_id == "wolt_sanitized-purchase-001"
+
+
+async def test_migration_refuses_entries_from_a_newer_release(
+    hass: HomeAssistant,
+) -> None:
+    """Fail setup instead of guessing at a newer entry layout after a downgrade."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, version=3)
+    entry.add_to_hass(hass)
+
+    assert not await async_migrate_entry(hass, entry)
+    assert entry.version == 3
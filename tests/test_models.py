@@ -0,0 +1,105 @@
+"""Tests for the parse-once Wolt order and venue models."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from custom_components.wait_for_wolt.classifier import classify_order
+from custom_components.wait_for_wolt.models import WoltOrder, WoltVenue
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_order_is_parsed_once_from_summary_and_details() -> None:
+    """Keep only used fields, letting rich details override the summary."""
+    order = WoltOrder.from_payload(
+        "sanitized-purchase-001",
+        {
+            "purchase_id": "sanitized-purchase-001",
+            "status": {"value": "In progress"},
+            "telemetry": {"order_status_type": "IN_PROGRESS"},
+            "venue": {"name": "Sanitized Test Venue"},
+            "items": [{"name": "Sanitized item"}],
+        },
+        {"status": "On the way", "delivery_eta": "2030-01-01T12:30:00Z"},
+        active=True,
+    )
+
+    assert order == WoltOrder(
+        purchase_id="sanitized-purchase-001",
+        active=True,
+        raw_status="On the way",
+        status="on_the_way",
+        eta=datetime(2030, 1, 1, 12, 30, tzinfo=UTC),
+        venue_name="Sanitized Test Venue",
+    )
+    assert not hasattr(order, "__dict__")
+
+
+def test_order_without_details_uses_the_summary() -> None:
+    """Fall back to the order page when rich tracking is unavailable."""
+    order = WoltOrder.from_payload(
+        "sanitized-purchase-001",
+        {"telemetry": {"order_status_type": "DELIVERED"}, "venue": "unexpected"},
+        active=False,
+    )
+
+    assert order.status == "delivered"
+    assert order.raw_status == "DELIVERED"
+    assert order.eta is None
+    assert order.venue_name is None
+
+
+def test_summary_classification_is_reused_without_details() -> None:
+    """Classify each summary once when discovery has already classified it."""
+    summary = {"telemetry": {"order_status_type": "IN_PROGRESS"}}
+    classification = classify_order(summary)
+
+    with patch("custom_components.wait_for_wolt.models.classify_order") as classify:
+        order = WoltOrder.from_payload(
+            "sanitized-purchase-001",
+            summary,
+            active=True,
+            classification=classification,
+        )
+        classify.assert_not_called()
+        WoltOrder.from_payload(
+            "sanitized-purchase-001",
+            summary,
+            {"status": "On the way"},
+            active=True,
+            classification=classification,
+        )
+        classify.assert_called_once()
+
+    assert order.status == "pending"
+
+
+def test_venue_opening_times_are_parsed_once() -> None:
+    """Keep the raw opening times as attributes and parse them for scheduling."""
+    details = json.loads((FIXTURES / "venue_closed.json").read_text())
+
+    venue = WoltVenue.from_payload("sanitized-venue", details)
+
+    assert not venue.is_open
+    assert venue.next_open == datetime(2030, 1, 2, 8, 0, tzinfo=UTC)
+    assert venue.next_close is None
+    assert venue.attributes["next_open"] == "2030-01-02T08:00:00Z"
+
+
+def test_venue_estimates_are_numbers_kept_out_of_attributes() -> None:
+    """Expose numeric estimates for measurement sensors, dropping other values."""
+    details = json.loads((FIXTURES / "venue_open.json").read_text())
+    details["venue"]["delivery_configs"].append(
+        {"method": "takeaway", "estimate": {"min": "soon", "max": 15}}
+    )
+
+    venue = WoltVenue.from_payload("sanitized-venue", details)
+
+    assert venue.estimates == {
+        "homedelivery_estimate_min": 20,
+        "homedelivery_estimate_max": 30,
+        "takeaway_estimate_max": 15,
+    }
+    assert not any("estimate" in key for key in venue.attributes)
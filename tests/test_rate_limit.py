@@ -0,0 +1,110 @@
+"""Tests for the Home Assistant-independent per-host request budget."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from custom_components.wait_for_wolt.rate_limit import (
+    TokenBucket,
+    WoltRateLimiter,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_allows_burst_then_delays_then_denies() -> None:
+    """Spend the burst immediately, queue short waits, and refuse long ones."""
+    clock = FakeClock()
+    bucket = TokenBucket(2, 0.5, clock=clock)
+
+    assert bucket.reserve(max_delay=10) == 0
+    assert bucket.reserve(max_delay=10) == 0
+    assert bucket.reserve(max_delay=10) == 2
+    assert bucket.reserve(max_delay=3) is None
+    assert bucket.remaining == 0
+
+    clock.now += 10
+    assert bucket.remaining == pytest.approx(2)
+
+
+def test_bucket_penalty_blocks_until_retry_after_elapses() -> None:
+    """Honor a server cool-down even when local tokens would remain."""
+    clock = FakeClock()
+    bucket = TokenBucket(10, 1, clock=clock)
+
+    bucket.penalize(30)
+
+    assert bucket.reserve(max_delay=60) is None
+    assert bucket.retry_after == 30
+    clock.now += 31
+    assert bucket.reserve(max_delay=60) == 0
+
+
+def test_spare_reservation_never_borrows_the_headroom() -> None:
+    """Leave tokens for other requests and report when one is spare again."""
+    clock = FakeClock()
+    bucket = TokenBucket(4, 0.5, clock=clock)
+
+    assert bucket.reserve_spare(2) == 0
+    assert bucket.reserve_spare(2) == 0
+    assert bucket.reserve_spare(2) == 2
+    assert bucket.remaining == 2
+    assert bucket.reserve(max_delay=0) == 0
+    assert bucket.reserve_spare(2) == 4
+
+    clock.now += 4
+    assert bucket.reserve_spare(2) == 0
+    bucket.penalize(30)
+    assert bucket.reserve_spare(2) is None
+
+
+def test_limiter_keeps_an_independent_bucket_per_host() -> None:
+    """Never let one Wolt host's penalty starve another host."""
+    limiter = WoltRateLimiter((5, 1), {"auth.example": (1, 0.1)}, clock=FakeClock())
+
+    limiter.bucket("consumer.example").penalize(60)
+    limiter.bucket("auth.example")
+
+    assert limiter.remaining_budget() == {"consumer.example": 0, "auth.example": 1}
+    assert limiter.as_dict() == {
+        "auth.example": {
+            "remaining": 1,
+            "retry_in_seconds": 0,
+            "cool_down_seconds": 0,
+        },
+        "consumer.example": {
+            "remaining": 0,
+            "retry_in_seconds": 60,
+            "cool_down_seconds": 60,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("120", 120),
+        (" 1.5 ", 1.5),
+        ("-5", 0),
+        ("Tue, 01 Jan 2030 12:01:00 GMT", 60),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_retry_after_accepts_seconds_and_http_dates(
+    value: str | None,
+    expected: float | None,
+) -> None:
+    """Parse both Retry-After forms defined by RFC 9110."""
+    now = datetime(2030, 1, 1, 12, tzinfo=UTC)
+
+    assert parse_retry_after(value, now=now) == expected
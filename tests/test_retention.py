@@ -0,0 +1,87 @@
+"""Tests for the retention window of finished orders."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.wait_for_wolt.coordinator import WoltCoordinatorData
+from custom_components.wait_for_wolt.retention import (
+    REMOVAL_BATCH_SIZE,
+    WoltOrderRetention,
+)
+
+KEY = "wait_for_wolt.sanitized-entry.retention"
+STARTED = datetime(2030, 1, 1, 12, tzinfo=UTC)
+WINDOW = timedelta(hours=24)
+
+
+def orders(statuses: dict[str, str]) -> WoltCoordinatorData:
+    """Build parsed orders with the given telemetry statuses."""
+    return WoltCoordinatorData.from_payloads(
+        {
+            order_id: {
+                "purchase_id": order_id,
+                "telemetry": {"order_status_type": status},
+            }
+            for order_id, status in statuses.items()
+        },
+        frozenset(
+            order_id for order_id, status in statuses.items() if status == "IN_PROGRESS"
+        ),
+        {},
+    )
+
+
+async def test_finish_times_survive_a_restart(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Keep counting the window from the first time an order was seen finished."""
+    data = orders({"sanitized-purchase-001": "DELIVERED"})
+    tracked = {"sanitized-purchase-001"}
+    retention = WoltOrderRetention(hass, "sanitized-entry", WINDOW)
+    await retention.async_load()
+
+    assert retention.async_expired(data.orders, tracked, STARTED) == []
+    await retention.async_flush()
+    assert KEY in hass_storage
+
+    restarted = WoltOrderRetention(hass, "sanitized-entry", WINDOW)
+    await restarted.async_load()
+    assert restarted.async_expired(data.orders, tracked, STARTED + WINDOW) == [
+        "sanitized-purchase-001"
+    ]
+
+
+async def test_missing_orders_expire_and_active_orders_reset(
+    hass: HomeAssistant,
+) -> None:
+    """Treat vanished orders as finished, but restart the window for active ones."""
+    retention = WoltOrderRetention(hass, "sanitized-entry", WINDOW)
+    tracked = {"sanitized-purchase-001", "sanitized-purchase-002"}
+    finished = orders({"sanitized-purchase-001": "DELIVERED"})
+    reopened = orders({"sanitized-purchase-001": "IN_PROGRESS"})
+
+    retention.async_expired(finished.orders, tracked, STARTED)
+    retention.async_expired(reopened.orders, tracked, STARTED + WINDOW)
+
+    assert retention.async_expired(
+        finished.orders, tracked, STARTED + WINDOW + timedelta(hours=1)
+    ) == ["sanitized-purchase-002"]
+
+
+async def test_expired_orders_are_reported_in_bounded_batches(
+    hass: HomeAssistant,
+) -> None:
+    """Never hand back more than one removal batch per update."""
+    tracked = {f"sanitized-purchase-{index:03}" for index in range(50)}
+    retention = WoltOrderRetention(hass, "sanitized-entry", WINDOW)
+
+    retention.async_expired({}, tracked, STARTED)
+    first = retention.async_expired({}, tracked, STARTED + WINDOW)
+    retention.async_forget(first)
+    second = retention.async_expired({}, tracked - set(first), STARTED + WINDOW)
+
+    assert len(first) == len(second) == REMOVAL_BATCH_SIZE
+    assert not set(first) & set(second)
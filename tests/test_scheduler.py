@@ -0,0 +1,133 @@
+"""Tests for the Home Assistant-independent adaptive polling schedule."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.wait_for_wolt.models import WoltOrder, WoltVenue
+from custom_components.wait_for_wolt.scheduler import (
+    PREPARING_INTERVAL,
+    VENUE_OPENING_LEAD,
+    VENUE_SAFETY_INTERVAL,
+    PollScheduler,
+    VenuePollScheduler,
+)
+
+NOW = datetime(2030, 1, 1, 12, 0, tzinfo=UTC)
+SCHEDULER = PollScheduler(
+    min_interval=timedelta(seconds=30), max_interval=timedelta(minutes=5)
+)
+VENUE_SCHEDULER = VenuePollScheduler(interval=timedelta(minutes=5))
+
+
+def order(
+    status: str,
+    eta_in: timedelta | None = None,
+    *,
+    active: bool = True,
+    purchase_id: str = "sanitized-purchase-001",
+) -> WoltOrder:
+    """Build a parsed order with an ETA relative to ``NOW``."""
+    return WoltOrder(
+        purchase_id=purchase_id,
+        active=active,
+        raw_status=status,
+        status=status,
+        eta=NOW + eta_in if eta_in is not None else None,
+        venue_name=None,
+    )
+
+
+@pytest.mark.parametrize(
+    ("orders", "expected"),
+    [
+        ([], timedelta(minutes=5)),
+        ([order("delivered", active=False)], timedelta(minutes=5)),
+        ([order("delivered")], timedelta(minutes=5)),
+        ([order("pending")], PREPARING_INTERVAL),
+        ([order("preparing", timedelta(minutes=40))], timedelta(minutes=5)),
+        ([order("preparing", timedelta(minutes=12))], timedelta(minutes=3)),
+        ([order("preparing", timedelta(minutes=4))], timedelta(seconds=30)),
+        ([order("preparing", timedelta(minutes=-10))], timedelta(seconds=30)),
+        ([order("on_the_way", timedelta(minutes=30))], timedelta(seconds=30)),
+        ([order("arriving")], timedelta(seconds=30)),
+    ],
+)
+def test_interval_follows_status_and_time_to_eta(
+    orders: list[WoltOrder], expected: timedelta
+) -> None:
+    """Poll slowly while preparing, fast near delivery, and idle when finished."""
+    assert SCHEDULER.next_interval(orders, NOW) == expected
+
+
+def test_most_urgent_active_order_wins() -> None:
+    """Serve the order closest to arrival when several are active."""
+    orders = [
+        order("preparing", timedelta(minutes=40), purchase_id="sanitized-slow"),
+        order("preparing", timedelta(minutes=8), purchase_id="sanitized-soon"),
+        order("on_the_way", active=False, purchase_id="sanitized-history"),
+    ]
+
+    assert SCHEDULER.next_interval(orders, NOW) == timedelta(minutes=2)
+
+
+def test_bounds_clamp_every_interval() -> None:
+    """Keep configured bounds even when they are tighter than the defaults."""
+    scheduler = PollScheduler(
+        min_interval=timedelta(minutes=1), max_interval=timedelta(minutes=3)
+    )
+
+    assert scheduler.next_interval([order("arriving")], NOW) == timedelta(minutes=1)
+    assert scheduler.next_interval([], NOW) == timedelta(minutes=3)
+    assert scheduler.next_interval(
+        [order("preparing", timedelta(minutes=40))], NOW
+    ) == timedelta(minutes=3)
+
+
+def venue(
+    is_open: bool,
+    opens_in: timedelta | None = None,
+    closes_in: timedelta | None = None,
+) -> WoltVenue:
+    """Build a parsed venue that opens or closes relative to ``NOW``."""
+    return WoltVenue(
+        slug="sanitized-venue",
+        is_open=is_open,
+        attributes={},
+        estimates={},
+        next_open=NOW + opens_in if opens_in is not None else None,
+        next_close=NOW + closes_in if closes_in is not None else None,
+    )
+
+
+@pytest.mark.parametrize(
+    ("parsed", "expected"),
+    [
+        (None, timedelta(minutes=5)),
+        (venue(True), timedelta(minutes=5)),
+        (venue(True, closes_in=timedelta(minutes=3)), timedelta(minutes=3)),
+        (venue(True, closes_in=timedelta(hours=2)), timedelta(minutes=5)),
+        (venue(False), timedelta(minutes=5)),
+        (venue(False, timedelta(minutes=-10)), timedelta(minutes=5)),
+        (venue(False, timedelta(minutes=1)), timedelta(minutes=1)),
+        (
+            venue(False, timedelta(minutes=30)),
+            timedelta(minutes=30) - VENUE_OPENING_LEAD,
+        ),
+        (venue(False, timedelta(hours=9)), VENUE_SAFETY_INTERVAL),
+    ],
+)
+def test_closed_venues_wait_for_their_opening_time(
+    parsed: WoltVenue | None, expected: timedelta
+) -> None:
+    """Fetch open venues regularly and closed ones around their opening time."""
+    assert VENUE_SCHEDULER.next_fetch(parsed, NOW) == NOW + expected
+
+
+def test_venue_opening_hours_can_be_ignored() -> None:
+    """Keep the regular interval when opening-hours scheduling is turned off."""
+    scheduler = VenuePollScheduler(interval=timedelta(minutes=5), opening_hours=False)
+
+    assert scheduler.next_fetch(
+        venue(False, timedelta(hours=9)), NOW
+    ) == NOW + timedelta(minutes=5)
@@ -1,41 +1,51 @@
 """Tests for Wolt order and venue sensor behavior."""
 
 import json
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import SOURCE_IMPORT
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.wait_for_wolt.api import WoltApi, WoltConnectionError
 from custom_components.wait_for_wolt.const import (
     CONF_BEARER_TOKEN,
+    CONF_ORDER_RETENTION,
     CONF_REFRESH_TOKEN,
     CONF_SESSION_ID,
     CONF_VENUE_IDS,
     DOMAIN,
 )
 from custom_components.wait_for_wolt.coordinator import (
+    NEW_ORDERS,
     WoltCoordinatorData,
     WoltDataUpdateCoordinator,
     WoltRuntimeData,
+    WoltVenueCoordinator,
 )
+from custom_components.wait_for_wolt.models import WoltVenue
+from custom_components.wait_for_wolt.retention import REMOVAL_BATCH_SIZE
 from custom_components.wait_for_wolt.sensor import (
+    API_SENSOR_DESCRIPTIONS,
+    WoltApiDiagnosticSensor,
     WoltOrderEtaSensor,
     WoltOrderStatusSensor,
+    WoltVenueEntity,
+    WoltVenueEstimateSensor,
     WoltVenueSensor,
     async_setup_entry,
     async_setup_platform,
-    extract_order_eta,
-    normalize_order_status,
 )
+from custom_components.wait_for_wolt.stats import EndpointStats
 
 
 def load_json_fixture(name: str) -> Any:
@@ -43,6 +53,15 @@ def load_json_fixture(name: str) -> Any:
     return json.loads((Path(__file__).parent / "fixtures" / name).read_text())
 
 
+def make_venue_coordinator(
+    hass: HomeAssistant, api: AsyncMock, slugs: tuple[str, ...] = ("sanitized-venue",)
+) -> WoltVenueCoordinator:
+    """Create a venue coordinator with a synthetic config entry."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    return WoltVenueCoordinator(hass, entry, api, slugs)
+
+
 def mock_coordinator(data: WoltCoordinatorData) -> Mock:
     """Create the coordinator surface consumed by entities and setup."""
     coordinator = Mock(spec=WoltDataUpdateCoordinator)
@@ -82,7 +101,7 @@ async def test_initial_active_order_is_added_once(hass: HomeAssistant) -> None:
     """Add the first coordinator order once and register dynamic discovery."""
     order_id = "sanitized-purchase-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={order_id: {"purchase_id": order_id}},
             active_order_ids=frozenset({order_id}),
             details={order_id: {"status": "delivery"}},
@@ -100,7 +119,11 @@ async def test_initial_active_order_is_added_once(hass: HomeAssistant) -> None:
     listener = coordinator.async_add_listener.call_args.args[0]
     listener()
 
-    assert add_entities.call_count == 1
+    assert add_entities.call_count == 2
+    assert all(
+        isinstance(entity, WoltApiDiagnosticSensor)
+        for entity in add_entities.call_args_list[0].args[0]
+    )
     entities = add_entities.call_args.args[0]
     assert [entity.order_id for entity in entities] == [order_id, order_id]
     assert [type(entity) for entity in entities] == [
@@ -114,16 +137,19 @@ async def test_coordinator_listener_discovers_only_new_orders(
     hass: HomeAssistant,
 ) -> None:
     """Add an order discovered by a later shared refresh exactly once."""
-    coordinator = mock_coordinator(WoltCoordinatorData({}, frozenset(), {}))
+    coordinator = mock_coordinator(
+        WoltCoordinatorData.from_payloads({}, frozenset(), {})
+    )
     entry = MockConfigEntry(domain=DOMAIN, data={CONF_NAME: "Sanitized Wolt"})
     entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
     entry.add_to_hass(hass)
     add_entities = Mock()
 
     await async_setup_entry(hass, entry, add_entities)
-    listener = coordinator.async_add_listener.call_args.args[0]
+    listener, context = coordinator.async_add_listener.call_args.args
+    assert context is NEW_ORDERS
     order_id = "sanitized-purchase-001"
-    coordinator.data = WoltCoordinatorData(
+    coordinator.data = WoltCoordinatorData.from_payloads(
         orders={order_id: {"purchase_id": order_id}},
         active_order_ids=frozenset({order_id}),
         details={order_id: {"status": "delivery"}},
@@ -131,7 +157,7 @@ async def test_coordinator_listener_discovers_only_new_orders(
     listener()
     listener()
 
-    assert add_entities.call_count == 1
+    assert add_entities.call_count == 2
     assert [entity.order_id for entity in add_entities.call_args.args[0]] == [
         order_id,
         order_id,
@@ -143,7 +169,7 @@ async def test_order_entities_are_typed_scoped_and_privacy_safe() -> None:
     order_id = "sanitized-order-001"
     details = load_json_fixture("order_details.json")["order_details"][0]
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={order_id: {"purchase_id": order_id}},
             active_order_ids=frozenset({order_id}),
             details={order_id: details},
@@ -163,6 +189,9 @@ async def test_order_entities_are_typed_scoped_and_privacy_safe() -> None:
     assert status.extra_state_attributes == {}
     assert "Sanitized item" not in json.dumps(status.extra_state_attributes)
     assert "0.00 TEST" not in json.dumps(status.extra_state_attributes)
+    # Both entities read one precomputed record; state writes allocate nothing.
+    assert status._order is eta._order
+    assert status.extra_state_attributes is eta.extra_state_attributes
     assert status.device_info == eta.device_info
     assert order_id not in status.device_info["name"]
 
@@ -171,11 +200,41 @@ async def test_order_entities_are_typed_scoped_and_privacy_safe() -> None:
     assert not eta.available
 
 
+async def test_api_diagnostic_sensors_report_client_statistics() -> None:
+    """Expose request, latency, and refresh counters as opt-in diagnostics."""
+    api = WoltApi(Mock(), None, "sanitized-access-token", "sanitized-refresh-token")
+    stats = api.endpoint_stats.setdefault("orders", EndpointStats(requests=3))
+    for seconds in (0.04, 0.07, 0.2):
+        stats.latency.record(seconds)
+    api.token_stats.proactive_refreshes = 2
+    coordinator = mock_coordinator(
+        WoltCoordinatorData.from_payloads({}, frozenset(), {})
+    )
+    coordinator.api = api
+    coordinator.last_update_success = False
+
+    sensors = {
+        description.key: WoltApiDiagnosticSensor(coordinator, "entry-001", description)
+        for description in API_SENSOR_DESCRIPTIONS
+    }
+
+    assert {key: sensor.native_value for key, sensor in sensors.items()} == {
+        "api_requests": 3,
+        "api_latency_p95": 250,
+        "token_refreshes": 2,
+    }
+    for sensor in sensors.values():
+        assert sensor.available
+        assert sensor.entity_registry_enabled_default is False
+        assert sensor.entity_category == EntityCategory.DIAGNOSTIC
+    assert sensors["api_requests"].unique_id == "entry-001_api_requests"
+
+
 async def test_order_sensor_normalizes_current_status_object() -> None:
     """Normalize the current purchase-tracking status object."""
     order_id = "sanitized-order-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={order_id: {"purchase_id": order_id}},
             active_order_ids=frozenset({order_id}),
             details={order_id: {"status": {"value": "In progress"}}},
@@ -191,7 +250,7 @@ async def test_order_sensor_keeps_final_status_from_order_summary() -> None:
     """Expose a delivered transition after rich active tracking stops."""
     order_id = "sanitized-order-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={
                 order_id: {
                     "purchase_id": order_id,
@@ -213,7 +272,7 @@ async def test_final_telemetry_overrides_stale_display_status() -> None:
     """Never let stale display text hide an authoritative final state."""
     order_id = "sanitized-order-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={
                 order_id: {
                     "purchase_id": order_id,
@@ -235,7 +294,7 @@ async def test_in_progress_telemetry_rejects_stale_final_display_status() -> Non
     """Keep an authoritative active order active despite stale final display text."""
     order_id = "sanitized-order-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={order_id: {"purchase_id": order_id}},
             active_order_ids=frozenset({order_id}),
             details={
@@ -252,85 +311,16 @@ async def test_in_progress_telemetry_rejects_stale_final_display_status() -> Non
     assert sensor.native_value == "pending"
 
 
-@pytest.mark.parametrize(
-    ("raw", "expected"),
-    [
-        ("Preparing your order", "preparing"),
-        ("READY_FOR_PICKUP", "ready_for_pickup"),
-        ("Courier picked up", "picked_up"),
-        ("On the way", "on_the_way"),
-        ("Courier nearby", "arriving"),
-        ("CANCELLED", "cancelled"),
-        ("REJECTED", "failed"),
-        ("new private state", "unknown"),
-    ],
-)
-def test_order_status_normalization_is_stable(raw: str, expected: str) -> None:
-    """Keep automations stable when Wolt changes display text."""
-    assert normalize_order_status({"status": {"value": raw}}) == expected
-
-
-@pytest.mark.parametrize(
-    ("value", "expected"),
-    [
-        ("2030-01-01T12:30:00Z", datetime(2030, 1, 1, 12, 30, tzinfo=UTC)),
-        (1893501000000, datetime(2030, 1, 1, 12, 30, tzinfo=UTC)),
-        (35, None),
-        (0, None),
-        (-1, None),
-        ({"min": 25, "max": 35}, None),
-        (True, None),
-        ("25-35 min", None),
-        (None, None),
-    ],
-)
-def test_order_eta_requires_an_explicit_timestamp(value: Any, expected: Any) -> None:
-    """Never guess a timestamp from Wolt's human-readable duration text."""
-    assert extract_order_eta({"delivery_eta": value}) == expected
-
-
-async def test_legacy_order_unique_id_migrates_to_scoped_status_entity(
-    hass: HomeAssistant,
-) -> None:
-    """Preserve the existing status entity while adding config-entry scope."""
-    order_id = "sanitized-purchase-001"
-    coordinator = mock_coordinator(
-        WoltCoordinatorData(
-            orders={order_id: {"purchase_id": order_id}},
-            active_order_ids=frozenset({order_id}),
-            details={order_id: {"status": "delivery"}},
-        )
-    )
-    entry = MockConfigEntry(domain=DOMAIN, data={CONF_NAME: "Sanitized Wolt"})
-    entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
-    entry.add_to_hass(hass)
-    registry = er.async_get(hass)
-    legacy = registry.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        f"wolt_{order_id}",
-        config_entry=entry,
-    )
-
-    await async_setup_entry(hass, entry, Mock())
-
-    migrated = registry.async_get(legacy.entity_id)
-    assert migrated is not None
-    assert migrated.unique_id == f"{entry.entry_id}_{order_id}_status"
-    assert migrated.translation_key == "order_status"
-
-
-async def test_inactive_legacy_order_is_migrated_and_restored(
+async def test_inactive_scoped_order_is_restored_after_restart(
     hass: HomeAssistant,
 ) -> None:
-    """Restore an existing final order entity after an upgrade and restart."""
+    """Recreate an existing scoped entity when its order is already final."""
     order_id = "sanitized-purchase-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={
                 order_id: {
                     "purchase_id": order_id,
-                    "status": {"value": "In progress"},
                     "telemetry": {"order_status_type": "DELIVERED"},
                 }
             },
@@ -342,105 +332,163 @@ async def test_inactive_legacy_order_is_migrated_and_restored(
     entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
     entry.add_to_hass(hass)
     registry = er.async_get(hass)
-    legacy = registry.async_get_or_create(
+    registry.async_get_or_create(
         "sensor",
         DOMAIN,
-        f"wolt_{order_id}",
+        f"{entry.entry_id}_{order_id}_status",
         config_entry=entry,
     )
     add_entities = Mock()
 
     await async_setup_entry(hass, entry, add_entities)
 
-    migrated = registry.async_get(legacy.entity_id)
-    assert migrated is not None
-    assert migrated.unique_id == f"{entry.entry_id}_{order_id}_status"
     entities = add_entities.call_args.args[0]
     assert len(entities) == 2
     status = next(
         entity for entity in entities if isinstance(entity, WoltOrderStatusSensor)
     )
-    assert status.available
     assert status.native_value == "delivered"
 
 
-async def test_inactive_scoped_order_is_restored_after_restart(
+async def test_order_discovery_uses_an_incremental_registry_index(
     hass: HomeAssistant,
 ) -> None:
-    """Recreate an existing scoped entity when its order is already final."""
-    order_id = "sanitized-purchase-001"
+    """Never query the registry per poll, but follow registry changes."""
+    history = {
+        f"sanitized-purchase-{index:03}": {
+            "purchase_id": f"sanitized-purchase-{index:03}",
+            "telemetry": {"order_status_type": "DELIVERED"},
+        }
+        for index in range(100)
+    }
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
-            orders={
-                order_id: {
-                    "purchase_id": order_id,
-                    "telemetry": {"order_status_type": "DELIVERED"},
-                }
-            },
-            active_order_ids=frozenset(),
-            details={},
-        )
+        WoltCoordinatorData.from_payloads(history, frozenset(), {})
     )
     entry = MockConfigEntry(domain=DOMAIN, data={CONF_NAME: "Sanitized Wolt"})
     entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
     entry.add_to_hass(hass)
     registry = er.async_get(hass)
+    for order_id in ("sanitized-purchase-001", "sanitized-purchase-002"):
+        registry.async_get_or_create(
+            "sensor", DOMAIN, f"{entry.entry_id}_{order_id}_status", config_entry=entry
+        )
+    add_entities = Mock()
+
+    await async_setup_entry(hass, entry, add_entities)
+    listener = coordinator.async_add_listener.call_args.args[0]
+    assert {entity.order_id for entity in add_entities.call_args.args[0]} == {
+        "sanitized-purchase-001",
+        "sanitized-purchase-002",
+    }
+
     registry.async_get_or_create(
         "sensor",
         DOMAIN,
-        f"{entry.entry_id}_{order_id}_status",
+        f"{entry.entry_id}_sanitized-purchase-003_eta",
         config_entry=entry,
     )
-    add_entities = Mock()
-
-    await async_setup_entry(hass, entry, add_entities)
-
-    entities = add_entities.call_args.args[0]
-    assert len(entities) == 2
-    status = next(
-        entity for entity in entities if isinstance(entity, WoltOrderStatusSensor)
+    removed = registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{entry.entry_id}_sanitized-purchase-004_eta",
+        config_entry=entry,
     )
-    assert status.native_value == "delivered"
+    registry.async_remove(removed.entity_id)
+    await hass.async_block_till_done()
+    add_entities.reset_mock()
+    with patch.object(
+        registry, "async_get_entity_id", wraps=registry.async_get_entity_id
+    ) as get_entity_id:
+        listener()
+        listener()
 
+    assert [entity.order_id for entity in add_entities.call_args.args[0]] == [
+        "sanitized-purchase-003",
+        "sanitized-purchase-003",
+    ]
+    add_entities.assert_called_once()
+    get_entity_id.assert_not_called()
 
-async def test_legacy_entity_is_not_migrated_across_config_entries(
+
+async def test_finished_orders_are_removed_in_batches_after_retention(
     hass: HomeAssistant,
 ) -> None:
-    """Never steal another account's legacy registry entity on an ID collision."""
-    order_id = "sanitized-purchase-001"
-    first_entry = MockConfigEntry(domain=DOMAIN, data={CONF_NAME: "First Wolt"})
-    first_entry.add_to_hass(hass)
-    registry = er.async_get(hass)
-    legacy = registry.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        f"wolt_{order_id}",
-        config_entry=first_entry,
-    )
+    """Remove finished orders' entities and devices once the window has passed."""
+    count = REMOVAL_BATCH_SIZE + 5
+    history = {
+        f"sanitized-purchase-{index:03}": {
+            "purchase_id": f"sanitized-purchase-{index:03}",
+            "telemetry": {"order_status_type": "DELIVERED"},
+        }
+        for index in range(count)
+    }
+    history["sanitized-purchase-000"]["telemetry"] = {
+        "order_status_type": "IN_PROGRESS"
+    }
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
-            orders={order_id: {"purchase_id": order_id}},
-            active_order_ids=frozenset({order_id}),
-            details={},
+        WoltCoordinatorData.from_payloads(
+            history, frozenset({"sanitized-purchase-000"}), {}
         )
     )
-    second_entry = MockConfigEntry(domain=DOMAIN, data={CONF_NAME: "Second Wolt"})
-    second_entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
-    second_entry.add_to_hass(hass)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_NAME: "Sanitized Wolt"},
+        options={CONF_ORDER_RETENTION: 2},
+    )
+    entry.runtime_data = WoltRuntimeData(Mock(spec=WoltApi), coordinator)
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    for order_id in history:
+        device = device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, f"{entry.entry_id}:{order_id}")},
+        )
+        registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{entry.entry_id}_{order_id}_status",
+            config_entry=entry,
+            device_id=device.id,
+        )
+    started = datetime(2030, 1, 1, 12, tzinfo=UTC)
 
-    await async_setup_entry(hass, second_entry, Mock())
+    await async_setup_entry(hass, entry, Mock())
+    remove_expired = coordinator.async_add_listener.call_args_list[0].args[0]
 
-    unchanged = registry.async_get(legacy.entity_id)
-    assert unchanged is not None
-    assert unchanged.config_entry_id == first_entry.entry_id
-    assert unchanged.unique_id == f"wolt_{order_id}"
+    def remaining_orders() -> set[str]:
+        return {
+            entity.unique_id.removeprefix(f"{entry.entry_id}_").removesuffix("_status")
+            for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+        }
+
+    with patch(
+        "custom_components.wait_for_wolt.sensor.dt_util.utcnow",
+        side_effect=[started, started + timedelta(hours=1)]
+        + [started + timedelta(hours=3)] * 3,
+    ):
+        remove_expired()
+        remove_expired()
+        assert remaining_orders() == set(history)
+        remove_expired()
+        await hass.async_block_till_done()
+        assert len(remaining_orders()) == count - REMOVAL_BATCH_SIZE
+        remove_expired()
+        await hass.async_block_till_done()
+        remove_expired()
+
+    assert remaining_orders() == {"sanitized-purchase-000"}
+    assert [
+        device.identifiers
+        for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+    ] == [{(DOMAIN, f"{entry.entry_id}:sanitized-purchase-000")}]
 
 
 def test_order_unique_ids_are_scoped_to_the_config_entry() -> None:
     """Avoid collisions when two Wolt accounts expose different purchases."""
     order_id = "sanitized-purchase-001"
     coordinator = mock_coordinator(
-        WoltCoordinatorData(
+        WoltCoordinatorData.from_payloads(
             orders={order_id: {}},
             active_order_ids=frozenset({order_id}),
             details={},
@@ -458,27 +506,38 @@ def test_order_unique_ids_are_scoped_to_the_config_entry() -> None:
     [("venue_open.json", "open"), ("venue_closed.json", "closed")],
 )
 async def test_venue_sensor_state_and_availability(
+    hass: HomeAssistant,
     fixture_name: str,
     expected_state: str,
 ) -> None:
     """Handle open and explicitly closed venues without assuming metadata exists."""
     api = AsyncMock(spec=WoltApi)
     api.fetch_venue_details.return_value = load_json_fixture(fixture_name)
-    sensor = WoltVenueSensor(api, "sanitized-venue", "Wolt sanitized-venue")
+    coordinator = make_venue_coordinator(hass, api)
+    sensor = WoltVenueSensor(coordinator, "sanitized-venue", "Wolt sanitized-venue")
+    assert not sensor.available
 
-    await sensor.async_update()
+    await coordinator.async_refresh()
 
     assert sensor.unique_id == "wolt_venue_sanitized-venue"
     assert sensor.native_value == expected_state
     assert sensor.available
 
     api.fetch_venue_details.side_effect = WoltConnectionError("offline")
-    await sensor.async_update()
-
+    with patch(
+        "custom_components.wait_for_wolt.coordinator.dt_util.utcnow",
+        # The next scheduled cycle, when the venue is due again.
+        return_value=dt_util.utcnow() + coordinator.update_interval,
+    ):
+        await coordinator.async_refresh()
+
+    assert api.fetch_venue_details.await_count == 2
     assert not sensor.available
 
 
-async def test_venue_sensor_respects_explicit_closed_status() -> None:
+async def test_venue_sensor_respects_explicit_closed_status(
+    hass: HomeAssistant,
+) -> None:
     """Prefer an explicit closed status over broader online metadata."""
     api = AsyncMock(spec=WoltApi)
     api.fetch_venue_details.return_value = {
@@ -487,9 +546,63 @@ async def test_venue_sensor_respects_explicit_closed_status() -> None:
             "delivery_open_status": {"is_open": False},
         }
     }
-    sensor = WoltVenueSensor(api, "sanitized-venue", "Wolt sanitized-venue")
+    coordinator = make_venue_coordinator(hass, api)
+    sensor = WoltVenueSensor(coordinator, "sanitized-venue", "Wolt sanitized-venue")
 
-    await sensor.async_update()
+    await coordinator.async_refresh()
 
     assert sensor.available
     assert sensor.native_value == "closed"
+
+
+async def test_venue_sensors_write_state_only_when_it_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Skip venue cycles that change nothing a sensor shows or records."""
+    payload = load_json_fixture("venue_open.json")
+    api = AsyncMock(spec=WoltApi)
+    api.fetch_venue_details.return_value = payload
+    coordinator = make_venue_coordinator(hass, api)
+    status = WoltVenueSensor(coordinator, "sanitized-venue", "Wolt sanitized-venue")
+    estimate = WoltVenueEstimateSensor(
+        coordinator,
+        "sanitized-venue",
+        "homedelivery_estimate_max",
+        "Wolt sanitized-venue",
+    )
+    await coordinator.async_refresh()
+
+    def publish(changed: dict[str, Any]) -> None:
+        """Set a new venue snapshot and notify both sensors."""
+        coordinator.async_set_updated_data(
+            {
+                "sanitized-venue": WoltVenue.from_payload(
+                    "sanitized-venue", {**payload, "venue": payload["venue"] | changed}
+                )
+            }
+        )
+        status._handle_coordinator_update()
+        estimate._handle_coordinator_update()
+
+    with patch.object(WoltVenueEntity, "async_write_ha_state") as write:
+        publish({})
+        assert write.call_count == 2
+        publish({})
+        assert write.call_count == 2
+        publish({"banners": [{"formatted_text": "Sanitized discount"}]})
+        assert write.call_count == 3
+        publish(
+            {
+                "delivery_configs": [
+                    {"method": "homedelivery", "estimate": {"min": 20, "max": 35}}
+                ]
+            }
+        )
+        assert write.call_count == 4
+
+    assert estimate.native_value == 35
+    assert estimate.native_unit_of_measurement == UnitOfTime.MINUTES
+    assert estimate.state_class == SensorStateClass.MEASUREMENT
+    assert estimate.unique_id == "wolt_venue_sanitized-venue_homedelivery_estimate_max"
+    recorded = set(status.extra_state_attributes) - status._unrecorded_attributes
+    assert recorded == {"online", "open_status", "is_venue_favourite"}
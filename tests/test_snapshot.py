@@ -0,0 +1,103 @@
+"""Tests for the stored order snapshot used at setup."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.wait_for_wolt.coordinator import WoltCoordinatorData
+from custom_components.wait_for_wolt.snapshot import (
+    MAX_STORED_ORDERS,
+    STORAGE_MINOR_VERSION,
+    STORAGE_VERSION,
+    WoltSnapshotStore,
+)
+
+KEY = "wait_for_wolt.sanitized-entry.snapshot"
+
+
+def history(count: int) -> WoltCoordinatorData:
+    """Build a parsed snapshot whose last order is the only active one."""
+    orders = {
+        f"sanitized-purchase-{index:03}": {
+            "purchase_id": f"sanitized-purchase-{index:03}",
+            "status": {"value": "Delivered"},
+            "telemetry": {"order_status_type": "DELIVERED"},
+            "venue": {"name": "Sanitized Test Venue"},
+        }
+        for index in range(count)
+    }
+    active_id = f"sanitized-purchase-{count - 1:03}"
+    orders[active_id]["telemetry"] = {"order_status_type": "IN_PROGRESS"}
+    details = {
+        active_id: {
+            "status": "Preparing your order",
+            "delivery_eta": "2030-01-01T12:30:00Z",
+        }
+    }
+    return WoltCoordinatorData.from_payloads(orders, frozenset({active_id}), details)
+
+
+async def test_snapshot_round_trip_keeps_only_entity_fields(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Store status and ETA without venue names, and restore them as stale."""
+    data = history(3)
+    store = WoltSnapshotStore(hass, "sanitized-entry")
+
+    store.async_save(data.orders)
+    await store.async_flush()
+
+    assert "Sanitized Test Venue" not in str(hass_storage[KEY])
+    restored = WoltCoordinatorData.from_restored(
+        await WoltSnapshotStore(hass, "sanitized-entry").async_load()
+    )
+    assert restored.restored
+    assert restored.active_order_ids == frozenset({"sanitized-purchase-002"})
+    order = restored.orders["sanitized-purchase-002"]
+    assert order.status == "preparing"
+    assert order.eta == datetime(2030, 1, 1, 12, 30, tzinfo=UTC)
+    assert order.venue_name is None
+
+
+async def test_snapshot_size_is_bounded_with_active_orders_first(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Drop the oldest history beyond the bound, but never an active order."""
+    store = WoltSnapshotStore(hass, "sanitized-entry")
+
+    store.async_save(history(MAX_STORED_ORDERS * 2).orders)
+    await store.async_flush()
+
+    stored = hass_storage[KEY]["data"]["orders"]
+    assert len(stored) == MAX_STORED_ORDERS
+    assert stored[0]["id"] == f"sanitized-purchase-{MAX_STORED_ORDERS * 2 - 1:03}"
+    assert stored[0]["active"] is True
+
+
+@pytest.mark.parametrize(
+    ("minor_version", "data"),
+    [
+        (STORAGE_MINOR_VERSION - 1, {"orders": []}),
+        (STORAGE_MINOR_VERSION, {"orders": [{"id": "sanitized-purchase-001"}]}),
+        (STORAGE_MINOR_VERSION, {}),
+    ],
+)
+async def test_unreadable_snapshot_falls_back_to_a_live_refresh(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    minor_version: int,
+    data: dict[str, Any],
+) -> None:
+    """Ignore snapshots from other layouts instead of failing setup."""
+    hass_storage[KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": minor_version,
+        "key": KEY,
+        "data": data,
+    }
+
+    assert await WoltSnapshotStore(hass, "sanitized-entry").async_load() is None
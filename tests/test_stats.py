@@ -0,0 +1,48 @@
+"""Tests for the fixed-memory Wolt request statistics."""
+
+from custom_components.wait_for_wolt.stats import (
+    LATENCY_BUCKETS,
+    EndpointStats,
+    LatencyHistogram,
+)
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds() -> None:
+    """Report each percentile as the bound of the bucket that reaches it."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) is None
+
+    for seconds in [0.03] * 90 + [0.4] * 9 + [30.0]:
+        histogram.record(seconds)
+
+    assert histogram.percentile(0.5) == 0.05
+    assert histogram.percentile(0.95) == 0.5
+    assert histogram.percentile(0.99) == 0.5
+    assert histogram.percentile(1.0) == LATENCY_BUCKETS[-1]
+    assert histogram.counts[-1] == 1
+
+
+def test_histogram_memory_is_constant_and_mergeable() -> None:
+    """Keep one counter per bucket however many requests are recorded."""
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for index in range(10_000):
+        first.record(index / 1000)
+    second.record(0.01)
+
+    first.merge(second)
+
+    assert len(first.counts) == len(LATENCY_BUCKETS) + 1
+    assert sum(first.counts) == 10_001
+
+
+def test_endpoint_stats_count_status_classes_and_rate_limits() -> None:
+    """Group responses by status class and count 429s separately."""
+    stats = EndpointStats()
+    for status in (200, 304, 401, 429, 503):
+        stats.record_status(status)
+
+    summary = stats.as_dict()
+
+    assert summary["status_classes"] == {"2xx": 1, "3xx": 1, "4xx": 2, "5xx": 1}
+    assert summary["rate_limited"] == 1
+    assert summary["latency"]["p50_ms"] is None